@@ -638,6 +638,18 @@ int display_text_width(const char *text, int textlen, int font) {
   return width;
 }
 
+// fill advances of printable ASCII glyphs (' ' to '~') of the font
+void display_text_advances(int font, uint8_t *advances) {
+  for (int c = ' '; c <= '~'; c++) {
+#if TREZOR_MODEL == T
+    const uint8_t *g = get_glyph(font, (uint8_t)c);
+    advances[c - ' '] = g ? g[2] : 0;  // advance
+#else
+    advances[c - ' '] = 0;
+#endif
+  }
+}
+
 #define QR_MAX_VERSION 9
 
 void display_qrcode(int x, int y, const char *data, int datalen,
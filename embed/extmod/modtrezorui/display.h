@@ -100,6 +100,8 @@ void display_text_center(int x, int y, const char *text, int textlen, int font,
 void display_text_right(int x, int y, const char *text, int textlen, int font,
                         uint16_t fgcolor, uint16_t bgcolor);
 int display_text_width(const char *text, int textlen, int font);
+#define DISPLAY_TEXT_ADVANCES ('~' - ' ' + 1)
+void display_text_advances(int font, uint8_t *advances);
 
 void display_qrcode(int x, int y, const char *data, int datalen, uint8_t scale);
 
@@ -363,6 +363,21 @@ STATIC mp_obj_t mod_trezorui_Display_text_width(mp_obj_t self, mp_obj_t text,
 STATIC MP_DEFINE_CONST_FUN_OBJ_3(mod_trezorui_Display_text_width_obj,
                                  mod_trezorui_Display_text_width);
 
+/// def text_advances(self, font: int) -> bytes:
+///     '''
+///     Returns advance widths in pixels of printable ASCII characters (' ' to
+///     '~'), indexed by character code minus 32. Font font is used for
+///     rendering.
+///     '''
+STATIC mp_obj_t mod_trezorui_Display_text_advances(mp_obj_t self,
+                                                   mp_obj_t font) {
+  uint8_t advances[DISPLAY_TEXT_ADVANCES];
+  display_text_advances(mp_obj_get_int(font), advances);
+  return mp_obj_new_bytes(advances, sizeof(advances));
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(mod_trezorui_Display_text_advances_obj,
+                                 mod_trezorui_Display_text_advances);
+
 /// def qrcode(self, x: int, y: int, data: bytes, scale: int) -> None:
 ///     '''
 ///     Renders data encoded as a QR code centered at position (x,y).
@@ -501,6 +516,8 @@ STATIC const mp_rom_map_elem_t mod_trezorui_Display_locals_dict_table[] = {
      MP_ROM_PTR(&mod_trezorui_Display_text_right_obj)},
     {MP_ROM_QSTR(MP_QSTR_text_width),
      MP_ROM_PTR(&mod_trezorui_Display_text_width_obj)},
+    {MP_ROM_QSTR(MP_QSTR_text_advances),
+     MP_ROM_PTR(&mod_trezorui_Display_text_advances_obj)},
     {MP_ROM_QSTR(MP_QSTR_qrcode), MP_ROM_PTR(&mod_trezorui_Display_qrcode_obj)},
     {MP_ROM_QSTR(MP_QSTR_orientation),
      MP_ROM_PTR(&mod_trezorui_Display_orientation_obj)},
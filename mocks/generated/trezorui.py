@@ -93,6 +93,12 @@ class Display:
         Returns a width of text in pixels. Font font is used for rendering.
         '''
 
+    def text_advances(self, font: int) -> bytes:
+        '''
+        Returns advance widths in pixels of printable ASCII characters (' ' to '~'), indexed by character code minus 32.
+        Font font is used for rendering.
+        '''
+
     def qrcode(self, x: int, y: int, data: bytes, scale: int) -> None:
         '''
         Renders data encoded as a QR code centered at position (x,y).
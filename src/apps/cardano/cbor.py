@@ -176,6 +176,14 @@ def encode(value):
     return b"".join(_cbor_encode(value))
 
 
+def encode_streamed(value):
+    """
+    Returns the encoding of value as an iterator of chunks, so that it can be
+    hashed without being joined in memory.
+    """
+    return _cbor_encode(value)
+
+
 def decode(cbor: bytes):
     res, check = _cbor_decode(cbor)
     if not (check == b""):
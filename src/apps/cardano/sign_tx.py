@@ -73,13 +73,13 @@ async def sign_tx(ctx, msg):
     progress.init(msg.transactions_count, "Loading data")
 
     try:
-        # request transactions
-        transactions = []
+        # request transactions, only the amounts of spent outputs are kept
+        input_coins = [None] * len(msg.inputs)
         tx_req = CardanoTxRequest()
         for index in range(msg.transactions_count):
             progress.advance()
             tx_ack = await request_transaction(ctx, tx_req, index)
-            transactions.append(tx_ack.transaction)
+            process_transaction(msg.inputs, input_coins, tx_ack.transaction)
 
         # clear progress bar
         display_homescreen()
@@ -89,7 +89,7 @@ async def sign_tx(ctx, msg):
 
         # sign the transaction bundle and prepare the result
         transaction = Transaction(
-            msg.inputs, msg.outputs, transactions, keychain, msg.protocol_magic
+            msg.inputs, msg.outputs, input_coins, keychain, msg.protocol_magic
         )
         tx_body, tx_hash = transaction.serialise_tx()
         tx = CardanoSignedTx(tx_body=tx_body, tx_hash=tx_hash)
@@ -114,18 +114,30 @@ async def sign_tx(ctx, msg):
     return tx
 
 
+def process_transaction(inputs: list, input_coins: list, raw_transaction: bytes):
+    """
+    Decodes a previous transaction and stores the amounts of its outputs spent
+    by `inputs` into `input_coins`.
+    """
+    tx_hash = hashlib.blake2b(data=bytes(raw_transaction), outlen=32).digest()
+    outputs = cbor.decode(raw_transaction)[1]
+    for index, input in enumerate(inputs):
+        if bytes(input.prev_hash) == tx_hash:
+            input_coins[index] = outputs[input.prev_index][1]
+
+
 class Transaction:
     def __init__(
         self,
         inputs: list,
         outputs: list,
-        transactions: list,
+        input_coins: list,
         keychain,
         protocol_magic: int,
     ):
         self.inputs = inputs
         self.outputs = outputs
-        self.transactions = transactions
+        self.input_coins = input_coins
         self.keychain = keychain
         # attributes have to be always empty in current Cardano
         self.attributes = {}
@@ -134,17 +146,13 @@ class Transaction:
         self.protocol_magic = protocol_magic
 
     def _process_inputs(self):
-        input_coins = []
         input_hashes = []
         output_indexes = []
         types = []
-        tx_data = {}
 
-        for raw_transaction in self.transactions:
-            tx_hash = hashlib.blake2b(data=bytes(raw_transaction), outlen=32).digest()
-            tx_data[tx_hash] = cbor.decode(raw_transaction)
-
-        for input in self.inputs:
+        for index, input in enumerate(self.inputs):
+            if self.input_coins[index] is None:
+                raise wire.ProcessError("No tx data sent for input " + str(index))
             input_hashes.append(input.prev_hash)
             output_indexes.append(input.prev_index)
             types.append(input.type or 0)
@@ -154,17 +162,6 @@ class Transaction:
             _, node = derive_address_and_node(self.keychain, input.address_n)
             nodes.append(node)
 
-        for index, output_index in enumerate(output_indexes):
-            tx_hash = bytes(input_hashes[index])
-            if tx_hash in tx_data:
-                tx = tx_data[tx_hash]
-                outputs = tx[1]
-                amount = outputs[output_index][1]
-                input_coins.append(amount)
-            else:
-                raise wire.ProcessError("No tx data sent for input " + str(index))
-
-        self.input_coins = input_coins
         self.nodes = nodes
         self.types = types
         self.input_hashes = input_hashes
@@ -259,7 +256,10 @@ class Transaction:
         outputs_cbor = cbor.IndefiniteLengthArray(outputs_cbor)
 
         tx_aux_cbor = [inputs_cbor, outputs_cbor, self.attributes]
-        tx_hash = hashlib.blake2b(data=cbor.encode(tx_aux_cbor), outlen=32).digest()
+        h = hashlib.blake2b(outlen=32)
+        for chunk in cbor.encode_streamed(tx_aux_cbor):
+            h.update(chunk)
+        tx_hash = h.digest()
 
         witnesses = self._build_witnesses(tx_hash)
         tx_body = cbor.encode([tx_aux_cbor, witnesses])
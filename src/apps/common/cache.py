@@ -1,9 +1,15 @@
+from micropython import const
+
 from trezor.crypto import hashlib, hmac, random
 
 from apps.common import storage
 
+# maximum number of cached public nodes, the cache is emptied when full
+_MAX_PUBLIC_NODES = const(8)
+
 _cached_seed = None
 _cached_passphrase = None
+_cached_public_nodes = {}  # (curve_name, path) -> HDNode without private key
 
 
 def get_state(prev_state: bytes = None, passphrase: str = None) -> bytes:
@@ -40,13 +46,27 @@ def has_passphrase():
     return _cached_passphrase is not None
 
 
+def get_public_node(curve_name: str, path: list):
+    return _cached_public_nodes.get((curve_name, tuple(path)))
+
+
+def set_public_node(curve_name: str, path: list, node):
+    if len(_cached_public_nodes) >= _MAX_PUBLIC_NODES:
+        _cached_public_nodes.clear()
+    _cached_public_nodes[(curve_name, tuple(path))] = node
+
+
 def set_seed(seed):
     global _cached_seed
+    if seed is not _cached_seed:
+        _cached_public_nodes.clear()  # nodes belong to the previous seed
     _cached_seed = seed
 
 
 def set_passphrase(passphrase):
     global _cached_passphrase
+    if passphrase != _cached_passphrase:
+        _cached_public_nodes.clear()
     _cached_passphrase = passphrase
 
 
@@ -63,1145 +63,1377 @@ class CoinInfo:
 
 
 # fmt: off
-COINS = [
-    CoinInfo(
-        coin_name="Bitcoin",
-        coin_shortcut="BTC",
-        address_type=0,
-        address_type_p2sh=5,
-        maxfee_kb=2000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="bc",
-        cashaddr_prefix=None,
-        slip44=0,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Testnet",
-        coin_shortcut="TEST",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=10000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tb",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Actinium",
-        coin_shortcut="ACM",
-        address_type=53,
-        address_type_p2sh=55,
-        maxfee_kb=40000000,
-        signed_message_header="Actinium Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="acm",
-        cashaddr_prefix=None,
-        slip44=228,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Axe",
-        coin_shortcut="AXE",
-        address_type=55,
-        address_type_p2sh=16,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=4242,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="BitCash",
-        coin_shortcut="BITC",
-        address_type=230,
-        address_type_p2sh=235,
-        maxfee_kb=30000000,
-        signed_message_header="Bitcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=230,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bitcloud",
-        coin_shortcut="BTDX",
-        address_type=25,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="Diamond Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=218,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bcash",
-        coin_shortcut="BCH",
-        address_type=0,
-        address_type_p2sh=5,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix="bitcoincash",
-        slip44=145,
-        segwit=False,
-        fork_id=0,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bcash Testnet",
-        coin_shortcut="TBCH",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=10000000,
-        signed_message_header="Bitcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix="bchtest",
-        slip44=1,
-        segwit=False,
-        fork_id=0,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bgold",
-        coin_shortcut="BTG",
-        address_type=38,
-        address_type_p2sh=23,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Gold Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="btg",
-        cashaddr_prefix=None,
-        slip44=156,
-        segwit=True,
-        fork_id=79,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bgold Testnet",
-        coin_shortcut="TBTG",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=500000,
-        signed_message_header="Bitcoin Gold Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="tbtg",
-        cashaddr_prefix=None,
-        slip44=156,
-        segwit=True,
-        fork_id=79,
-        force_bip143=True,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bprivate",
-        coin_shortcut="BTCP",
-        address_type=4901,
-        address_type_p2sh=5039,
-        maxfee_kb=1000000,
-        signed_message_header="BitcoinPrivate Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=183,
-        segwit=False,
-        fork_id=42,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bitcore",
-        coin_shortcut="BTX",
-        address_type=3,
-        address_type_p2sh=125,
-        maxfee_kb=2000000,
-        signed_message_header="BitCore Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="btx",
-        cashaddr_prefix=None,
-        slip44=160,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Bitsend",
-        coin_shortcut="BSD",
-        address_type=102,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="Bitsend Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=91,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Capricoin",
-        coin_shortcut="CPC",
-        address_type=28,
-        address_type_p2sh=35,
-        maxfee_kb=2000000,
-        signed_message_header="Capricoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=289,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Dash",
-        coin_shortcut="DASH",
-        address_type=76,
-        address_type_p2sh=16,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=5,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Dash Testnet",
-        coin_shortcut="tDASH",
-        address_type=140,
-        address_type_p2sh=19,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Decred",
-        coin_shortcut="DCR",
-        address_type=1855,
-        address_type_p2sh=1818,
-        maxfee_kb=1000000,
-        signed_message_header="Decred Signed Message:\n",
-        xpub_magic=0x02fda926,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=42,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=True,
-        curve_name='secp256k1-decred',
-    ),
-    CoinInfo(
-        coin_name="Decred Testnet",
-        coin_shortcut="TDCR",
-        address_type=3873,
-        address_type_p2sh=3836,
-        maxfee_kb=10000000,
-        signed_message_header="Decred Signed Message:\n",
-        xpub_magic=0x043587d1,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=True,
-        curve_name='secp256k1-decred',
-    ),
-    CoinInfo(
-        coin_name="Denarius",
-        coin_shortcut="DNR",
-        address_type=30,
-        address_type_p2sh=90,
-        maxfee_kb=100000,
-        signed_message_header="Denarius Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=116,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="DigiByte",
-        coin_shortcut="DGB",
-        address_type=30,
-        address_type_p2sh=63,
-        maxfee_kb=500000,
-        signed_message_header="DigiByte Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="dgb",
-        cashaddr_prefix=None,
-        slip44=20,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Dogecoin",
-        coin_shortcut="DOGE",
-        address_type=30,
-        address_type_p2sh=22,
-        maxfee_kb=1000000000,
-        signed_message_header="Dogecoin Signed Message:\n",
-        xpub_magic=0x02facafd,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=3,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Feathercoin",
-        coin_shortcut="FTC",
-        address_type=14,
-        address_type_p2sh=5,
-        maxfee_kb=40000000,
-        signed_message_header="Feathercoin Signed Message:\n",
-        xpub_magic=0x0488bc26,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="fc",
-        cashaddr_prefix=None,
-        slip44=8,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Flashcoin",
-        coin_shortcut="FLASH",
-        address_type=68,
-        address_type_p2sh=130,
-        maxfee_kb=4000000,
-        signed_message_header="Flashcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=120,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Florincoin",
-        coin_shortcut="FLO",
-        address_type=35,
-        address_type_p2sh=94,
-        maxfee_kb=40000000,
-        signed_message_header="Florincoin Signed Message:\n",
-        xpub_magic=0x00174921,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="flo",
-        cashaddr_prefix=None,
-        slip44=216,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Fujicoin",
-        coin_shortcut="FJC",
-        address_type=36,
-        address_type_p2sh=16,
-        maxfee_kb=10000000,
-        signed_message_header="FujiCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="fc",
-        cashaddr_prefix=None,
-        slip44=75,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Gincoin",
-        coin_shortcut="GIN",
-        address_type=38,
-        address_type_p2sh=10,
-        maxfee_kb=100000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x02fe52cc,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=2000,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="GameCredits",
-        coin_shortcut="GAME",
-        address_type=38,
-        address_type_p2sh=62,
-        maxfee_kb=5000000,
-        signed_message_header="GameCredits Signed Message:\n",
-        xpub_magic=0x019d9cfe,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="game",
-        cashaddr_prefix=None,
-        slip44=101,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Groestlcoin",
-        coin_shortcut="GRS",
-        address_type=36,
-        address_type_p2sh=5,
-        maxfee_kb=100000,
-        signed_message_header="GroestlCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="grs",
-        cashaddr_prefix=None,
-        slip44=17,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-groestl',
-    ),
-    CoinInfo(
-        coin_name="Groestlcoin Testnet",
-        coin_shortcut="tGRS",
-        address_type=111,
-        address_type_p2sh=196,
-        maxfee_kb=100000,
-        signed_message_header="GroestlCoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tgrs",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-groestl',
-    ),
-    CoinInfo(
-        coin_name="Komodo",
-        coin_shortcut="KMD",
-        address_type=60,
-        address_type_p2sh=85,
-        maxfee_kb=1000000,
-        signed_message_header="Komodo Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=141,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Koto",
-        coin_shortcut="KOTO",
-        address_type=6198,
-        address_type_p2sh=6203,
-        maxfee_kb=1000000,
-        signed_message_header="Koto Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=510,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Litecoin",
-        coin_shortcut="LTC",
-        address_type=48,
-        address_type_p2sh=50,
-        maxfee_kb=40000000,
-        signed_message_header="Litecoin Signed Message:\n",
-        xpub_magic=0x019da462,
-        xpub_magic_segwit_p2sh=0x01b26ef6,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="ltc",
-        cashaddr_prefix=None,
-        slip44=2,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Litecoin Testnet",
-        coin_shortcut="TLTC",
-        address_type=111,
-        address_type_p2sh=58,
-        maxfee_kb=40000000,
-        signed_message_header="Litecoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="tltc",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Megacoin",
-        coin_shortcut="MEC",
-        address_type=50,
-        address_type_p2sh=5,
-        maxfee_kb=1000000,
-        signed_message_header="MegaCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=217,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Monacoin",
-        coin_shortcut="MONA",
-        address_type=50,
-        address_type_p2sh=55,
-        maxfee_kb=5000000,
-        signed_message_header="Monacoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="mona",
-        cashaddr_prefix=None,
-        slip44=22,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="MonetaryUnit",
-        coin_shortcut="MUE",
-        address_type=16,
-        address_type_p2sh=76,
-        maxfee_kb=100000,
-        signed_message_header="MonetaryUnit Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=31,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Myriad",
-        coin_shortcut="XMY",
-        address_type=50,
-        address_type_p2sh=9,
-        maxfee_kb=2000000,
-        signed_message_header="Myriadcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=90,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="NIX",
-        coin_shortcut="NIX",
-        address_type=38,
-        address_type_p2sh=53,
-        maxfee_kb=40000000,
-        signed_message_header="NIX Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="nix",
-        cashaddr_prefix=None,
-        slip44=400,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Namecoin",
-        coin_shortcut="NMC",
-        address_type=52,
-        address_type_p2sh=5,
-        maxfee_kb=10000000,
-        signed_message_header="Namecoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=7,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="PIVX",
-        coin_shortcut="PIVX",
-        address_type=30,
-        address_type_p2sh=13,
-        maxfee_kb=100000,
-        signed_message_header="DarkNet Signed Message:\n",
-        xpub_magic=0x022d2533,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=119,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="PIVX Testnet",
-        coin_shortcut="tPIVX",
-        address_type=139,
-        address_type_p2sh=19,
-        maxfee_kb=100000,
-        signed_message_header="DarkNet Signed Message:\n",
-        xpub_magic=0x3a8061a0,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Pesetacoin",
-        coin_shortcut="PTC",
-        address_type=47,
-        address_type_p2sh=22,
-        maxfee_kb=1000000000,
-        signed_message_header="Pesetacoin Signed Message:\n",
-        xpub_magic=0x0488c42e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="null",
-        cashaddr_prefix=None,
-        slip44=109,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Primecoin",
-        coin_shortcut="XPM",
-        address_type=23,
-        address_type_p2sh=83,
-        maxfee_kb=1000000,
-        signed_message_header="Primecoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=24,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Qtum",
-        coin_shortcut="QTUM",
-        address_type=58,
-        address_type_p2sh=50,
-        maxfee_kb=40000000,
-        signed_message_header="Qtum Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="qc",
-        cashaddr_prefix=None,
-        slip44=2301,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Qtum Testnet",
-        coin_shortcut="tQTUM",
-        address_type=120,
-        address_type_p2sh=110,
-        maxfee_kb=40000000,
-        signed_message_header="Qtum Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=0x044a5262,
-        xpub_magic_segwit_native=0x045f1cf6,
-        bech32_prefix="tq",
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Ravencoin",
-        coin_shortcut="RVN",
-        address_type=60,
-        address_type_p2sh=122,
-        maxfee_kb=2000000,
-        signed_message_header="Ravencoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=175,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="SmartCash",
-        coin_shortcut="SMART",
-        address_type=63,
-        address_type_p2sh=18,
-        maxfee_kb=1000000,
-        signed_message_header="SmartCash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=224,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-smart',
-    ),
-    CoinInfo(
-        coin_name="SmartCash Testnet",
-        coin_shortcut="tSMART",
-        address_type=65,
-        address_type_p2sh=21,
-        maxfee_kb=1000000,
-        signed_message_header="SmartCash Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=224,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1-smart',
-    ),
-    CoinInfo(
-        coin_name="Stakenet",
-        coin_shortcut="XSN",
-        address_type=76,
-        address_type_p2sh=16,
-        maxfee_kb=2000000,
-        signed_message_header="DarkCoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=0x04b24746,
-        bech32_prefix="xc",
-        cashaddr_prefix=None,
-        slip44=199,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Vertcoin",
-        coin_shortcut="VTC",
-        address_type=71,
-        address_type_p2sh=5,
-        maxfee_kb=40000000,
-        signed_message_header="Vertcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="vtc",
-        cashaddr_prefix=None,
-        slip44=28,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Viacoin",
-        coin_shortcut="VIA",
-        address_type=71,
-        address_type_p2sh=33,
-        maxfee_kb=40000000,
-        signed_message_header="Viacoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=0x049d7cb2,
-        xpub_magic_segwit_native=None,
-        bech32_prefix="via",
-        cashaddr_prefix=None,
-        slip44=14,
-        segwit=True,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="ZClassic",
-        coin_shortcut="ZCL",
-        address_type=7352,
-        address_type_p2sh=7357,
-        maxfee_kb=1000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=147,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Zcash",
-        coin_shortcut="ZEC",
-        address_type=7352,
-        address_type_p2sh=7357,
-        maxfee_kb=1000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=133,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Zcash Testnet",
-        coin_shortcut="TAZ",
-        address_type=7461,
-        address_type_p2sh=7354,
-        maxfee_kb=10000000,
-        signed_message_header="Zcash Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Zcoin",
-        coin_shortcut="XZC",
-        address_type=82,
-        address_type_p2sh=7,
-        maxfee_kb=1000000,
-        signed_message_header="Zcoin Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=136,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Zcoin Testnet",
-        coin_shortcut="tXZC",
-        address_type=65,
-        address_type_p2sh=178,
-        maxfee_kb=1000000,
-        signed_message_header="Zcoin Signed Message:\n",
-        xpub_magic=0x043587cf,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=1,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=False,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-    CoinInfo(
-        coin_name="Zencash",
-        coin_shortcut="ZEN",
-        address_type=8329,
-        address_type_p2sh=8342,
-        maxfee_kb=2000000,
-        signed_message_header="Zencash Signed Message:\n",
-        xpub_magic=0x0488b21e,
-        xpub_magic_segwit_p2sh=None,
-        xpub_magic_segwit_native=None,
-        bech32_prefix=None,
-        cashaddr_prefix=None,
-        slip44=121,
-        segwit=False,
-        fork_id=None,
-        force_bip143=False,
-        bip115=True,
-        decred=False,
-        curve_name='secp256k1',
-    ),
-]
+def by_index(index: int) -> CoinInfo:
+    """
+    Build the CoinInfo for coin number `index` of the tables below.  Coins are
+    only instantiated when looked up, unused coins never occupy RAM.
+    """
+    if index == 0:
+        return CoinInfo(
+            coin_name="Bitcoin",
+            coin_shortcut="BTC",
+            address_type=0,
+            address_type_p2sh=5,
+            maxfee_kb=2000000,
+            signed_message_header="Bitcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="bc",
+            cashaddr_prefix=None,
+            slip44=0,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 1:
+        return CoinInfo(
+            coin_name="Testnet",
+            coin_shortcut="TEST",
+            address_type=111,
+            address_type_p2sh=196,
+            maxfee_kb=10000000,
+            signed_message_header="Bitcoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=0x044a5262,
+            xpub_magic_segwit_native=0x045f1cf6,
+            bech32_prefix="tb",
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 2:
+        return CoinInfo(
+            coin_name="Actinium",
+            coin_shortcut="ACM",
+            address_type=53,
+            address_type_p2sh=55,
+            maxfee_kb=40000000,
+            signed_message_header="Actinium Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="acm",
+            cashaddr_prefix=None,
+            slip44=228,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 3:
+        return CoinInfo(
+            coin_name="Axe",
+            coin_shortcut="AXE",
+            address_type=55,
+            address_type_p2sh=16,
+            maxfee_kb=100000,
+            signed_message_header="DarkCoin Signed Message:\n",
+            xpub_magic=0x02fe52cc,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=4242,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 4:
+        return CoinInfo(
+            coin_name="BitCash",
+            coin_shortcut="BITC",
+            address_type=230,
+            address_type_p2sh=235,
+            maxfee_kb=30000000,
+            signed_message_header="Bitcash Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=230,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 5:
+        return CoinInfo(
+            coin_name="Bitcloud",
+            coin_shortcut="BTDX",
+            address_type=25,
+            address_type_p2sh=5,
+            maxfee_kb=1000000,
+            signed_message_header="Diamond Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=218,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 6:
+        return CoinInfo(
+            coin_name="Bcash",
+            coin_shortcut="BCH",
+            address_type=0,
+            address_type_p2sh=5,
+            maxfee_kb=500000,
+            signed_message_header="Bitcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix="bitcoincash",
+            slip44=145,
+            segwit=False,
+            fork_id=0,
+            force_bip143=True,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 7:
+        return CoinInfo(
+            coin_name="Bcash Testnet",
+            coin_shortcut="TBCH",
+            address_type=111,
+            address_type_p2sh=196,
+            maxfee_kb=10000000,
+            signed_message_header="Bitcoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix="bchtest",
+            slip44=1,
+            segwit=False,
+            fork_id=0,
+            force_bip143=True,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 8:
+        return CoinInfo(
+            coin_name="Bgold",
+            coin_shortcut="BTG",
+            address_type=38,
+            address_type_p2sh=23,
+            maxfee_kb=500000,
+            signed_message_header="Bitcoin Gold Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="btg",
+            cashaddr_prefix=None,
+            slip44=156,
+            segwit=True,
+            fork_id=79,
+            force_bip143=True,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 9:
+        return CoinInfo(
+            coin_name="Bgold Testnet",
+            coin_shortcut="TBTG",
+            address_type=111,
+            address_type_p2sh=196,
+            maxfee_kb=500000,
+            signed_message_header="Bitcoin Gold Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=0x044a5262,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="tbtg",
+            cashaddr_prefix=None,
+            slip44=156,
+            segwit=True,
+            fork_id=79,
+            force_bip143=True,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 10:
+        return CoinInfo(
+            coin_name="Bprivate",
+            coin_shortcut="BTCP",
+            address_type=4901,
+            address_type_p2sh=5039,
+            maxfee_kb=1000000,
+            signed_message_header="BitcoinPrivate Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=183,
+            segwit=False,
+            fork_id=42,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 11:
+        return CoinInfo(
+            coin_name="Bitcore",
+            coin_shortcut="BTX",
+            address_type=3,
+            address_type_p2sh=125,
+            maxfee_kb=2000000,
+            signed_message_header="BitCore Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="btx",
+            cashaddr_prefix=None,
+            slip44=160,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 12:
+        return CoinInfo(
+            coin_name="Bitsend",
+            coin_shortcut="BSD",
+            address_type=102,
+            address_type_p2sh=5,
+            maxfee_kb=1000000,
+            signed_message_header="Bitsend Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=91,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 13:
+        return CoinInfo(
+            coin_name="Capricoin",
+            coin_shortcut="CPC",
+            address_type=28,
+            address_type_p2sh=35,
+            maxfee_kb=2000000,
+            signed_message_header="Capricoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=289,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 14:
+        return CoinInfo(
+            coin_name="Dash",
+            coin_shortcut="DASH",
+            address_type=76,
+            address_type_p2sh=16,
+            maxfee_kb=100000,
+            signed_message_header="DarkCoin Signed Message:\n",
+            xpub_magic=0x02fe52cc,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=5,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 15:
+        return CoinInfo(
+            coin_name="Dash Testnet",
+            coin_shortcut="tDASH",
+            address_type=140,
+            address_type_p2sh=19,
+            maxfee_kb=100000,
+            signed_message_header="DarkCoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 16:
+        return CoinInfo(
+            coin_name="Decred",
+            coin_shortcut="DCR",
+            address_type=1855,
+            address_type_p2sh=1818,
+            maxfee_kb=1000000,
+            signed_message_header="Decred Signed Message:\n",
+            xpub_magic=0x02fda926,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=42,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=True,
+            curve_name='secp256k1-decred',
+        )
+    if index == 17:
+        return CoinInfo(
+            coin_name="Decred Testnet",
+            coin_shortcut="TDCR",
+            address_type=3873,
+            address_type_p2sh=3836,
+            maxfee_kb=10000000,
+            signed_message_header="Decred Signed Message:\n",
+            xpub_magic=0x043587d1,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=True,
+            curve_name='secp256k1-decred',
+        )
+    if index == 18:
+        return CoinInfo(
+            coin_name="Denarius",
+            coin_shortcut="DNR",
+            address_type=30,
+            address_type_p2sh=90,
+            maxfee_kb=100000,
+            signed_message_header="Denarius Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=116,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 19:
+        return CoinInfo(
+            coin_name="DigiByte",
+            coin_shortcut="DGB",
+            address_type=30,
+            address_type_p2sh=63,
+            maxfee_kb=500000,
+            signed_message_header="DigiByte Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="dgb",
+            cashaddr_prefix=None,
+            slip44=20,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 20:
+        return CoinInfo(
+            coin_name="Dogecoin",
+            coin_shortcut="DOGE",
+            address_type=30,
+            address_type_p2sh=22,
+            maxfee_kb=1000000000,
+            signed_message_header="Dogecoin Signed Message:\n",
+            xpub_magic=0x02facafd,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=3,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 21:
+        return CoinInfo(
+            coin_name="Feathercoin",
+            coin_shortcut="FTC",
+            address_type=14,
+            address_type_p2sh=5,
+            maxfee_kb=40000000,
+            signed_message_header="Feathercoin Signed Message:\n",
+            xpub_magic=0x0488bc26,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="fc",
+            cashaddr_prefix=None,
+            slip44=8,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 22:
+        return CoinInfo(
+            coin_name="Flashcoin",
+            coin_shortcut="FLASH",
+            address_type=68,
+            address_type_p2sh=130,
+            maxfee_kb=4000000,
+            signed_message_header="Flashcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=120,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 23:
+        return CoinInfo(
+            coin_name="Florincoin",
+            coin_shortcut="FLO",
+            address_type=35,
+            address_type_p2sh=94,
+            maxfee_kb=40000000,
+            signed_message_header="Florincoin Signed Message:\n",
+            xpub_magic=0x00174921,
+            xpub_magic_segwit_p2sh=0x01b26ef6,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="flo",
+            cashaddr_prefix=None,
+            slip44=216,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 24:
+        return CoinInfo(
+            coin_name="Fujicoin",
+            coin_shortcut="FJC",
+            address_type=36,
+            address_type_p2sh=16,
+            maxfee_kb=10000000,
+            signed_message_header="FujiCoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="fc",
+            cashaddr_prefix=None,
+            slip44=75,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 25:
+        return CoinInfo(
+            coin_name="Gincoin",
+            coin_shortcut="GIN",
+            address_type=38,
+            address_type_p2sh=10,
+            maxfee_kb=100000,
+            signed_message_header="DarkCoin Signed Message:\n",
+            xpub_magic=0x02fe52cc,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=2000,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 26:
+        return CoinInfo(
+            coin_name="GameCredits",
+            coin_shortcut="GAME",
+            address_type=38,
+            address_type_p2sh=62,
+            maxfee_kb=5000000,
+            signed_message_header="GameCredits Signed Message:\n",
+            xpub_magic=0x019d9cfe,
+            xpub_magic_segwit_p2sh=0x01b26ef6,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="game",
+            cashaddr_prefix=None,
+            slip44=101,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 27:
+        return CoinInfo(
+            coin_name="Groestlcoin",
+            coin_shortcut="GRS",
+            address_type=36,
+            address_type_p2sh=5,
+            maxfee_kb=100000,
+            signed_message_header="GroestlCoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="grs",
+            cashaddr_prefix=None,
+            slip44=17,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1-groestl',
+        )
+    if index == 28:
+        return CoinInfo(
+            coin_name="Groestlcoin Testnet",
+            coin_shortcut="tGRS",
+            address_type=111,
+            address_type_p2sh=196,
+            maxfee_kb=100000,
+            signed_message_header="GroestlCoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=0x044a5262,
+            xpub_magic_segwit_native=0x045f1cf6,
+            bech32_prefix="tgrs",
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1-groestl',
+        )
+    if index == 29:
+        return CoinInfo(
+            coin_name="Komodo",
+            coin_shortcut="KMD",
+            address_type=60,
+            address_type_p2sh=85,
+            maxfee_kb=1000000,
+            signed_message_header="Komodo Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=141,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 30:
+        return CoinInfo(
+            coin_name="Koto",
+            coin_shortcut="KOTO",
+            address_type=6198,
+            address_type_p2sh=6203,
+            maxfee_kb=1000000,
+            signed_message_header="Koto Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=510,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 31:
+        return CoinInfo(
+            coin_name="Litecoin",
+            coin_shortcut="LTC",
+            address_type=48,
+            address_type_p2sh=50,
+            maxfee_kb=40000000,
+            signed_message_header="Litecoin Signed Message:\n",
+            xpub_magic=0x019da462,
+            xpub_magic_segwit_p2sh=0x01b26ef6,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="ltc",
+            cashaddr_prefix=None,
+            slip44=2,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 32:
+        return CoinInfo(
+            coin_name="Litecoin Testnet",
+            coin_shortcut="TLTC",
+            address_type=111,
+            address_type_p2sh=58,
+            maxfee_kb=40000000,
+            signed_message_header="Litecoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="tltc",
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 33:
+        return CoinInfo(
+            coin_name="Megacoin",
+            coin_shortcut="MEC",
+            address_type=50,
+            address_type_p2sh=5,
+            maxfee_kb=1000000,
+            signed_message_header="MegaCoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=217,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 34:
+        return CoinInfo(
+            coin_name="Monacoin",
+            coin_shortcut="MONA",
+            address_type=50,
+            address_type_p2sh=55,
+            maxfee_kb=5000000,
+            signed_message_header="Monacoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="mona",
+            cashaddr_prefix=None,
+            slip44=22,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 35:
+        return CoinInfo(
+            coin_name="MonetaryUnit",
+            coin_shortcut="MUE",
+            address_type=16,
+            address_type_p2sh=76,
+            maxfee_kb=100000,
+            signed_message_header="MonetaryUnit Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=31,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 36:
+        return CoinInfo(
+            coin_name="Myriad",
+            coin_shortcut="XMY",
+            address_type=50,
+            address_type_p2sh=9,
+            maxfee_kb=2000000,
+            signed_message_header="Myriadcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=90,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 37:
+        return CoinInfo(
+            coin_name="NIX",
+            coin_shortcut="NIX",
+            address_type=38,
+            address_type_p2sh=53,
+            maxfee_kb=40000000,
+            signed_message_header="NIX Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="nix",
+            cashaddr_prefix=None,
+            slip44=400,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 38:
+        return CoinInfo(
+            coin_name="Namecoin",
+            coin_shortcut="NMC",
+            address_type=52,
+            address_type_p2sh=5,
+            maxfee_kb=10000000,
+            signed_message_header="Namecoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=7,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 39:
+        return CoinInfo(
+            coin_name="PIVX",
+            coin_shortcut="PIVX",
+            address_type=30,
+            address_type_p2sh=13,
+            maxfee_kb=100000,
+            signed_message_header="DarkNet Signed Message:\n",
+            xpub_magic=0x022d2533,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=119,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 40:
+        return CoinInfo(
+            coin_name="PIVX Testnet",
+            coin_shortcut="tPIVX",
+            address_type=139,
+            address_type_p2sh=19,
+            maxfee_kb=100000,
+            signed_message_header="DarkNet Signed Message:\n",
+            xpub_magic=0x3a8061a0,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 41:
+        return CoinInfo(
+            coin_name="Pesetacoin",
+            coin_shortcut="PTC",
+            address_type=47,
+            address_type_p2sh=22,
+            maxfee_kb=1000000000,
+            signed_message_header="Pesetacoin Signed Message:\n",
+            xpub_magic=0x0488c42e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="null",
+            cashaddr_prefix=None,
+            slip44=109,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 42:
+        return CoinInfo(
+            coin_name="Primecoin",
+            coin_shortcut="XPM",
+            address_type=23,
+            address_type_p2sh=83,
+            maxfee_kb=1000000,
+            signed_message_header="Primecoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=24,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 43:
+        return CoinInfo(
+            coin_name="Qtum",
+            coin_shortcut="QTUM",
+            address_type=58,
+            address_type_p2sh=50,
+            maxfee_kb=40000000,
+            signed_message_header="Qtum Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="qc",
+            cashaddr_prefix=None,
+            slip44=2301,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 44:
+        return CoinInfo(
+            coin_name="Qtum Testnet",
+            coin_shortcut="tQTUM",
+            address_type=120,
+            address_type_p2sh=110,
+            maxfee_kb=40000000,
+            signed_message_header="Qtum Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=0x044a5262,
+            xpub_magic_segwit_native=0x045f1cf6,
+            bech32_prefix="tq",
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 45:
+        return CoinInfo(
+            coin_name="Ravencoin",
+            coin_shortcut="RVN",
+            address_type=60,
+            address_type_p2sh=122,
+            maxfee_kb=2000000,
+            signed_message_header="Ravencoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=175,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 46:
+        return CoinInfo(
+            coin_name="SmartCash",
+            coin_shortcut="SMART",
+            address_type=63,
+            address_type_p2sh=18,
+            maxfee_kb=1000000,
+            signed_message_header="SmartCash Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=224,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1-smart',
+        )
+    if index == 47:
+        return CoinInfo(
+            coin_name="SmartCash Testnet",
+            coin_shortcut="tSMART",
+            address_type=65,
+            address_type_p2sh=21,
+            maxfee_kb=1000000,
+            signed_message_header="SmartCash Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=224,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1-smart',
+        )
+    if index == 48:
+        return CoinInfo(
+            coin_name="Stakenet",
+            coin_shortcut="XSN",
+            address_type=76,
+            address_type_p2sh=16,
+            maxfee_kb=2000000,
+            signed_message_header="DarkCoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=0x04b24746,
+            bech32_prefix="xc",
+            cashaddr_prefix=None,
+            slip44=199,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 49:
+        return CoinInfo(
+            coin_name="Vertcoin",
+            coin_shortcut="VTC",
+            address_type=71,
+            address_type_p2sh=5,
+            maxfee_kb=40000000,
+            signed_message_header="Vertcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="vtc",
+            cashaddr_prefix=None,
+            slip44=28,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 50:
+        return CoinInfo(
+            coin_name="Viacoin",
+            coin_shortcut="VIA",
+            address_type=71,
+            address_type_p2sh=33,
+            maxfee_kb=40000000,
+            signed_message_header="Viacoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=0x049d7cb2,
+            xpub_magic_segwit_native=None,
+            bech32_prefix="via",
+            cashaddr_prefix=None,
+            slip44=14,
+            segwit=True,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 51:
+        return CoinInfo(
+            coin_name="ZClassic",
+            coin_shortcut="ZCL",
+            address_type=7352,
+            address_type_p2sh=7357,
+            maxfee_kb=1000000,
+            signed_message_header="Zcash Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=147,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 52:
+        return CoinInfo(
+            coin_name="Zcash",
+            coin_shortcut="ZEC",
+            address_type=7352,
+            address_type_p2sh=7357,
+            maxfee_kb=1000000,
+            signed_message_header="Zcash Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=133,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 53:
+        return CoinInfo(
+            coin_name="Zcash Testnet",
+            coin_shortcut="TAZ",
+            address_type=7461,
+            address_type_p2sh=7354,
+            maxfee_kb=10000000,
+            signed_message_header="Zcash Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 54:
+        return CoinInfo(
+            coin_name="Zcoin",
+            coin_shortcut="XZC",
+            address_type=82,
+            address_type_p2sh=7,
+            maxfee_kb=1000000,
+            signed_message_header="Zcoin Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=136,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 55:
+        return CoinInfo(
+            coin_name="Zcoin Testnet",
+            coin_shortcut="tXZC",
+            address_type=65,
+            address_type_p2sh=178,
+            maxfee_kb=1000000,
+            signed_message_header="Zcoin Signed Message:\n",
+            xpub_magic=0x043587cf,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=1,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=False,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    if index == 56:
+        return CoinInfo(
+            coin_name="Zencash",
+            coin_shortcut="ZEN",
+            address_type=8329,
+            address_type_p2sh=8342,
+            maxfee_kb=2000000,
+            signed_message_header="Zencash Signed Message:\n",
+            xpub_magic=0x0488b21e,
+            xpub_magic_segwit_p2sh=None,
+            xpub_magic_segwit_native=None,
+            bech32_prefix=None,
+            cashaddr_prefix=None,
+            slip44=121,
+            segwit=False,
+            fork_id=None,
+            force_bip143=False,
+            bip115=True,
+            decred=False,
+            curve_name='secp256k1',
+        )
+    raise ValueError("Unknown coin index %d" % index)
+
+
+NAME_INDEX = {
+    "Bitcoin": 0,
+    "Testnet": 1,
+    "Actinium": 2,
+    "Axe": 3,
+    "BitCash": 4,
+    "Bitcloud": 5,
+    "Bcash": 6,
+    "Bcash Testnet": 7,
+    "Bgold": 8,
+    "Bgold Testnet": 9,
+    "Bprivate": 10,
+    "Bitcore": 11,
+    "Bitsend": 12,
+    "Capricoin": 13,
+    "Dash": 14,
+    "Dash Testnet": 15,
+    "Decred": 16,
+    "Decred Testnet": 17,
+    "Denarius": 18,
+    "DigiByte": 19,
+    "Dogecoin": 20,
+    "Feathercoin": 21,
+    "Flashcoin": 22,
+    "Florincoin": 23,
+    "Fujicoin": 24,
+    "Gincoin": 25,
+    "GameCredits": 26,
+    "Groestlcoin": 27,
+    "Groestlcoin Testnet": 28,
+    "Komodo": 29,
+    "Koto": 30,
+    "Litecoin": 31,
+    "Litecoin Testnet": 32,
+    "Megacoin": 33,
+    "Monacoin": 34,
+    "MonetaryUnit": 35,
+    "Myriad": 36,
+    "NIX": 37,
+    "Namecoin": 38,
+    "PIVX": 39,
+    "PIVX Testnet": 40,
+    "Pesetacoin": 41,
+    "Primecoin": 42,
+    "Qtum": 43,
+    "Qtum Testnet": 44,
+    "Ravencoin": 45,
+    "SmartCash": 46,
+    "SmartCash Testnet": 47,
+    "Stakenet": 48,
+    "Vertcoin": 49,
+    "Viacoin": 50,
+    "ZClassic": 51,
+    "Zcash": 52,
+    "Zcash Testnet": 53,
+    "Zcoin": 54,
+    "Zcoin Testnet": 55,
+    "Zencash": 56,
+}
+
+SHORTCUT_INDEX = {
+    "BTC": 0,
+    "TEST": 1,
+    "ACM": 2,
+    "AXE": 3,
+    "BITC": 4,
+    "BTDX": 5,
+    "BCH": 6,
+    "TBCH": 7,
+    "BTG": 8,
+    "TBTG": 9,
+    "BTCP": 10,
+    "BTX": 11,
+    "BSD": 12,
+    "CPC": 13,
+    "DASH": 14,
+    "tDASH": 15,
+    "DCR": 16,
+    "TDCR": 17,
+    "DNR": 18,
+    "DGB": 19,
+    "DOGE": 20,
+    "FTC": 21,
+    "FLASH": 22,
+    "FLO": 23,
+    "FJC": 24,
+    "GIN": 25,
+    "GAME": 26,
+    "GRS": 27,
+    "tGRS": 28,
+    "KMD": 29,
+    "KOTO": 30,
+    "LTC": 31,
+    "TLTC": 32,
+    "MEC": 33,
+    "MONA": 34,
+    "MUE": 35,
+    "XMY": 36,
+    "NIX": 37,
+    "NMC": 38,
+    "PIVX": 39,
+    "tPIVX": 40,
+    "PTC": 41,
+    "XPM": 42,
+    "QTUM": 43,
+    "tQTUM": 44,
+    "RVN": 45,
+    "SMART": 46,
+    "tSMART": 47,
+    "XSN": 48,
+    "VTC": 49,
+    "VIA": 50,
+    "ZCL": 51,
+    "ZEC": 52,
+    "TAZ": 53,
+    "XZC": 54,
+    "tXZC": 55,
+    "ZEN": 56,
+}
+
+# maps slip44 to the first coin using it
+SLIP44_INDEX = {
+    0: 0,
+    1: 1,
+    2: 31,
+    3: 20,
+    5: 14,
+    7: 38,
+    8: 21,
+    14: 50,
+    17: 27,
+    20: 19,
+    22: 34,
+    24: 42,
+    28: 49,
+    31: 35,
+    42: 16,
+    75: 24,
+    90: 36,
+    91: 12,
+    101: 26,
+    109: 41,
+    116: 18,
+    119: 39,
+    120: 22,
+    121: 56,
+    133: 52,
+    136: 54,
+    141: 29,
+    145: 6,
+    147: 51,
+    156: 8,
+    160: 11,
+    175: 45,
+    183: 10,
+    199: 48,
+    216: 23,
+    217: 33,
+    218: 5,
+    224: 46,
+    228: 2,
+    230: 4,
+    289: 13,
+    400: 37,
+    510: 30,
+    2000: 25,
+    2301: 43,
+    4242: 3,
+}
@@ -91,12 +91,43 @@ ATTRIBUTES = (
     ("curve_name", lambda r: repr(r.replace("_", "-"))),
 )
 %>\
-COINS = [
-% for coin in supported_on("trezor2", bitcoin):
-    CoinInfo(
-        % for attr, func in ATTRIBUTES:
-        ${attr}=${func(coin[attr])},
-        % endfor
-    ),
+<%
+coins = list(supported_on("trezor2", bitcoin))
+slip44_index = {}
+for i, coin in enumerate(coins):
+    slip44_index.setdefault(coin["slip44"], i)
+%>\
+def by_index(index: int) -> CoinInfo:
+    """
+    Build the CoinInfo for coin number `index` of the tables below.  Coins are
+    only instantiated when looked up, unused coins never occupy RAM.
+    """
+% for i, coin in enumerate(coins):
+    if index == ${i}:
+        return CoinInfo(
+            % for attr, func in ATTRIBUTES:
+            ${attr}=${func(coin[attr])},
+            % endfor
+        )
+% endfor
+    raise ValueError("Unknown coin index %d" % index)
+
+
+NAME_INDEX = {
+% for i, coin in enumerate(coins):
+    ${black_repr(coin["coin_name"])}: ${i},
+% endfor
+}
+
+SHORTCUT_INDEX = {
+% for i, coin in enumerate(coins):
+    ${black_repr(coin["coin_shortcut"])}: ${i},
+% endfor
+}
+
+# maps slip44 to the first coin using it
+SLIP44_INDEX = {
+% for slip44, i in sorted(slip44_index.items()):
+    ${slip44}: ${i},
 % endfor
-]
+}
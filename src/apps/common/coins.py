@@ -1,22 +1,31 @@
-from apps.common.coininfo import COINS
+from apps.common import coininfo
+
+_coins = {}  # coin index -> CoinInfo, instantiated on first lookup
+
+
+def _by_index(index):
+    coin = _coins.get(index)
+    if coin is None:
+        coin = _coins[index] = coininfo.by_index(index)
+    return coin
 
 
 def by_shortcut(shortcut):
-    for c in COINS:
-        if c.coin_shortcut == shortcut:
-            return c
-    raise ValueError('Unknown coin shortcut "%s"' % shortcut)
+    index = coininfo.SHORTCUT_INDEX.get(shortcut)
+    if index is None:
+        raise ValueError('Unknown coin shortcut "%s"' % shortcut)
+    return _by_index(index)
 
 
 def by_name(name):
-    for c in COINS:
-        if c.coin_name == name:
-            return c
-    raise ValueError('Unknown coin name "%s"' % name)
+    index = coininfo.NAME_INDEX.get(name)
+    if index is None:
+        raise ValueError('Unknown coin name "%s"' % name)
+    return _by_index(index)
 
 
 def by_slip44(slip44):
-    for c in COINS:
-        if c.slip44 == slip44:
-            return c
-    raise ValueError("Unknown coin slip44 index %d" % slip44)
+    index = coininfo.SLIP44_INDEX.get(slip44)
+    if index is None:
+        raise ValueError("Unknown coin slip44 index %d" % slip44)
+    return _by_index(index)
@@ -1,11 +1,16 @@
+from micropython import const
+
 from trezor import ui, wire
 from trezor.crypto import bip32
 
-from apps.common import cache, mnemonic, storage
+from apps.common import HARDENED, cache, mnemonic, storage
 from apps.common.request_passphrase import protect_by_passphrase
 
 allow = list
 
+# number of intermediate nodes kept by a keychain
+_NODE_CACHE_SIZE = const(4)
+
 
 class Keychain:
     """
@@ -17,25 +22,20 @@ class Keychain:
         self.seed = seed
         self.namespaces = namespaces
         self.roots = [None] * len(namespaces)
+        self.nodes = []  # ((root_index, parent path), node), most recent last
 
     def __del__(self):
         for root in self.roots:
             if root is not None:
                 root.__del__()
+        for _, node in self.nodes:
+            node.__del__()
         del self.roots
+        del self.nodes
         del self.seed
 
     def derive(self, node_path: list, curve_name: str = "secp256k1") -> bip32.HDNode:
-        # find the root node index
-        root_index = 0
-        for curve, *path in self.namespaces:
-            prefix = node_path[: len(path)]
-            suffix = node_path[len(path) :]
-            if curve == curve_name and path == prefix:
-                break
-            root_index += 1
-        else:
-            raise wire.DataError("Forbidden key path")
+        root_index, path, suffix = self._match_namespace(node_path, curve_name)
 
         # create the root node if not cached
         root = self.roots[root_index]
@@ -44,11 +44,89 @@ class Keychain:
             root.derive_path(path)
             self.roots[root_index] = root
 
-        # derive child node from the root
-        node = root.clone()
-        node.derive_path(suffix)
+        if len(suffix) < 2:
+            node = root.clone()
+            node.derive_path(suffix)
+            return node
+
+        # derive child node from the cached parent node
+        parent = self._get_parent(root_index, root, suffix[:-1])
+        node = parent.clone()
+        node.derive_path(suffix[-1:])
         return node
 
+    def derive_public(
+        self, node_path: list, curve_name: str = "secp256k1"
+    ) -> bip32.HDNode:
+        """
+        Derives a node for public key operations.  On secp256k1 curves the
+        node of the last hardened level is kept in `cache` without its private
+        key, so subsequent messages only derive the non-hardened levels.
+        """
+        if not curve_name.startswith("secp256k1") or self.seed is not cache.get_seed():
+            return self.derive(node_path, curve_name)
+
+        _, path, _ = self._match_namespace(node_path, curve_name)
+
+        # index after the last hardened level, within the allowed key-space
+        split = len(node_path)
+        while split > len(path) and not node_path[split - 1] & HARDENED:
+            split -= 1
+
+        prefix = node_path[:split]
+        node = cache.get_public_node(curve_name, prefix)
+        if node is None:
+            node = _public_node(self.derive(prefix, curve_name), curve_name)
+            cache.set_public_node(curve_name, prefix, node)
+
+        node = node.clone()
+        for i in node_path[split:]:
+            node.derive(i, True)
+        return node
+
+    def _match_namespace(self, node_path: list, curve_name: str) -> tuple:
+        # find the root node index
+        root_index = 0
+        for curve, *path in self.namespaces:
+            prefix = node_path[: len(path)]
+            suffix = node_path[len(path) :]
+            if curve == curve_name and path == prefix:
+                return root_index, path, suffix
+            root_index += 1
+        raise wire.DataError("Forbidden key path")
+
+    def _get_parent(
+        self, root_index: int, root: bip32.HDNode, path: list
+    ) -> bip32.HDNode:
+        key = (root_index, path)
+        for entry in self.nodes:
+            if entry[0] == key:
+                # move to the most recently used position
+                self.nodes.remove(entry)
+                self.nodes.append(entry)
+                return entry[1]
+
+        parent = root.clone()
+        parent.derive_path(path)
+        self.nodes.append((key, parent))
+        if len(self.nodes) > _NODE_CACHE_SIZE:
+            _, evicted = self.nodes.pop(0)
+            evicted.__del__()  # wipe the private key right away
+        return parent
+
+
+def _public_node(node: bip32.HDNode, curve_name: str) -> bip32.HDNode:
+    public = bip32.HDNode(
+        depth=node.depth(),
+        fingerprint=node.fingerprint(),
+        child_num=node.child_num(),
+        chain_code=node.chain_code(),
+        public_key=node.public_key(),
+        curve_name=curve_name,
+    )
+    node.__del__()
+    return public
+
 
 async def get_keychain(ctx: wire.Context, namespaces: list) -> Keychain:
     if not storage.is_initialized():
@@ -14,64 +14,73 @@ async def process_action(ctx, sha, action):
     if not check_action(action, name, account):
         raise ValueError("Invalid action")
 
-    w = bytearray()
+    writers.write_action_common(sha, action.common)
+
     if account == "eosio":
         if name == "buyram":
             await layout.confirm_action_buyram(ctx, action.buy_ram)
-            writers.write_action_buyram(w, action.buy_ram)
+            _write_action(sha, writers.write_action_buyram, action.buy_ram)
         elif name == "buyrambytes":
             await layout.confirm_action_buyrambytes(ctx, action.buy_ram_bytes)
-            writers.write_action_buyrambytes(w, action.buy_ram_bytes)
+            _write_action(sha, writers.write_action_buyrambytes, action.buy_ram_bytes)
         elif name == "sellram":
             await layout.confirm_action_sellram(ctx, action.sell_ram)
-            writers.write_action_sellram(w, action.sell_ram)
+            _write_action(sha, writers.write_action_sellram, action.sell_ram)
         elif name == "delegatebw":
             await layout.confirm_action_delegate(ctx, action.delegate)
-            writers.write_action_delegate(w, action.delegate)
+            _write_action(sha, writers.write_action_delegate, action.delegate)
         elif name == "undelegatebw":
             await layout.confirm_action_undelegate(ctx, action.undelegate)
-            writers.write_action_undelegate(w, action.undelegate)
+            _write_action(sha, writers.write_action_undelegate, action.undelegate)
         elif name == "refund":
             await layout.confirm_action_refund(ctx, action.refund)
-            writers.write_action_refund(w, action.refund)
+            _write_action(sha, writers.write_action_refund, action.refund)
         elif name == "voteproducer":
             await layout.confirm_action_voteproducer(ctx, action.vote_producer)
-            writers.write_action_voteproducer(w, action.vote_producer)
+            _write_action(sha, writers.write_action_voteproducer, action.vote_producer)
         elif name == "updateauth":
             await layout.confirm_action_updateauth(ctx, action.update_auth)
-            writers.write_action_updateauth(w, action.update_auth)
+            _write_action(sha, writers.write_action_updateauth, action.update_auth)
         elif name == "deleteauth":
             await layout.confirm_action_deleteauth(ctx, action.delete_auth)
-            writers.write_action_deleteauth(w, action.delete_auth)
+            _write_action(sha, writers.write_action_deleteauth, action.delete_auth)
         elif name == "linkauth":
             await layout.confirm_action_linkauth(ctx, action.link_auth)
-            writers.write_action_linkauth(w, action.link_auth)
+            _write_action(sha, writers.write_action_linkauth, action.link_auth)
         elif name == "unlinkauth":
             await layout.confirm_action_unlinkauth(ctx, action.unlink_auth)
-            writers.write_action_unlinkauth(w, action.unlink_auth)
+            _write_action(sha, writers.write_action_unlinkauth, action.unlink_auth)
         elif name == "newaccount":
             await layout.confirm_action_newaccount(ctx, action.new_account)
-            writers.write_action_newaccount(w, action.new_account)
+            _write_action(sha, writers.write_action_newaccount, action.new_account)
         else:
             raise ValueError("Unrecognized action type for eosio")
     elif name == "transfer":
         await layout.confirm_action_transfer(ctx, action.transfer, account)
-        writers.write_action_transfer(w, action.transfer)
+        _write_action(sha, writers.write_action_transfer, action.transfer)
     else:
-        await process_unknown_action(ctx, w, action)
+        await process_unknown_action(ctx, sha, action)
 
-    writers.write_action_common(sha, action.common)
-    writers.write_variant32(sha, len(w))
-    writers.write_bytes(sha, w)
+
+def _write_action(sha, write_fn, msg):
+    # actions are prefixed by their size, count it before hashing the data
+    counter = writers.LengthWriter()
+    write_fn(counter, msg)
+    writers.write_variant32(sha, counter.size)
+    write_fn(sha, msg)
 
 
-async def process_unknown_action(ctx, w, action):
+async def process_unknown_action(ctx, sha, action):
+    # the data is hashed as it arrives, its size is declared up front
     checksum = HashWriter(sha256())
     writers.write_variant32(checksum, action.unknown.data_size)
+    writers.write_variant32(sha, action.unknown.data_size)
     checksum.extend(action.unknown.data_chunk)
 
-    writers.write_bytes(w, action.unknown.data_chunk)
+    writers.write_bytes(sha, action.unknown.data_chunk)
     bytes_left = action.unknown.data_size - len(action.unknown.data_chunk)
+    if bytes_left < 0:
+        raise ValueError("Bad response. Buffer overflow.")
 
     while bytes_left != 0:
         action = await ctx.call(
@@ -82,7 +91,7 @@ async def process_unknown_action(ctx, w, action):
             raise ValueError("Bad response. Unknown struct expected.")
 
         checksum.extend(action.unknown.data_chunk)
-        writers.write_bytes(w, action.unknown.data_chunk)
+        writers.write_bytes(sha, action.unknown.data_chunk)
 
         bytes_left -= len(action.unknown.data_chunk)
         if bytes_left < 0:
@@ -27,6 +27,21 @@ from apps.common.writers import (
 )
 
 
+class LengthWriter:
+    """
+    Counts the bytes written to it, for length prefixes of hashed data.
+    """
+
+    def __init__(self):
+        self.size = 0
+
+    def append(self, b: int):
+        self.size += 1
+
+    def extend(self, buf: bytes):
+        self.size += len(buf)
+
+
 def write_auth(w: bytearray, auth: EosAuthorization) -> int:
     write_uint32_le(w, auth.threshold)
     write_variant32(w, len(auth.keys))
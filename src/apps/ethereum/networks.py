@@ -13,22 +13,21 @@ def shortcut_by_chain_id(chain_id, tx_type=None):
 
 
 def by_chain_id(chain_id):
-    for n in NETWORKS:
-        if n.chain_id == chain_id:
-            return n
-    return None
+    index = CHAIN_ID_INDEX.get(chain_id)
+    return by_index(index) if index is not None else None
 
 
 def by_slip44(slip44):
-    for n in NETWORKS:
-        if n.slip44 == slip44:
-            return n
-    return None
+    index = SLIP44_INDEX.get(slip44)
+    return by_index(index) if index is not None else None
+
+
+def by_index(index):
+    return NetworkInfo(*NETWORKS[index])
 
 
 def all_slip44_ids_hardened():
-    for n in NETWORKS:
-        yield n.slip44 | HARDENED
+    return SLIP44_IDS_HARDENED
 
 
 class NetworkInfo:
@@ -43,194 +42,116 @@ class NetworkInfo:
 
 
 # fmt: off
-NETWORKS = [
-    NetworkInfo(
-        chain_id=1,
-        slip44=60,
-        shortcut="ETH",
-        name="Ethereum",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=2,
-        slip44=40,
-        shortcut="EXP",
-        name="Expanse",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=3,
-        slip44=1,
-        shortcut="tROP",
-        name="Ethereum Testnet Ropsten",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=4,
-        slip44=1,
-        shortcut="tRIN",
-        name="Ethereum Testnet Rinkeby",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=8,
-        slip44=108,
-        shortcut="UBQ",
-        name="Ubiq",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=28,
-        slip44=1128,
-        shortcut="ETSC",
-        name="Ethereum Social",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=30,
-        slip44=137,
-        shortcut="RBTC",
-        name="RSK",
-        rskip60=True,
-    ),
-    NetworkInfo(
-        chain_id=31,
-        slip44=37310,
-        shortcut="tRBTC",
-        name="RSK Testnet",
-        rskip60=True,
-    ),
-    NetworkInfo(
-        chain_id=42,
-        slip44=1,
-        shortcut="tKOV",
-        name="Ethereum Testnet Kovan",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=60,
-        slip44=6060,
-        shortcut="GO",
-        name="GoChain",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=61,
-        slip44=61,
-        shortcut="ETC",
-        name="Ethereum Classic",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=62,
-        slip44=1,
-        shortcut="tETC",
-        name="Ethereum Classic Testnet",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=64,
-        slip44=163,
-        shortcut="ELLA",
-        name="Ellaism",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=76,
-        slip44=76,
-        shortcut="MIX",
-        name="Mix",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=237,
-        slip44=237,
-        shortcut="DXN",
-        name="DEXON",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=820,
-        slip44=820,
-        shortcut="CLO",
-        name="Callisto",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=1620,
-        slip44=1620,
-        shortcut="ATH",
-        name="Atheios",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=1987,
-        slip44=1987,
-        shortcut="EGEM",
-        name="EtherGem",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=2018,
-        slip44=2018,
-        shortcut="EOSC",
-        name="EOS Classic",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=2894,
-        slip44=2894,
-        shortcut="REOSC",
-        name="REOSC Ecosystem",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=31102,
-        slip44=31102,
-        shortcut="ESN",
-        name="Ethersocial Network",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=200625,
-        slip44=200625,
-        shortcut="AKA",
-        name="Akroma",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=246529,
-        slip44=246529,
-        shortcut="ATS",
-        name="ARTIS sigma1",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=246785,
-        slip44=1,
-        shortcut="tATS",
-        name="ARTIS tau1",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=1313114,
-        slip44=1313114,
-        shortcut="ETHO",
-        name="Ether-1",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=7762959,
-        slip44=184,
-        shortcut="MUSIC",
-        name="Musicoin",
-        rskip60=False,
-    ),
-    NetworkInfo(
-        chain_id=3125659152,
-        slip44=164,
-        shortcut="PIRL",
-        name="Pirl",
-        rskip60=False,
-    ),
-]
+# chain_id, slip44, shortcut, name, rskip60
+NETWORKS = (
+    (1, 60, "ETH", "Ethereum", False),
+    (2, 40, "EXP", "Expanse", False),
+    (3, 1, "tROP", "Ethereum Testnet Ropsten", False),
+    (4, 1, "tRIN", "Ethereum Testnet Rinkeby", False),
+    (8, 108, "UBQ", "Ubiq", False),
+    (28, 1128, "ETSC", "Ethereum Social", False),
+    (30, 137, "RBTC", "RSK", True),
+    (31, 37310, "tRBTC", "RSK Testnet", True),
+    (42, 1, "tKOV", "Ethereum Testnet Kovan", False),
+    (60, 6060, "GO", "GoChain", False),
+    (61, 61, "ETC", "Ethereum Classic", False),
+    (62, 1, "tETC", "Ethereum Classic Testnet", False),
+    (64, 163, "ELLA", "Ellaism", False),
+    (76, 76, "MIX", "Mix", False),
+    (237, 237, "DXN", "DEXON", False),
+    (820, 820, "CLO", "Callisto", False),
+    (1620, 1620, "ATH", "Atheios", False),
+    (1987, 1987, "EGEM", "EtherGem", False),
+    (2018, 2018, "EOSC", "EOS Classic", False),
+    (2894, 2894, "REOSC", "REOSC Ecosystem", False),
+    (31102, 31102, "ESN", "Ethersocial Network", False),
+    (200625, 200625, "AKA", "Akroma", False),
+    (246529, 246529, "ATS", "ARTIS sigma1", False),
+    (246785, 1, "tATS", "ARTIS tau1", False),
+    (1313114, 1313114, "ETHO", "Ether-1", False),
+    (7762959, 184, "MUSIC", "Musicoin", False),
+    (3125659152, 164, "PIRL", "Pirl", False),
+)
+
+CHAIN_ID_INDEX = {
+    1: 0,
+    2: 1,
+    3: 2,
+    4: 3,
+    8: 4,
+    28: 5,
+    30: 6,
+    31: 7,
+    42: 8,
+    60: 9,
+    61: 10,
+    62: 11,
+    64: 12,
+    76: 13,
+    237: 14,
+    820: 15,
+    1620: 16,
+    1987: 17,
+    2018: 18,
+    2894: 19,
+    31102: 20,
+    200625: 21,
+    246529: 22,
+    246785: 23,
+    1313114: 24,
+    7762959: 25,
+    3125659152: 26,
+}
+
+# maps slip44 to the first network using it
+SLIP44_INDEX = {
+    1: 2,
+    40: 1,
+    60: 0,
+    61: 10,
+    76: 13,
+    108: 4,
+    137: 6,
+    163: 12,
+    164: 26,
+    184: 25,
+    237: 14,
+    820: 15,
+    1128: 5,
+    1620: 16,
+    1987: 17,
+    2018: 18,
+    2894: 19,
+    6060: 9,
+    31102: 20,
+    37310: 7,
+    200625: 21,
+    246529: 22,
+    1313114: 24,
+}
+
+SLIP44_IDS_HARDENED = {
+    1 | HARDENED,
+    40 | HARDENED,
+    60 | HARDENED,
+    61 | HARDENED,
+    76 | HARDENED,
+    108 | HARDENED,
+    137 | HARDENED,
+    163 | HARDENED,
+    164 | HARDENED,
+    184 | HARDENED,
+    237 | HARDENED,
+    820 | HARDENED,
+    1128 | HARDENED,
+    1620 | HARDENED,
+    1987 | HARDENED,
+    2018 | HARDENED,
+    2894 | HARDENED,
+    6060 | HARDENED,
+    31102 | HARDENED,
+    37310 | HARDENED,
+    200625 | HARDENED,
+    246529 | HARDENED,
+    1313114 | HARDENED,
+}
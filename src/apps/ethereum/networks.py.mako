@@ -13,22 +13,21 @@ def shortcut_by_chain_id(chain_id, tx_type=None):
 
 
 def by_chain_id(chain_id):
-    for n in NETWORKS:
-        if n.chain_id == chain_id:
-            return n
-    return None
+    index = CHAIN_ID_INDEX.get(chain_id)
+    return by_index(index) if index is not None else None
 
 
 def by_slip44(slip44):
-    for n in NETWORKS:
-        if n.slip44 == slip44:
-            return n
-    return None
+    index = SLIP44_INDEX.get(slip44)
+    return by_index(index) if index is not None else None
+
+
+def by_index(index):
+    return NetworkInfo(*NETWORKS[index])
 
 
 def all_slip44_ids_hardened():
-    for n in NETWORKS:
-        yield n.slip44 | HARDENED
+    return SLIP44_IDS_HARDENED
 
 
 class NetworkInfo:
@@ -43,14 +42,33 @@ class NetworkInfo:
 
 
 # fmt: off
-NETWORKS = [
+<%
+slip44_index = {}
+for i, n in enumerate(supported_on("trezor2", eth)):
+    slip44_index.setdefault(n.slip44, i)
+%>\
+# chain_id, slip44, shortcut, name, rskip60
+NETWORKS = (
 % for n in supported_on("trezor2", eth):
-    NetworkInfo(
-        chain_id=${n.chain_id},
-        slip44=${n.slip44},
-        shortcut="${n.shortcut}",
-        name="${n.name}",
-        rskip60=${n.rskip60},
-    ),
+    (${n.chain_id}, ${n.slip44}, "${n.shortcut}", "${n.name}", ${n.rskip60}),
+% endfor
+)
+
+CHAIN_ID_INDEX = {
+% for i, n in enumerate(supported_on("trezor2", eth)):
+    ${n.chain_id}: ${i},
+% endfor
+}
+
+# maps slip44 to the first network using it
+SLIP44_INDEX = {
+% for slip44, i in sorted(slip44_index.items()):
+    ${slip44}: ${i},
+% endfor
+}
+
+SLIP44_IDS_HARDENED = {
+% for slip44 in sorted(slip44_index):
+    ${slip44} | HARDENED,
 % endfor
-]
+}
@@ -1,11 +1,34 @@
 # generated from tokens.py.mako
 # do not edit manually!
+import ustruct
+from micropython import const
+
+# Tokens are stored in a packed, flash-resident table of fixed-size records
+# sorted by key, symbols are stored separately in _SYMBOLS.  Record layout:
+# chain_id (4 bytes, big-endian) | address (20 bytes) | decimals (1 byte) |
+# symbol length (1 byte) | symbol offset (2 bytes, big-endian)
+_KEY_LEN = const(24)
+_RECORD_LEN = const(28)
 
 
 def token_by_chain_address(chain_id, address):
-    for token in tokens:
-        if chain_id == token[0] and address == token[1]:
-            return token
+    if not 0 <= chain_id <= 0xFFFFFFFF or len(address) != 20:
+        return UNKNOWN_TOKEN
+    key = ustruct.pack(">L", chain_id) + bytes(address)
+    lo = 0
+    hi = len(_TOKENS) // _RECORD_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ofs = mid * _RECORD_LEN
+        k = _TOKENS[ofs : ofs + _KEY_LEN]
+        if k < key:
+            lo = mid + 1
+        elif k > key:
+            hi = mid
+        else:
+            decimals, slen, sofs = ustruct.unpack_from(">BBH", _TOKENS, ofs + _KEY_LEN)
+            symbol = bytes(memoryview(_SYMBOLS)[sofs : sofs + slen]).decode()
+            return (chain_id, address, symbol, decimals)
     return UNKNOWN_TOKEN
 
 
@@ -13,9 +36,29 @@ UNKNOWN_TOKEN = (None, None, None, None)
 
 
 # fmt: off
-tokens = [
-% for t in supported_on("trezor2", erc20):
-    (${t.chain_id}, ${black_repr(t.address_bytes)}, ${black_repr(t.symbol)}, ${t.decimals}),  # ${t.chain} / ${t.name.strip()}
+<%
+import struct
+
+tokens = sorted(supported_on("trezor2", erc20), key=lambda t: (t.chain_id, t.address_bytes))
+symbols = [t.symbol.encode() for t in tokens]
+offsets = []
+offset = 0
+for symbol in symbols:
+    offsets.append(offset)
+    offset += len(symbol)
+
+def record(t, symbol, offset):
+    return struct.pack(">L", t.chain_id) + t.address_bytes + struct.pack(">BBH", t.decimals, len(symbol), offset)
+%>\
+_TOKENS = (
+% for t, symbol, offset in zip(tokens, symbols, offsets):
+    ${black_repr(record(t, symbol, offset))}  # ${t.chain} / ${t.name.strip()}
+% endfor
+)
+
+_SYMBOLS = (
+% for t, symbol in zip(tokens, symbols):
+    ${black_repr(symbol)}  # ${t.symbol}
 % endfor
-]
+)
 # fmt: on
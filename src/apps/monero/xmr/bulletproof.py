@@ -1,4 +1,5 @@
 import gc
+from micropython import const
 
 from trezor import utils
 from trezor.utils import memcpy as _memcpy
@@ -12,6 +13,11 @@ BP_LOG_N = 6
 BP_N = 64  # 1 << BP_LOG_N
 BP_M = 16  # maximal number of bulletproofs
 
+# heap budget of the precomputed point tables of MultiExpWindowed
+_MULTIEXP_BUDGET = const(16384)
+_MULTIEXP_POINT_SIZE = const(176)  # approximate heap size of a decoded point
+_MULTIEXP_STRAUS_MIN = const(4)  # fewer terms are multiplied one by one
+
 ZERO = b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
 ONE = b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
 TWO = b"\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
@@ -530,7 +536,8 @@ class KeyVPrecomp(KeyVBase):
         if item < len(self.precomp_prefix):
             return self.precomp_prefix.to(item, buff if buff else self.buff, offset)
         self.aux_comp_fnc(item, self.buff)
-        memcpy(buff, offset, self.buff, 0, 32)
+        if buff:
+            memcpy(buff, offset, self.buff, 0, 32)
         return buff if buff else self.buff
 
 
@@ -625,19 +632,12 @@ def const_vector(val, elems=BP_N, copy=True):
 
 
 def vector_exponent_custom(A, B, a, b, dst=None):
-    dst = _ensure_dst_key(dst)
-    crypto.identity_into(tmp_pt_2)
-
+    muex = MultiExpWindowed(size=2 * len(a))
     for i in range(len(a)):
-        crypto.decodeint_into_noreduce(tmp_sc_1, a.to(i))
-        crypto.decodepoint_into(tmp_pt_3, A.to(i))
-        crypto.decodeint_into_noreduce(tmp_sc_2, b.to(i))
-        crypto.decodepoint_into(tmp_pt_4, B.to(i))
-        crypto.add_keys3_into(tmp_pt_1, tmp_sc_1, tmp_pt_3, tmp_sc_2, tmp_pt_4)
-        crypto.point_add_into(tmp_pt_2, tmp_pt_2, tmp_pt_1)
+        muex.add_pair(a.to(i), A.to(i))
+        muex.add_pair(b.to(i), B.to(i))
         gc_iter(i)
-    crypto.encodepoint_into(dst, tmp_pt_2)
-    return dst
+    return muex.eval(dst)
 
 
 def vector_powers(x, n, dst=None, dynamic=False, **kwargs):
@@ -857,13 +857,10 @@ class MultiExpSequential:
     """
     MultiExp object similar to MultiExp array of [(scalar, point), ]
     MultiExp computes simply: res = \\sum_i scalar_i * point_i
-    Straus / Pippenger algorithms are implemented in the original Monero C++ code for the speed
-    but the memory cost is around 1 MB which is not affordable here in HW devices.
+    The original Monero C++ code uses Straus / Pippenger with tables of around 1 MB,
+    MultiExpWindowed implements Straus with tables bounded to a memory budget.
 
-    Moreover, Monero needs speed for very fast verification for blockchain verification which is not
-    priority in this use case.
-
-    MultiExp holder with sequential evaluation
+    MultiExp holder with sequential evaluation, one scalar multiplication per term
     """
 
     def __init__(self, size=None, points=None, point_fnc=None):
@@ -903,6 +900,128 @@ class MultiExpSequential:
         return crypto.encodepoint_into(dst, self.acc)
 
 
+def _multiexp_window(size, budget):
+    """
+    Returns the window width in bits with the least estimated number of point
+    operations for evaluating `size` terms with tables fitting into `budget`.
+    """
+    best_w = 1
+    best_cost = None
+    if size < _MULTIEXP_STRAUS_MIN:
+        return best_w
+    for w in (1, 2, 4):
+        entries = (1 << w) - 1
+        capacity = max(1, budget // (entries * _MULTIEXP_POINT_SIZE))
+        chunks = (size + capacity - 1) // capacity
+        # 256 doublings per chunk, table precomputation and additions per term
+        cost = chunks * 256 + size * (entries - 1 + (256 // w) * entries // (1 << w))
+        if best_cost is None or cost < best_cost:
+            best_w = w
+            best_cost = cost
+    return best_w
+
+
+class MultiExpWindowed:
+    """
+    MultiExp with the same interface as MultiExpSequential, evaluated with the
+    Straus interleaved window method: points are decoded once into tables of
+    their multiples and all scalars of a chunk share one chain of doublings.
+
+    The tables are bounded by `budget` bytes; terms are evaluated in chunks
+    that fit into it. The window width is chosen from the expected number of
+    terms `size`.
+    """
+
+    def __init__(self, size=None, points=None, point_fnc=None, budget=_MULTIEXP_BUDGET):
+        self.current_idx = 0
+        self.points = points if points else []
+        self.point_fnc = point_fnc
+        if size is None:
+            size = len(self.points) if self.points else BP_N
+
+        self.window = _multiexp_window(size, budget)
+        self.entries = (1 << self.window) - 1
+        capacity = budget // (self.entries * _MULTIEXP_POINT_SIZE)
+        self.capacity = max(1, min(size, capacity))
+        self.tables = [crypto.new_point() for _ in range(self.capacity * self.entries)]
+        self.scalars = bytearray(32 * self.capacity)
+        self.pending = 0
+
+        self.acc = crypto.identity()
+        self.tmp = crypto.new_point()
+        self.sc = crypto.new_scalar()
+
+    def get_point(self, idx):
+        return (
+            self.point_fnc(idx, None) if idx >= len(self.points) else self.points[idx]
+        )
+
+    def add_pair(self, scalar, point):
+        self._acc(scalar, point)
+
+    def add_scalar(self, scalar):
+        self._acc(scalar, self.get_point(self.current_idx))
+
+    def _acc(self, scalar, point):
+        k = self.pending
+        _memcpy(self.scalars, 32 * k, scalar, 0, 32)
+
+        # multiples 1..entries of the point
+        tables = self.tables
+        base = k * self.entries
+        crypto.decodepoint_into(tables[base], point)
+        for d in range(1, self.entries):
+            crypto.point_add_into(tables[base + d], tables[base + d - 1], tables[base])
+
+        self.current_idx += 1
+        self.pending = k + 1
+        if self.pending == self.capacity:
+            self._flush()
+
+    def _flush(self):
+        n = self.pending
+        w = self.window
+        mask = self.entries
+        scalars = self.scalars
+        tables = self.tables
+        acc = self.tmp
+
+        if n < _MULTIEXP_STRAUS_MIN:
+            # a few scalar multiplications are cheaper than a chain of doublings
+            scalars = memoryview(scalars)
+            for k in range(n):
+                crypto.decodeint_into_noreduce(self.sc, scalars[32 * k : 32 * k + 32])
+                crypto.scalarmult_into(acc, tables[k * mask], self.sc)
+                crypto.point_add_into(self.acc, self.acc, acc)
+            self.pending = 0
+            return
+
+        crypto.identity_into(acc)
+
+        # scalars are processed from the most significant window, raw digits of
+        # the encoding are used, as in scalarmult of non-reduced scalars
+        for j in range(256 // w - 1, -1, -1):
+            for _ in range(w):
+                crypto.point_double_into(acc, acc)
+            bit = j * w
+            ofs = bit >> 3
+            shift = bit & 7
+            for k in range(n):
+                d = (scalars[32 * k + ofs] >> shift) & mask
+                if d:
+                    crypto.point_add_into(acc, acc, tables[k * mask + d - 1])
+
+        crypto.point_add_into(self.acc, self.acc, acc)
+        self.pending = 0
+
+    def eval(self, dst, GiHi=False):
+        if self.pending:
+            self._flush()
+        self.tables = None
+        dst = _ensure_dst_key(dst)
+        return crypto.encodepoint_into(dst, self.acc)
+
+
 def multiexp(dst=None, data=None, GiHi=False):
     return data.eval(dst, GiHi)
 
@@ -1441,7 +1560,7 @@ class BulletProofBuilder:
             if not proof_v8:
                 weight_y8 = sc_mul(None, weight_y, EIGHT)
 
-            muex = MultiExpSequential(points=[pt for pt in proof.V])
+            muex = MultiExpWindowed(size=len(proof.V) + 4, points=list(proof.V))
             for j in range(len(proof.V)):
                 sc_mul(tmp, zpow[j + 2], weight_y8)
                 muex.add_scalar(init_key(tmp))
@@ -1537,10 +1656,11 @@ class BulletProofBuilder:
             self.gc(63)
 
             sc_muladd(z1, proof.mu, weight_z, z1)
-            muex = MultiExpSequential(
+            muex = MultiExpWindowed(
+                size=2 * rounds,
                 point_fnc=lambda i, d: proof.L[i // 2]
                 if i & 1 == 0
-                else proof.R[i // 2]
+                else proof.R[i // 2],
             )
             for i in range(rounds):
                 sc_mul(tmp, w[i], w[i])
@@ -1568,10 +1688,11 @@ class BulletProofBuilder:
         add_keys(muex_acc, muex_acc, check2)
 
         if not is_single:  # ph4
-            muex = MultiExpSequential(
+            muex = MultiExpWindowed(
+                size=2 * maxMN,
                 point_fnc=lambda i, d: Gprec.to(i // 2)
                 if i & 1 == 0
-                else Hprec.to(i // 2)
+                else Hprec.to(i // 2),
             )
             for i in range(maxMN):
                 muex.add_scalar(m_z4[i])
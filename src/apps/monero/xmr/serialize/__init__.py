@@ -17,7 +17,7 @@ def dump_msg(msg, preallocate: int = None, prefix: bytes = None) -> bytes:
     msg_type = msg.__class__
     msg_type.dump(writer, msg)
 
-    return writer.get_buffer()
+    return writer.get_buffer(trim=True)
 
 
 def dump_msg_gc(msg, preallocate: int = None, prefix: bytes = None) -> bytes:
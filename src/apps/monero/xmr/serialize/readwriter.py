@@ -1,4 +1,9 @@
 import gc
+from micropython import const
+
+from trezor import utils
+
+_MIN_CAPACITY = const(32)  # typical size of an EC point
 
 
 class MemoryReaderWriter:
@@ -9,6 +14,7 @@ class MemoryReaderWriter:
         threshold=None,
         do_gc=False,
         preallocate=None,
+        fixed=False,
         **kwargs
     ):
         self.buffer = buffer
@@ -22,12 +28,16 @@ class MemoryReaderWriter:
         self.read_empty = read_empty
         self.threshold = threshold
         self.do_gc = do_gc
+        # fixed arena, the buffer is never reallocated and overflowing it fails
+        self.fixed = fixed
 
         if preallocate is not None:
             self.preallocate(preallocate)
         elif self.buffer is None:
             self.buffer = bytearray(0)
-        else:
+        elif not fixed:
+            # a fixed arena writes into the given buffer from the start,
+            # otherwise the buffer holds data to read
             self.woffset = len(buffer)
 
     def is_empty(self):
@@ -38,14 +48,30 @@ class MemoryReaderWriter:
         self.offset = 0
         self.woffset = 0
 
+    def reserve(self, size):
+        """
+        Makes room for writing at least `size` more bytes without reallocation.
+        """
+        if self.woffset + size > len(self.buffer):
+            self._grow(self.woffset + size)
+
+    def _grow(self, size):
+        if self.fixed:
+            raise ValueError("Buffer overflow")
+        # grow geometrically, so a series of small writes reallocates rarely
+        buffer = bytearray(max(size, 2 * len(self.buffer), _MIN_CAPACITY))
+        utils.memcpy(buffer, 0, self.buffer, 0, self.woffset)
+        self.buffer = buffer
+        if self.do_gc:
+            gc.collect()
+
     def readinto(self, buf):
         ln = len(buf)
-        if not self.read_empty and ln > 0 and self.offset == len(self.buffer):
+        if not self.read_empty and ln > 0 and self.offset == self.woffset:
             raise EOFError
 
-        nread = min(ln, len(self.buffer) - self.offset)
-        for idx in range(nread):
-            buf[idx] = self.buffer[self.offset + idx]
+        nread = min(ln, self.woffset - self.offset)
+        utils.memcpy(buf, 0, self.buffer, self.offset, nread)
 
         self.offset += nread
         self.nread += nread
@@ -67,33 +93,11 @@ class MemoryReaderWriter:
 
     def write(self, buf):
         nwritten = len(buf)
-        nall = len(self.buffer)
-        towrite = nwritten
-        bufoff = 0
-
-        # Fill existing place in the buffer
-        while towrite > 0 and nall - self.woffset > 0:
-            self.buffer[self.woffset] = buf[bufoff]
-            self.woffset += 1
-            bufoff += 1
-            towrite -= 1
-
-        # Allocate next chunk if needed
-        while towrite > 0:
-            _towrite = min(32, towrite)
-            chunk = bytearray(32)  # chunk size typical for EC point
-
-            for i in range(_towrite):
-                chunk[i] = buf[bufoff]
-                self.woffset += 1
-                bufoff += 1
-                towrite -= 1
-
-            self.buffer.extend(chunk)
-            if self.do_gc:
-                chunk = None  # dereference
-                gc.collect()
+        if self.woffset + nwritten > len(self.buffer):
+            self._grow(self.woffset + nwritten)
+        utils.memcpy(self.buffer, self.woffset, buf, 0, nwritten)
 
+        self.woffset += nwritten
         self.nwritten += nwritten
         self.ndata += nwritten
         return nwritten
@@ -101,6 +105,15 @@ class MemoryReaderWriter:
     async def awrite(self, buf):
         return self.write(buf)
 
-    def get_buffer(self):
+    def get_buffer(self, trim=False):
+        """
+        Returns a view of the data not yet read.  With `trim`, a growable
+        buffer is first shrunk to the data, so the view does not keep the
+        spare capacity alive.
+        """
+        if trim and not self.fixed and self.woffset - self.offset < len(self.buffer):
+            self.buffer = self.buffer[self.offset : self.woffset]
+            self.woffset -= self.offset
+            self.offset = 0
         mv = memoryview(self.buffer)
         return mv[self.offset : self.woffset]
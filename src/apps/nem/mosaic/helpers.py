@@ -1,12 +1,8 @@
-from .nem_mosaics import mosaics
+from .nem_mosaics import get_by_name
 
 
 def get_mosaic_definition(namespace_name: str, mosaic_name: str, network: int) -> dict:
-    for m in mosaics:
-        if namespace_name == m["namespace"] and mosaic_name == m["mosaic"]:
-            if ("networks" not in m) or (network in m["networks"]):
-                return m
-    return None
+    return get_by_name(namespace_name, mosaic_name, network)
 
 
 def is_nem_xem_mosaic(namespace_name: str, mosaic_name: str) -> bool:
@@ -1,60 +1,49 @@
 # generated from nem_mosaics.py.mako
 # do not edit manually!
+from trezor.messages import NEMMosaicLevy
 
-mosaics = [
-    {
-        "name": "NEM",
-        "ticker": " XEM",
-        "namespace": "nem",
-        "mosaic": "xem",
-        "divisibility": 6,
-    },
-    {
-        "name": "DIMCOIN",
-        "ticker": " DIM",
-        "namespace": "dim",
-        "mosaic": "coin",
-        "divisibility": 6,
-        "levy": "MosaicLevy_Percentile",
-        "fee": 10,
-        "levy_namespace": "dim",
-        "levy_mosaic": "coin",
-        "networks": [104],
-    },
-    {
-        "name": "DIM TOKEN",
-        "ticker": " DIMTOK",
-        "namespace": "dim",
-        "mosaic": "token",
-        "divisibility": 6,
-        "networks": [104],
-    },
-    {
-        "name": "Breeze Token",
-        "ticker": " BREEZE",
-        "namespace": "breeze",
-        "mosaic": "breeze-token",
-        "divisibility": 0,
-        "networks": [104],
-    },
-    {
-        "name": "PacNEM Game Credits",
-        "ticker": " PAC:HRT",
-        "namespace": "pacnem",
-        "mosaic": "heart",
-        "divisibility": 0,
-        "networks": [104],
-    },
-    {
-        "name": "PacNEM Score Tokens",
-        "ticker": " PAC:CHS",
-        "namespace": "pacnem",
-        "mosaic": "cheese",
-        "divisibility": 6,
-        "levy": "MosaicLevy_Percentile",
-        "fee": 100,
-        "levy_namespace": "nem",
-        "levy_mosaic": "xem",
-        "networks": [104],
-    },
-]
+
+def get_by_name(namespace: str, mosaic: str, network: int) -> dict:
+    m = MOSAICS.get((namespace, mosaic))
+    if m is None:
+        return None
+    name, ticker, divisibility, networks, levy = m
+    if networks and not networks & _network_bit(network):
+        return None
+    definition = {
+        "name": name,
+        "ticker": ticker,
+        "namespace": namespace,
+        "mosaic": mosaic,
+        "divisibility": divisibility,
+    }
+    if levy is not None:
+        levy_type, fee, levy_namespace, levy_mosaic = levy
+        definition["levy"] = levy_type
+        definition["fee"] = fee
+        definition["levy_namespace"] = levy_namespace
+        definition["levy_mosaic"] = levy_mosaic
+    return definition
+
+
+def _network_bit(network: int) -> int:
+    if network in NETWORKS:
+        return 1 << NETWORKS.index(network)
+    return 0
+
+
+# fmt: off
+# bit positions of the network masks below
+NETWORKS = (104, 152, 96)
+
+# (namespace, mosaic): (name, ticker, divisibility, networks, levy)
+# networks is a mask of NETWORKS bits, 0 if the mosaic is not restricted
+# levy is (levy type, fee, levy namespace, levy mosaic)
+MOSAICS = {
+    ("nem", "xem"): ("NEM", " XEM", 6, 0, None),
+    ("dim", "coin"): ("DIMCOIN", " DIM", 6, 1, (NEMMosaicLevy.MosaicLevy_Percentile, 10, "dim", "coin")),
+    ("dim", "token"): ("DIM TOKEN", " DIMTOK", 6, 1, None),
+    ("breeze", "breeze-token"): ("Breeze Token", " BREEZE", 0, 1, None),
+    ("pacnem", "heart"): ("PacNEM Game Credits", " PAC:HRT", 0, 1, None),
+    ("pacnem", "cheese"): ("PacNEM Score Tokens", " PAC:CHS", 6, 1, (NEMMosaicLevy.MosaicLevy_Percentile, 100, "nem", "xem")),
+}
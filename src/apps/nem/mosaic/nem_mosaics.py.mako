@@ -1,29 +1,61 @@
 # generated from nem_mosaics.py.mako
 # do not edit manually!
+from trezor.messages import NEMMosaicLevy
+
+
+def get_by_name(namespace: str, mosaic: str, network: int) -> dict:
+    m = MOSAICS.get((namespace, mosaic))
+    if m is None:
+        return None
+    name, ticker, divisibility, networks, levy = m
+    if networks and not networks & _network_bit(network):
+        return None
+    definition = {
+        "name": name,
+        "ticker": ticker,
+        "namespace": namespace,
+        "mosaic": mosaic,
+        "divisibility": divisibility,
+    }
+    if levy is not None:
+        levy_type, fee, levy_namespace, levy_mosaic = levy
+        definition["levy"] = levy_type
+        definition["fee"] = fee
+        definition["levy_namespace"] = levy_namespace
+        definition["levy_mosaic"] = levy_mosaic
+    return definition
+
+
+def _network_bit(network: int) -> int:
+    if network in NETWORKS:
+        return 1 << NETWORKS.index(network)
+    return 0
+
+
+# fmt: off
 <%
-ATTRIBUTES = (
-    "name",
-    "ticker",
-    "namespace",
-    "mosaic",
-    "divisibility",
-    "levy",
-    "fee",
-    "levy_namespace",
-    "levy_mosaic",
-    "networks",
-)
+NETWORKS = (0x68, 0x98, 0x60)
+
+def network_mask(m):
+    if "networks" not in m:
+        return 0
+    return sum(1 << NETWORKS.index(n) for n in m.networks)
+
+def levy(m):
+    if "levy" not in m:
+        return "None"
+    return "(NEMMosaicLevy.%s, %s, %s, %s)" % (
+        m.levy, m.fee, black_repr(m.levy_namespace), black_repr(m.levy_mosaic)
+    )
 %>\
+# bit positions of the network masks below
+NETWORKS = (${", ".join(str(n) for n in NETWORKS)})
 
-mosaics = [
+# (namespace, mosaic): (name, ticker, divisibility, networks, levy)
+# networks is a mask of NETWORKS bits, 0 if the mosaic is not restricted
+# levy is (levy type, fee, levy namespace, levy mosaic)
+MOSAICS = {
 % for m in supported_on("trezor2", nem):
-<% m.ticker = " " + m.ticker %>\
-    {
-    % for attr in ATTRIBUTES:
-        % if attr in m:
-        "${attr}": ${black_repr(m[attr])},
-        % endif
-    % endfor
-    },
+    (${black_repr(m.namespace)}, ${black_repr(m.mosaic)}): (${black_repr(m.name)}, ${black_repr(" " + m.ticker)}, ${m.divisibility}, ${network_mask(m)}, ${levy(m)}),
 % endfor
-]
+}
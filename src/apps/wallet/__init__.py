@@ -15,6 +15,7 @@ def boot():
     ]
     wire.add(MessageType.GetPublicKey, __name__, "get_public_key", ns)
     wire.add(MessageType.GetAddress, __name__, "get_address", ns)
+    wire.add(MessageType.GetAddresses, __name__, "get_addresses", ns)
     wire.add(MessageType.GetEntropy, __name__, "get_entropy")
     wire.add(MessageType.SignTx, __name__, "sign_tx", ns)
     wire.add(MessageType.SignMessage, __name__, "sign_message", ns)
@@ -19,7 +19,7 @@ async def get_address(ctx, msg, keychain):
         script_type=msg.script_type,
     )
 
-    node = keychain.derive(msg.address_n, coin.curve_name)
+    node = keychain.derive_public(msg.address_n, coin.curve_name)
     address = addresses.get_address(msg.script_type, coin, node, msg.multisig)
     address_short = addresses.address_short(coin, address)
 
@@ -0,0 +1,50 @@
+from micropython import const
+
+from trezor import wire
+from trezor.messages import InputScriptType
+from trezor.messages.Addresses import Addresses
+
+from apps.common import HARDENED, coins
+from apps.common.paths import validate_path
+from apps.wallet.sign_tx import addresses
+
+# maximum number of addresses returned in one response
+_MAX_ADDRESSES = const(100)
+
+
+async def get_addresses(ctx, msg, keychain):
+    coin_name = msg.coin_name or "Bitcoin"
+    coin = coins.by_name(coin_name)
+    script_type = msg.script_type
+    if script_type is None:
+        script_type = InputScriptType.SPENDADDRESS
+    start = msg.start_index or 0
+    count = msg.count or 0
+
+    if count < 1 or count > _MAX_ADDRESSES:
+        raise wire.DataError("Invalid number of addresses")
+    if start + count > HARDENED:
+        raise wire.DataError("Invalid start index")
+
+    # indexes only grow within the range, so validating the last path covers
+    # the whole range
+    await validate_path(
+        ctx,
+        addresses.validate_full_path,
+        path=msg.address_n + [start + count - 1],
+        coin=coin,
+        script_type=script_type,
+    )
+
+    # derive the public chain node once, then a single non-hardened level for
+    # each address, so no private key is involved in the discovery
+    chain = keychain.derive_public(msg.address_n, coin.curve_name)
+    result = []
+    for i in range(start, start + count):
+        node = chain.clone()
+        node.derive(i, True)
+        result.append(addresses.get_address(script_type, coin, node))
+        node.__del__()
+    chain.__del__()
+
+    return Addresses(addresses=result)
@@ -12,7 +12,7 @@ async def get_public_key(ctx, msg, keychain):
     curve_name = msg.ecdsa_curve_name or coin.curve_name
     script_type = msg.script_type or InputScriptType.SPENDADDRESS
 
-    node = keychain.derive(msg.address_n, curve_name=curve_name)
+    node = keychain.derive_public(msg.address_n, curve_name=curve_name)
 
     if (
         script_type in [InputScriptType.SPENDADDRESS, InputScriptType.SPENDMULTISIG]
@@ -17,6 +17,14 @@ from apps.wallet.sign_tx import (
 
 
 async def sign_tx(ctx, msg, keychain):
+    try:
+        return await _sign_tx(ctx, msg, keychain)
+    finally:
+        # cosigner caches must not outlive the signing session
+        multisig.clear_cache()
+
+
+async def _sign_tx(ctx, msg, keychain):
     signer = signing.sign_tx(msg, keychain)
 
     res = None
@@ -36,7 +44,8 @@ async def sign_tx(ctx, msg, keychain):
         if isinstance(req, TxRequest):
             if req.request_type == TXFINISHED:
                 break
-            res = await ctx.call(req, TxAck)
+            await ctx.write(req)
+            res = await ctx.read((TxAck,), helpers.max_ack_size(req))
         elif isinstance(req, helpers.UiConfirmOutput):
             res = await layout.confirm_output(ctx, req.output, req.coin)
             progress.report_init()
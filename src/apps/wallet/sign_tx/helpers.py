@@ -1,3 +1,6 @@
+from micropython import const
+
+from trezor import wire
 from trezor.messages import InputScriptType
 from trezor.messages.RequestType import (
     TXEXTRADATA,
@@ -16,6 +19,68 @@ from trezor.utils import obj_eq
 
 from apps.common.coininfo import CoinInfo
 
+# upper bound of heap used by one batch of prefetched inputs or outputs,
+# batched TxAcks that are serialized larger than this are not decoded
+_BATCH_HEAP_BUDGET = const(4096)
+
+# rough heap footprint of one decoded item, used to cap the number of items
+_BATCH_INPUT_SIZE = const(256)
+_BATCH_OUTPUT_SIZE = const(128)
+
+# Batched requests
+# ===
+
+
+class TxBatch:
+    """
+    Consecutive inputs or outputs of one transaction, prefetched several at a
+    time from a host that announced support for batched requests with
+    `SignTx.batch_size`.  One batch holds at most `heap_budget // item_size`
+    items, and the TxAck carrying it is at most `_BATCH_HEAP_BUDGET` bytes
+    long, see `max_ack_size`.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        count: int,
+        item_size: int,
+        heap_budget: int = _BATCH_HEAP_BUDGET,
+    ):
+        self.size = max(1, min(batch_size, heap_budget // item_size))
+        self.count = count  # total number of items in the stream
+        self.start = 0  # index of the first item in tx
+        self.length = 0  # number of items in tx
+        self.tx = None  # TransactionType of the last batched TxAck
+
+    def index(self, i: int):
+        k = i - self.start
+        if 0 <= k < self.length:
+            return k
+        return None
+
+    def fill(self, i: int, tx: TransactionType, length: int):
+        # the host may send fewer items than requested, but at least one and
+        # never more, otherwise the heap budget would not hold
+        if not 1 <= length <= min(self.size, self.count - i):
+            raise wire.DataError("Invalid number of items in batch")
+        self.start = i
+        self.length = length
+        self.tx = tx
+
+
+def input_batch(batch_size: int, count: int, heap_budget: int = _BATCH_HEAP_BUDGET):
+    if batch_size is None or batch_size < 2:
+        return None
+    return TxBatch(batch_size, count, _BATCH_INPUT_SIZE, heap_budget)
+
+
+def output_batch(batch_size: int, count: int, heap_budget: int = _BATCH_HEAP_BUDGET):
+    if batch_size is None or batch_size < 2:
+        return None
+    return TxBatch(batch_size, count, _BATCH_OUTPUT_SIZE, heap_budget)
+
+
 # Machine instructions
 # ===
 
@@ -92,7 +157,18 @@ def request_tx_extra_data(
     return ack.tx.extra_data
 
 
-def request_tx_input(tx_req: TxRequest, i: int, tx_hash: bytes = None):
+def request_tx_input(
+    tx_req: TxRequest, i: int, tx_hash: bytes = None, batch: TxBatch = None
+):
+    # serialized data must reach the host with the next request, so it
+    # cannot be served from a batch
+    if batch is not None and tx_req.serialized is None:
+        k = batch.index(i)
+        if k is None:
+            tx = yield from request_tx_batch(tx_req, TXINPUT, i, tx_hash, batch)
+            batch.fill(i, tx, len(tx.inputs))
+            k = 0
+        return sanitize_tx_input(batch.tx, k)
     tx_req.request_type = TXINPUT
     tx_req.details.request_index = i
     tx_req.details.tx_hash = tx_hash
@@ -101,16 +177,52 @@ def request_tx_input(tx_req: TxRequest, i: int, tx_hash: bytes = None):
     return sanitize_tx_input(ack.tx)
 
 
-def request_tx_output(tx_req: TxRequest, i: int, tx_hash: bytes = None):
-    tx_req.request_type = TXOUTPUT
+def request_tx_output(
+    tx_req: TxRequest, i: int, tx_hash: bytes = None, batch: TxBatch = None
+):
+    if batch is not None and tx_req.serialized is None:
+        k = batch.index(i)
+        if k is None:
+            tx = yield from request_tx_batch(tx_req, TXOUTPUT, i, tx_hash, batch)
+            if tx_hash is None:
+                batch.fill(i, tx, len(tx.outputs))
+            else:
+                batch.fill(i, tx, len(tx.bin_outputs))
+            k = 0
+        tx = batch.tx
+    else:
+        tx_req.request_type = TXOUTPUT
+        tx_req.details.request_index = i
+        tx_req.details.tx_hash = tx_hash
+        ack = yield tx_req
+        tx_req.serialized = None
+        tx = ack.tx
+        k = 0
+    if tx_hash is None:
+        return sanitize_tx_output(tx, k)
+    else:
+        return sanitize_tx_binoutput(tx, k)
+
+
+def request_tx_batch(
+    tx_req: TxRequest, request_type: int, i: int, tx_hash: bytes, batch: TxBatch
+):
+    tx_req.request_type = request_type
     tx_req.details.request_index = i
+    tx_req.details.request_count = min(batch.size, batch.count - i)
     tx_req.details.tx_hash = tx_hash
     ack = yield tx_req
     tx_req.serialized = None
-    if tx_hash is None:
-        return sanitize_tx_output(ack.tx)
-    else:
-        return sanitize_tx_binoutput(ack.tx)
+    tx_req.details.request_count = None
+    return ack.tx
+
+
+def max_ack_size(tx_req: TxRequest):
+    # a TxAck answering a request for several items is rejected before it is
+    # decoded if it is too large, a single item is not limited
+    if tx_req.details is not None and (tx_req.details.request_count or 1) > 1:
+        return _BATCH_HEAP_BUDGET
+    return None
 
 
 def request_tx_finish(tx_req: TxRequest):
@@ -148,8 +260,8 @@ def sanitize_tx_meta(tx: TransactionType) -> TransactionType:
     return tx
 
 
-def sanitize_tx_input(tx: TransactionType) -> TxInputType:
-    txi = tx.inputs[0]
+def sanitize_tx_input(tx: TransactionType, k: int = 0) -> TxInputType:
+    txi = tx.inputs[k]
     if txi.script_type is None:
         txi.script_type = InputScriptType.SPENDADDRESS
     if txi.sequence is None:
@@ -157,9 +269,9 @@ def sanitize_tx_input(tx: TransactionType) -> TxInputType:
     return txi
 
 
-def sanitize_tx_output(tx: TransactionType) -> TxOutputType:
-    return tx.outputs[0]
+def sanitize_tx_output(tx: TransactionType, k: int = 0) -> TxOutputType:
+    return tx.outputs[k]
 
 
-def sanitize_tx_binoutput(tx: TransactionType) -> TxOutputBinType:
-    return tx.bin_outputs[0]
+def sanitize_tx_binoutput(tx: TransactionType, k: int = 0) -> TxOutputBinType:
+    return tx.bin_outputs[k]
@@ -0,0 +1,91 @@
+# Legacy (pre-BIP143) signature hashes cover the whole transaction, so the
+# streaming signer requests all inputs and outputs again for every signed
+# input.  LegacyCache keeps a compact copy of what was streamed in Phase 1,
+# so each signature hash in Phase 2 is computed from memory and only the input
+# being signed is requested again.  That input is authenticated against the
+# digest of its Phase 1 version.
+
+from micropython import const
+
+from trezor.crypto.hashlib import sha256
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.utils import HashWriter
+
+from apps.wallet.sign_tx import writers
+
+# upper bound of heap used by the cache, larger transactions are streamed
+_LEGACY_CACHE_MAX_SIZE = const(16384)
+
+# input record: 32 prevhash, 4 idx, 4 sequence, 32 digest of the checked input
+_RECORD_PREVOUT = const(36)
+_RECORD_SEQUENCE = const(40)
+_RECORD_LEN = const(72)
+
+
+class LegacyCache:
+    def __init__(self, inputs_count: int, max_size: int = _LEGACY_CACHE_MAX_SIZE):
+        self.inputs = bytearray()  # input records
+        self.outputs = bytearray()  # serialized outputs
+        self.inputs_count = inputs_count
+        self.outputs_count = 0
+        self.budget = max_size - inputs_count * _RECORD_LEN
+        self.valid = self.budget >= 0
+
+    def add_input(self, txi: TxInputType):
+        if not self.valid:
+            return
+        if len(txi.prev_hash) != 32:
+            self.clear()
+            return
+        writers.write_bytes_reversed(self.inputs, txi.prev_hash)
+        writers.write_uint32(self.inputs, txi.prev_index)
+        writers.write_uint32(self.inputs, txi.sequence)
+        writers.write_bytes(self.inputs, input_check_digest(txi))
+
+    def add_output(self, txo_bin: TxOutputBinType):
+        if not self.valid:
+            return
+        writers.write_tx_output(self.outputs, txo_bin)
+        self.outputs_count += 1
+        if len(self.outputs) > self.budget:
+            self.clear()
+
+    def clear(self):
+        self.valid = False
+        self.inputs = None
+        self.outputs = None
+
+    def check_input(self, index: int, txi: TxInputType) -> bool:
+        ofs = index * _RECORD_LEN
+        digest = self.inputs[ofs + _RECORD_SEQUENCE : ofs + _RECORD_LEN]
+        return digest == input_check_digest(txi)
+
+    def write_inputs(self, w, sign_index: int, script_sig: bytes):
+        """
+        Writes all inputs with an empty script, except for the input being
+        signed, which gets `script_sig`.
+        """
+        writers.write_varint(w, self.inputs_count)
+        records = memoryview(self.inputs)
+        for i in range(self.inputs_count):
+            ofs = i * _RECORD_LEN
+            writers.write_bytes(w, records[ofs : ofs + _RECORD_PREVOUT])
+            if i == sign_index:
+                writers.write_varint(w, len(script_sig))
+                writers.write_bytes(w, script_sig)
+            else:
+                writers.write_varint(w, 0)
+            writers.write_bytes(
+                w, records[ofs + _RECORD_PREVOUT : ofs + _RECORD_SEQUENCE]
+            )
+
+    def write_outputs(self, w):
+        writers.write_varint(w, self.outputs_count)
+        writers.write_bytes(w, self.outputs)
+
+
+def input_check_digest(txi: TxInputType) -> bytes:
+    h = HashWriter(sha256())
+    writers.write_tx_input_check(h, txi)
+    return h.get_digest()
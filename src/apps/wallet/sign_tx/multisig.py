@@ -1,3 +1,5 @@
+from micropython import const
+
 from trezor.crypto import bip32
 from trezor.crypto.hashlib import sha256
 from trezor.messages import FailureType
@@ -7,6 +9,20 @@ from trezor.utils import HashWriter, ensure
 
 from apps.wallet.sign_tx.writers import write_bytes, write_uint32
 
+# Bounds of the caches of derived cosigner pubkeys and multisig fingerprints,
+# an arbitrary entry is evicted when a cache is full.  The pubkey cache is
+# sized for the pubkeys of all inputs of a session, up to a heap budget of
+# roughly 40 KiB (an entry takes about 150 bytes).
+_PUBKEY_CACHE_MIN = const(32)
+_PUBKEY_CACHE_MAX = const(256)
+_FINGERPRINT_CACHE_SIZE = const(4)
+
+_MAX_PUBKEYS = const(15)  # maximum number of cosigners
+
+_pubkeys = {}  # public_key + chain_code + path -> derived public key
+_pubkeys_limit = _PUBKEY_CACHE_MIN
+_fingerprints = {}  # m + serialized pubnodes -> fingerprint
+
 
 class MultisigError(ValueError):
     pass
@@ -34,15 +50,50 @@ class MultisigFingerprint:
             return False
 
 
+def clear_cache(inputs_count: int = 0):
+    """
+    Empties the caches, at the start and at the end of a signing session, and
+    sizes the pubkey cache for the pubkeys of `inputs_count` inputs.
+    """
+    global _pubkeys_limit
+    _pubkeys.clear()
+    _fingerprints.clear()
+    _pubkeys_limit = min(
+        max(_PUBKEY_CACHE_MIN, _MAX_PUBKEYS * inputs_count), _PUBKEY_CACHE_MAX
+    )
+
+
+def _evict_one(cache: dict):
+    for key in cache:
+        del cache[key]
+        return
+
+
 def multisig_fingerprint(multisig: MultisigRedeemScriptType) -> bytes:
     if multisig.nodes:
         pubnodes = multisig.nodes
     else:
         pubnodes = [hd.node for hd in multisig.pubkeys]
-    m = multisig.m
+
+    # every TxAck decodes a new multisig, so the entries are keyed by content
+    key = bytearray()
+    write_uint32(key, multisig.m)
+    for d in pubnodes:
+        _write_pubnode(key, d)
+    key = bytes(key)
+    fp = _fingerprints.get(key)
+    if fp is None:
+        fp = _compute_fingerprint(multisig.m, pubnodes)
+        if len(_fingerprints) >= _FINGERPRINT_CACHE_SIZE:
+            _evict_one(_fingerprints)
+        _fingerprints[key] = fp
+    return fp
+
+
+def _compute_fingerprint(m: int, pubnodes: list) -> bytes:
     n = len(pubnodes)
 
-    if n < 1 or n > 15 or m < 1 or m > 15:
+    if n < 1 or n > _MAX_PUBKEYS or m < 1 or m > _MAX_PUBKEYS:
         raise MultisigError(FailureType.DataError, "Invalid multisig parameters")
 
     for d in pubnodes:
@@ -56,15 +107,19 @@ def multisig_fingerprint(multisig: MultisigRedeemScriptType) -> bytes:
     write_uint32(h, m)
     write_uint32(h, n)
     for d in pubnodes:
-        write_uint32(h, d.depth)
-        write_uint32(h, d.fingerprint)
-        write_uint32(h, d.child_num)
-        write_bytes(h, d.chain_code)
-        write_bytes(h, d.public_key)
+        _write_pubnode(h, d)
 
     return h.get_digest()
 
 
+def _write_pubnode(w, d: HDNodeType):
+    write_uint32(w, d.depth)
+    write_uint32(w, d.fingerprint)
+    write_uint32(w, d.child_num)
+    write_bytes(w, d.chain_code)
+    write_bytes(w, d.public_key)
+
+
 def multisig_pubkey_index(multisig: MultisigRedeemScriptType, pubkey: bytes) -> int:
     if multisig.nodes:
         for i, hd in enumerate(multisig.nodes):
@@ -78,6 +133,21 @@ def multisig_pubkey_index(multisig: MultisigRedeemScriptType, pubkey: bytes) ->
 
 
 def multisig_get_pubkey(n: HDNodeType, p: list) -> bytes:
+    key = bytearray(n.public_key)
+    key.extend(n.chain_code)
+    for i in p:
+        write_uint32(key, i)
+    key = bytes(key)
+    pubkey = _pubkeys.get(key)
+    if pubkey is None:
+        pubkey = _derive_pubkey(n, p)
+        if len(_pubkeys) >= _pubkeys_limit:
+            _evict_one(_pubkeys)
+        _pubkeys[key] = pubkey
+    return pubkey
+
+
+def _derive_pubkey(n: HDNodeType, p: list) -> bytes:
     node = bip32.HDNode(
         depth=n.depth,
         fingerprint=n.fingerprint,
@@ -1,5 +1,6 @@
 from micropython import const
 
+import protobuf
 from trezor import utils
 from trezor.crypto import base58, bip32, cashaddr, der
 from trezor.crypto.curve import secp256k1
@@ -18,6 +19,7 @@ from apps.wallet.sign_tx import (
     addresses,
     decred,
     helpers,
+    legacy_cache,
     multisig,
     progress,
     scripts,
@@ -37,11 +39,80 @@ _BIP32_CHANGE_CHAIN = const(1)
 # use and still allow to quickly brute-force the correct bip32 path
 _BIP32_MAX_LAST_ELEMENT = const(1000000)
 
+# the maximum number of previous transaction output amounts kept in memory
+# during one signing session
+_PREVTX_CACHE_MAX_OUTPUTS = const(1000)
+
+# the maximum number of change output scripts kept between the phases
+_OUTPUT_SCRIPT_CACHE_SIZE = const(32)
+
 
 class SigningError(ValueError):
     pass
 
 
+class PrevTxCache:
+    """
+    Output amounts of previous transactions that were already streamed and
+    verified in this signing session, keyed by prev_hash.  Inputs spending
+    other outputs of the same previous transaction are then resolved without
+    requesting it from the host again.  Decoded hashes are bytearrays, which
+    are not hashable, so keys are stored as bytes.
+    """
+
+    def __init__(self, max_outputs: int = _PREVTX_CACHE_MAX_OUTPUTS):
+        self.amounts = {}
+        self.budget = max_outputs
+
+    def get(self, prev_hash: bytes, prev_index: int):
+        amounts = self.amounts.get(bytes(prev_hash))
+        if amounts is None or prev_index >= len(amounts):
+            return None
+        return amounts[prev_index]
+
+    def fits(self, outputs_cnt: int) -> bool:
+        return outputs_cnt <= self.budget
+
+    def add(self, prev_hash: bytes, amounts: list):
+        self.amounts[bytes(prev_hash)] = amounts
+        self.budget -= len(amounts)
+
+
+class OutputScriptCache:
+    """
+    Scripts of change outputs derived in Phase 1, keyed by output index.  An
+    entry is bound to the digest of the output it was derived from, so it is
+    only reused for the very same output in the later phases.
+    """
+
+    def __init__(self):
+        self.scripts = {}  # index -> (output digest, script_pubkey)
+
+    async def derive(
+        self,
+        index: int,
+        o: TxOutputType,
+        coin: coininfo.CoinInfo,
+        keychain: seed.Keychain,
+    ) -> bytes:
+        if not o.address_n:
+            # scripts of external outputs are cheap to compute
+            return output_derive_script(o, coin, keychain)
+
+        h = utils.HashWriter(sha256())
+        await protobuf.dump_message(h, o)
+        digest = h.get_digest()
+
+        entry = self.scripts.get(index)
+        if entry is not None and entry[0] == digest:
+            return entry[1]
+
+        script = output_derive_script(o, coin, keychain)
+        if entry is not None or len(self.scripts) < _OUTPUT_SCRIPT_CACHE_SIZE:
+            self.scripts[index] = (digest, script)
+        return script
+
+
 # Transaction signing
 # ===
 # see https://github.com/trezor/trezor-mcu/blob/master/firmware/signing.c#L84
@@ -53,7 +124,9 @@ class SigningError(ValueError):
 # - check inputs, previous transactions, and outputs
 # - ask for confirmations
 # - check fee
-async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
+async def check_tx_fee(
+    tx: SignTx, keychain: seed.Keychain, script_cache: OutputScriptCache
+):
     coin = coins.by_name(tx.coin_name)
 
     # h_first is used to make sure the inputs and outputs streamed in Phase 1
@@ -93,13 +166,24 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
     txo_bin = TxOutputBinType()
     tx_req = TxRequest()
     tx_req.details = TxRequestDetailsType()
+    prevtx_cache = PrevTxCache()
+
+    if coin.decred or coin.force_bip143 or tx.overwintered:
+        legacy = None
+    else:
+        # legacy signature hashes are computed from this copy in Phase 2
+        legacy = legacy_cache.LegacyCache(tx.inputs_count)
+
+    batch = helpers.input_batch(tx.batch_size, tx.inputs_count)
 
     for i in range(tx.inputs_count):
         progress.advance()
         # STAGE_REQUEST_1_INPUT
-        txi = await helpers.request_tx_input(tx_req, i)
+        txi = await helpers.request_tx_input(tx_req, i, None, batch)
         wallet_path = input_extract_wallet_path(txi, wallet_path)
         writers.write_tx_input_check(h_first, txi)
+        if legacy is not None:
+            legacy.add_input(txi)
         weight.add_input(txi)
         hash143.add_prevouts(txi)  # all inputs are included (non-segwit as well)
         hash143.add_sequence(txi)
@@ -139,7 +223,12 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
             else:
                 segwit[i] = False
                 total_in += await get_prevtx_output_value(
-                    coin, tx_req, txi.prev_hash, txi.prev_index
+                    coin,
+                    tx_req,
+                    txi.prev_hash,
+                    txi.prev_index,
+                    prevtx_cache,
+                    tx.batch_size,
                 )
 
         else:
@@ -153,14 +242,19 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
             tx_ser.serialized_tx = w_txi
             tx_req.serialized = tx_ser
 
+    if legacy is not None and all(segwit.values()):
+        legacy = None  # no input is signed with a legacy signature hash
+
     if coin.decred:
         hash143.add_output_count(tx)
 
+    batch = helpers.output_batch(tx.batch_size, tx.outputs_count)
+
     for o in range(tx.outputs_count):
         # STAGE_REQUEST_3_OUTPUT
-        txo = await helpers.request_tx_output(tx_req, o)
+        txo = await helpers.request_tx_output(tx_req, o, None, batch)
         txo_bin.amount = txo.amount
-        txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
+        txo_bin.script_pubkey = await script_cache.derive(o, txo, coin, keychain)
         weight.add_output(txo_bin.script_pubkey)
 
         if change_out == 0 and output_is_change(txo, wallet_path, segwit_in, multifp):
@@ -188,6 +282,8 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
             hash143.set_last_output_bytes(w_txo_bin)
 
         writers.write_tx_output(h_first, txo_bin)
+        if legacy is not None:
+            legacy.add_output(txo_bin)
         hash143.add_output(txo_bin)
         total_out += txo_bin.amount
 
@@ -206,18 +302,24 @@ async def check_tx_fee(tx: SignTx, keychain: seed.Keychain):
     if coin.decred:
         hash143.add_locktime_expiry(tx)
 
-    return h_first, hash143, segwit, total_in, wallet_path
+    if legacy is not None and not legacy.valid:
+        legacy = None  # too large to keep, inputs are streamed in Phase 2
+
+    return h_first, hash143, segwit, total_in, wallet_path, legacy
 
 
 async def sign_tx(tx: SignTx, keychain: seed.Keychain):
     tx = helpers.sanitize_sign_tx(tx)
 
     progress.init(tx.inputs_count, tx.outputs_count)
+    # cosigner caches are scoped to one signing session
+    multisig.clear_cache(tx.inputs_count)
 
     # Phase 1
 
-    h_first, hash143, segwit, authorized_in, wallet_path = await check_tx_fee(
-        tx, keychain
+    script_cache = OutputScriptCache()
+    h_first, hash143, segwit, authorized_in, wallet_path, legacy = await check_tx_fee(
+        tx, keychain, script_cache
     )
 
     # Phase 2
@@ -394,50 +496,65 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
                 if tx.timestamp:
                     writers.write_uint32(h_sign, tx.timestamp)
 
-            writers.write_varint(h_sign, tx.inputs_count)
-
-            for i in range(tx.inputs_count):
+            if legacy is not None:
                 # STAGE_REQUEST_4_INPUT
-                txi = await helpers.request_tx_input(tx_req, i)
-                input_check_wallet_path(txi, wallet_path)
-                writers.write_tx_input_check(h_second, txi)
-                if i == i_sign:
-                    txi_sign = txi
-                    key_sign = keychain.derive(txi.address_n, coin.curve_name)
-                    key_sign_pub = key_sign.public_key()
-                    # for the signing process the script_sig is equal
-                    # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
-                    if txi_sign.script_type == InputScriptType.SPENDMULTISIG:
-                        txi_sign.script_sig = scripts.output_script_multisig(
-                            multisig.multisig_get_pubkeys(txi_sign.multisig),
-                            txi_sign.multisig.m,
-                        )
-                    elif txi_sign.script_type == InputScriptType.SPENDADDRESS:
-                        txi_sign.script_sig = scripts.output_script_p2pkh(
-                            addresses.ecdsa_hash_pubkey(key_sign_pub, coin)
+                txi_sign = await helpers.request_tx_input(tx_req, i_sign)
+                input_check_wallet_path(txi_sign, wallet_path)
+                if not legacy.check_input(i_sign, txi_sign):
+                    raise SigningError(
+                        FailureType.ProcessError,
+                        "Transaction has changed during signing",
+                    )
+                key_sign = keychain.derive(txi_sign.address_n, coin.curve_name)
+                key_sign_pub = key_sign.public_key()
+                txi_sign.script_sig = input_derive_script_code(
+                    coin, txi_sign, key_sign_pub
+                )
+                legacy.write_inputs(h_sign, i_sign, txi_sign.script_sig)
+                legacy.write_outputs(h_sign)
+            else:
+                writers.write_varint(h_sign, tx.inputs_count)
+
+                batch = helpers.input_batch(tx.batch_size, tx.inputs_count)
+
+                for i in range(tx.inputs_count):
+                    # STAGE_REQUEST_4_INPUT
+                    txi = await helpers.request_tx_input(tx_req, i, None, batch)
+                    input_check_wallet_path(txi, wallet_path)
+                    writers.write_tx_input_check(h_second, txi)
+                    if i == i_sign:
+                        txi_sign = txi
+                        key_sign = keychain.derive(txi.address_n, coin.curve_name)
+                        key_sign_pub = key_sign.public_key()
+                        # for the signing process the script_sig is equal
+                        # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
+                        txi_sign.script_sig = input_derive_script_code(
+                            coin, txi_sign, key_sign_pub
                         )
-                        if coin.bip115:
-                            txi_sign.script_sig += scripts.script_replay_protection_bip115(
-                                txi_sign.prev_block_hash_bip115,
-                                txi_sign.prev_block_height_bip115,
-                            )
                     else:
-                        raise SigningError(
-                            FailureType.ProcessError, "Unknown transaction type"
-                        )
-                else:
-                    txi.script_sig = bytes()
-                writers.write_tx_input(h_sign, txi)
+                        txi.script_sig = bytes()
+                    writers.write_tx_input(h_sign, txi)
+
+                writers.write_varint(h_sign, tx.outputs_count)
+
+                batch = helpers.output_batch(tx.batch_size, tx.outputs_count)
 
-            writers.write_varint(h_sign, tx.outputs_count)
+                for o in range(tx.outputs_count):
+                    # STAGE_REQUEST_4_OUTPUT
+                    txo = await helpers.request_tx_output(tx_req, o, None, batch)
+                    txo_bin.amount = txo.amount
+                    txo_bin.script_pubkey = await script_cache.derive(
+                        o, txo, coin, keychain
+                    )
+                    writers.write_tx_output(h_second, txo_bin)
+                    writers.write_tx_output(h_sign, txo_bin)
 
-            for o in range(tx.outputs_count):
-                # STAGE_REQUEST_4_OUTPUT
-                txo = await helpers.request_tx_output(tx_req, o)
-                txo_bin.amount = txo.amount
-                txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
-                writers.write_tx_output(h_second, txo_bin)
-                writers.write_tx_output(h_sign, txo_bin)
+                # check the control digests
+                if writers.get_tx_hash(h_first, False) != writers.get_tx_hash(h_second):
+                    raise SigningError(
+                        FailureType.ProcessError,
+                        "Transaction has changed during signing",
+                    )
 
             writers.write_uint32(h_sign, tx.lock_time)
             if tx.overwintered:
@@ -446,12 +563,6 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
 
             writers.write_uint32(h_sign, get_hash_type(coin))
 
-            # check the control digests
-            if writers.get_tx_hash(h_first, False) != writers.get_tx_hash(h_second):
-                raise SigningError(
-                    FailureType.ProcessError, "Transaction has changed during signing"
-                )
-
             # if multisig, check if signing with a key that is included in multisig
             if txi_sign.multisig:
                 multisig.multisig_pubkey_index(txi_sign.multisig, key_sign_pub)
@@ -485,7 +596,7 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
         # STAGE_REQUEST_5_OUTPUT
         txo = await helpers.request_tx_output(tx_req, o)
         txo_bin.amount = txo.amount
-        txo_bin.script_pubkey = output_derive_script(txo, coin, keychain)
+        txo_bin.script_pubkey = await script_cache.derive(o, txo, coin, keychain)
 
         # serialize output
         w_txo_bin = writers.empty_bytearray(5 + 8 + 5 + len(txo_bin.script_pubkey) + 4)
@@ -570,8 +681,18 @@ async def sign_tx(tx: SignTx, keychain: seed.Keychain):
 
 
 async def get_prevtx_output_value(
-    coin: coininfo.CoinInfo, tx_req: TxRequest, prev_hash: bytes, prev_index: int
+    coin: coininfo.CoinInfo,
+    tx_req: TxRequest,
+    prev_hash: bytes,
+    prev_index: int,
+    cache: PrevTxCache = None,
+    batch_size: int = None,
 ) -> int:
+    if cache is not None:
+        amount = cache.get(prev_hash, prev_index)
+        if amount is not None:
+            return amount
+
     total_out = 0  # sum of output amounts
 
     # STAGE_REQUEST_2_PREV_META
@@ -596,9 +717,11 @@ async def get_prevtx_output_value(
 
     writers.write_varint(txh, tx.inputs_cnt)
 
+    batch = helpers.input_batch(batch_size, tx.inputs_cnt)
+
     for i in range(tx.inputs_cnt):
         # STAGE_REQUEST_2_PREV_INPUT
-        txi = await helpers.request_tx_input(tx_req, i, prev_hash)
+        txi = await helpers.request_tx_input(tx_req, i, prev_hash, batch)
         if coin.decred:
             writers.write_tx_input_decred(txh, txi)
         else:
@@ -606,21 +729,34 @@ async def get_prevtx_output_value(
 
     writers.write_varint(txh, tx.outputs_cnt)
 
+    # amounts of all outputs, so other inputs spending this tx can be resolved
+    # from the cache.  unspendable outputs are stored as None, so they are
+    # streamed again and rejected
+    if cache is not None and cache.fits(tx.outputs_cnt):
+        amounts = []
+    else:
+        amounts = None
+
+    batch = helpers.output_batch(batch_size, tx.outputs_cnt)
+
     for o in range(tx.outputs_cnt):
         # STAGE_REQUEST_2_PREV_OUTPUT
-        txo_bin = await helpers.request_tx_output(tx_req, o, prev_hash)
+        txo_bin = await helpers.request_tx_output(tx_req, o, prev_hash, batch)
         writers.write_tx_output(txh, txo_bin)
+        unspendable = (
+            coin.decred
+            and txo_bin.decred_script_version is not None
+            and txo_bin.decred_script_version != 0
+        )
         if o == prev_index:
             total_out += txo_bin.amount
-            if (
-                coin.decred
-                and txo_bin.decred_script_version is not None
-                and txo_bin.decred_script_version != 0
-            ):
+            if unspendable:
                 raise SigningError(
                     FailureType.ProcessError,
                     "Cannot use utxo that has script_version != 0",
                 )
+        if amounts is not None:
+            amounts.append(None if unspendable else txo_bin.amount)
 
     writers.write_uint32(txh, tx.lock_time)
 
@@ -640,6 +776,10 @@ async def get_prevtx_output_value(
     ):
         raise SigningError(FailureType.ProcessError, "Encountered invalid prev_hash")
 
+    # only amounts of a verified prev tx are cached
+    if amounts is not None:
+        cache.add(prev_hash, amounts)
+
     return total_out
 
 
@@ -830,6 +970,27 @@ def input_derive_script(
         raise SigningError(FailureType.ProcessError, "Invalid script type")
 
 
+def input_derive_script_code(
+    coin: coininfo.CoinInfo, i: TxInputType, pubkey: bytes
+) -> bytes:
+    # the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
+    if i.script_type == InputScriptType.SPENDMULTISIG:
+        return scripts.output_script_multisig(
+            multisig.multisig_get_pubkeys(i.multisig), i.multisig.m
+        )
+    elif i.script_type == InputScriptType.SPENDADDRESS:
+        script_code = scripts.output_script_p2pkh(
+            addresses.ecdsa_hash_pubkey(pubkey, coin)
+        )
+        if coin.bip115:
+            script_code += scripts.script_replay_protection_bip115(
+                i.prev_block_hash_bip115, i.prev_block_height_bip115
+            )
+        return script_code
+    else:
+        raise SigningError(FailureType.ProcessError, "Unknown transaction type")
+
+
 def input_is_segwit(i: TxInputType) -> bool:
     return (
         i.script_type == InputScriptType.SPENDWITNESS
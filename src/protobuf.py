@@ -10,6 +10,16 @@ interface is required:
 >>>         """
 >>>         Reads `len(buffer)` bytes into `buffer`, or raises `EOFError`.
 >>>         """
+>>>
+>>>     async def askip(self, n):
+>>>         """
+>>>         Skips `n` bytes without reading them, or raises `EOFError`.
+>>>         """
+>>>
+>>>     def readbyte(self):
+>>>         """
+>>>         Returns the next byte if it is available without waiting, or -1.
+>>>         """
 
 For serializing (dumping) protobuf types, object with `AsyncWriter` interface is
 required:
@@ -23,20 +33,32 @@ required:
 
 from micropython import const
 
+from trezor.utils import memcpy
+
 _UVARINT_BUFFER = bytearray(1)
 
 
-async def load_uvarint(reader):
+async def load_uvarint(reader, byte=-1):
+    """
+    Load an unsigned varint from `reader`.  Bytes that are already buffered in
+    the reader are consumed directly, the reader is awaited only on a report
+    boundary.  `byte` can carry the first byte of the varint, if the caller
+    has already consumed it.
+    """
     buffer = _UVARINT_BUFFER
     result = 0
     shift = 0
-    byte = 0x80
-    while byte & 0x80:
-        await reader.areadinto(buffer)
-        byte = buffer[0]
+    while True:
+        if byte < 0:
+            byte = reader.readbyte()
+        if byte < 0:
+            await reader.areadinto(buffer)
+            byte = buffer[0]
         result += (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
         shift += 7
-    return result
+        byte = -1
 
 
 async def dump_uvarint(writer, n):
@@ -133,16 +155,36 @@ class UnicodeType:
 class MessageType:
     WIRE_TYPE = 2
 
+    _plan = None  # compiled serialization plan, see get_plan()
+
     @classmethod
     def get_fields(cls):
         return {}
 
+    @classmethod
+    def get_plan(cls):
+        """
+        Return the fields compiled into a tuple of `(name, key, kind, type,
+        repeated)` entries ordered by tag.  The plan is built on first use and
+        cached on the message class.
+        """
+        plan = cls._plan
+        if plan is None:
+            plan = cls._plan = _compile_plan(cls.get_fields())
+        return plan
+
     def __init__(self, **kwargs):
         for kw in kwargs:
             setattr(self, kw, kwargs[kw])
 
     def __eq__(self, rhs):
-        return self.__class__ is rhs.__class__ and self.__dict__ == rhs.__dict__
+        # unset fields compare by their class-level defaults
+        if self.__class__ is not rhs.__class__:
+            return False
+        for field in self.get_plan():
+            if getattr(self, field[0]) != getattr(rhs, field[0]):
+                return False
+        return True
 
     def __repr__(self):
         return "<%s>" % self.__class__.__name__
@@ -161,6 +203,21 @@ class LimitedReader:
             self.limit -= nread
             return nread
 
+    async def askip(self, n):
+        if self.limit < n:
+            raise EOFError
+        else:
+            await self.reader.askip(n)
+            self.limit -= n
+
+    def readbyte(self):
+        if self.limit < 1:
+            return -1
+        byte = self.reader.readbyte()
+        if byte >= 0:
+            self.limit -= 1
+        return byte
+
 
 class CountingWriter:
     def __init__(self):
@@ -180,10 +237,13 @@ async def load_message(reader, msg_type):
     msg = msg_type()
 
     while True:
-        try:
-            fkey = await load_uvarint(reader)
-        except EOFError:
-            break  # no more fields to load
+        # most keys fit into a single byte, try to avoid the coroutine call
+        fkey = reader.readbyte()
+        if fkey < 0 or fkey & 0x80:
+            try:
+                fkey = await load_uvarint(reader, fkey)
+            except EOFError:
+                break  # no more fields to load
 
         ftag = fkey >> 3
         wtype = fkey & 7
@@ -195,7 +255,7 @@ async def load_message(reader, msg_type):
                 await load_uvarint(reader)
             elif wtype == 2:
                 ivalue = await load_uvarint(reader)
-                await reader.areadinto(bytearray(ivalue))
+                await reader.askip(ivalue)
             else:
                 raise ValueError
             continue
@@ -204,7 +264,9 @@ async def load_message(reader, msg_type):
         if wtype != ftype.WIRE_TYPE:
             raise TypeError  # parsed wire type differs from the schema
 
-        ivalue = await load_uvarint(reader)
+        ivalue = reader.readbyte()
+        if ivalue < 0 or ivalue & 0x80:
+            ivalue = await load_uvarint(reader, ivalue)
 
         if ftype is UVarintType:
             fvalue = ivalue
@@ -230,109 +292,191 @@ async def load_message(reader, msg_type):
             fvalue = pvalue
         setattr(msg, fname, fvalue)
 
-    # fill missing fields
-    for tag in fields:
-        field = fields[tag]
-        if not hasattr(msg, field[0]):
-            setattr(msg, field[0], None)
-
+    # missing fields fall back to the class-level defaults
     return msg
 
 
-async def dump_message(writer, msg, fields=None):
-    repvalue = [0]
+# Field kinds of the compiled serialization plan, see `MessageType.get_plan()`.
+_KIND_UVARINT = const(0)
+_KIND_SVARINT = const(1)
+_KIND_BOOL = const(2)
+_KIND_BYTES = const(3)
+_KIND_UNICODE = const(4)
+_KIND_MESSAGE = const(5)
 
-    if fields is None:
-        fields = msg.get_fields()
 
-    for ftag in fields:
+def _compile_plan(fields):
+    plan = []
+    for ftag in sorted(fields):
         fname, ftype, fflags = fields[ftag]
+        if ftype is UVarintType:
+            kind = _KIND_UVARINT
+        elif ftype is SVarintType:
+            kind = _KIND_SVARINT
+        elif ftype is BoolType:
+            kind = _KIND_BOOL
+        elif ftype is BytesType:
+            kind = _KIND_BYTES
+        elif ftype is UnicodeType:
+            kind = _KIND_UNICODE
+        elif issubclass(ftype, MessageType):
+            kind = _KIND_MESSAGE
+        else:
+            raise TypeError  # field type is unknown
+        fkey = (ftag << 3) | ftype.WIRE_TYPE
+        plan.append((fname, fkey, kind, ftype, fflags & FLAG_REPEATED))
+    return tuple(plan)
+
+
+_ENCODE_BUFFER_SIZE = const(64)  # size of one HID report
+_ENCODE_BUFFER_SLACK = const(20)  # space for a field key and a varint value
+
+
+class _Encoder:
+    """
+    Buffers small writes of `dump_message` into a report-sized buffer, so the
+    underlying writer is awaited once per buffer instead of once per field.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.buf = bytearray(_ENCODE_BUFFER_SIZE)
+        self.ofs = 0
+
+    def uvarint(self, n):
+        if n < 0:
+            raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+        buf = self.buf
+        ofs = self.ofs
+        shifted = True
+        while shifted:
+            shifted = n >> 7
+            buf[ofs] = (n & 0x7F) | (0x80 if shifted else 0x00)
+            ofs += 1
+            n = shifted
+        self.ofs = ofs
+
+    async def reserve(self):
+        # make sure there is space for a key and a varint in the buffer
+        if self.ofs > _ENCODE_BUFFER_SIZE - _ENCODE_BUFFER_SLACK:
+            await self.flush()
+
+    async def write(self, data):
+        n = len(data)
+        if self.ofs + n <= _ENCODE_BUFFER_SIZE:
+            self.ofs += memcpy(self.buf, self.ofs, data, 0, n)
+        else:
+            await self.flush()
+            await self.writer.awrite(data)
 
+    async def flush(self):
+        if self.ofs:
+            await self.writer.awrite(memoryview(self.buf)[: self.ofs])
+            self.ofs = 0
+
+
+async def dump_message(writer, msg, sizes=None):
+    """
+    Serialize `msg` into `writer`.  `sizes` are the nested message sizes
+    recorded by `count_message`; they are computed if not given.
+    """
+    if sizes is None:
+        sizes = []
+        count_message(msg, sizes)
+    encoder = _Encoder(writer)
+    await _dump_message(encoder, msg, msg.get_plan(), sizes, 0)
+    await encoder.flush()
+
+
+async def _dump_message(encoder, msg, plan, sizes, index):
+    repvalue = [0]
+
+    for fname, fkey, kind, ftype, repeated in plan:
         fvalue = getattr(msg, fname, None)
         if fvalue is None:
             continue
 
-        fkey = (ftag << 3) | ftype.WIRE_TYPE
-
-        if not fflags & FLAG_REPEATED:
+        if not repeated:
             repvalue[0] = fvalue
             fvalue = repvalue
 
-        if issubclass(ftype, MessageType):
-            ffields = ftype.get_fields()
-        else:
-            ffields = None
+        if kind == _KIND_MESSAGE:
+            fplan = ftype.get_plan()
 
         for svalue in fvalue:
-            await dump_uvarint(writer, fkey)
+            await encoder.reserve()
+            encoder.uvarint(fkey)
 
-            if ftype is UVarintType:
-                await dump_uvarint(writer, svalue)
+            if kind == _KIND_UVARINT:
+                encoder.uvarint(svalue)
 
-            elif ftype is SVarintType:
-                await dump_uvarint(writer, sint_to_uint(svalue))
+            elif kind == _KIND_SVARINT:
+                encoder.uvarint(sint_to_uint(svalue))
 
-            elif ftype is BoolType:
-                await dump_uvarint(writer, int(svalue))
+            elif kind == _KIND_BOOL:
+                encoder.uvarint(int(svalue))
 
-            elif ftype is BytesType:
+            elif kind == _KIND_BYTES:
                 if isinstance(svalue, list):
-                    await dump_uvarint(writer, _count_bytes_list(svalue))
+                    encoder.uvarint(_count_bytes_list(svalue))
                     for sub_svalue in svalue:
-                        await writer.awrite(sub_svalue)
+                        await encoder.write(sub_svalue)
                 else:
-                    await dump_uvarint(writer, len(svalue))
-                    await writer.awrite(svalue)
+                    encoder.uvarint(len(svalue))
+                    await encoder.write(svalue)
 
-            elif ftype is UnicodeType:
+            elif kind == _KIND_UNICODE:
                 svalue = svalue.encode()
-                await dump_uvarint(writer, len(svalue))
-                await writer.awrite(svalue)
+                encoder.uvarint(len(svalue))
+                await encoder.write(svalue)
 
-            elif issubclass(ftype, MessageType):
-                await dump_uvarint(writer, count_message(svalue, ffields))
-                await dump_message(writer, svalue, ffields)
+            else:  # _KIND_MESSAGE
+                encoder.uvarint(sizes[index])
+                index = await _dump_message(encoder, svalue, fplan, sizes, index + 1)
 
-            else:
-                raise TypeError
+    return index
 
 
-def count_message(msg, fields=None):
-    nbytes = 0
-    repvalue = [0]
+def count_message(msg, sizes=None):
+    """
+    Return the serialized size of `msg`.  Sizes of all nested messages are
+    computed bottom-up in the same pass and, if `sizes` is a list, appended to
+    it in the order `dump_message` consumes them.
+    """
+    if sizes is None:
+        sizes = []
+    return _count_message(msg, msg.get_plan(), sizes)
 
-    if fields is None:
-        fields = msg.get_fields()
 
-    for ftag in fields:
-        fname, ftype, fflags = fields[ftag]
+def _count_message(msg, plan, sizes):
+    nbytes = 0
+    repvalue = [0]
 
+    for fname, fkey, kind, ftype, repeated in plan:
         fvalue = getattr(msg, fname, None)
         if fvalue is None:
             continue
 
-        fkey = (ftag << 3) | ftype.WIRE_TYPE
-
-        if not fflags & FLAG_REPEATED:
+        if not repeated:
             repvalue[0] = fvalue
             fvalue = repvalue
 
         # length of all the field keys
         nbytes += count_uvarint(fkey) * len(fvalue)
 
-        if ftype is UVarintType:
+        if kind == _KIND_UVARINT:
             for svalue in fvalue:
                 nbytes += count_uvarint(svalue)
 
-        elif ftype is SVarintType:
+        elif kind == _KIND_SVARINT:
             for svalue in fvalue:
                 nbytes += count_uvarint(sint_to_uint(svalue))
 
-        elif ftype is BoolType:
+        elif kind == _KIND_BOOL:
             for svalue in fvalue:
                 nbytes += count_uvarint(int(svalue))
 
-        elif ftype is BytesType:
+        elif kind == _KIND_BYTES:
             for svalue in fvalue:
                 if isinstance(svalue, list):
                     svalue = _count_bytes_list(svalue)
@@ -341,22 +485,22 @@ def count_message(msg, fields=None):
                 nbytes += count_uvarint(svalue)
                 nbytes += svalue
 
-        elif ftype is UnicodeType:
+        elif kind == _KIND_UNICODE:
             for svalue in fvalue:
                 svalue = len(svalue.encode())
                 nbytes += count_uvarint(svalue)
                 nbytes += svalue
 
-        elif issubclass(ftype, MessageType):
-            ffields = ftype.get_fields()
+        else:  # _KIND_MESSAGE
+            fplan = ftype.get_plan()
             for svalue in fvalue:
-                fsize = count_message(svalue, ffields)
+                # reserve the slot first, nested sizes follow in pre-order
+                index = len(sizes)
+                sizes.append(0)
+                fsize = _count_message(svalue, fplan, sizes)
+                sizes[index] = fsize
                 nbytes += count_uvarint(fsize)
                 nbytes += fsize
-            del ffields
-
-        else:
-            raise TypeError
 
     return nbytes
 
@@ -0,0 +1,25 @@
+# Automatically generated by pb2py
+# fmt: off
+import protobuf as p
+
+if __debug__:
+    try:
+        from typing import List
+    except ImportError:
+        List = None  # type: ignore
+
+
+class Addresses(p.MessageType):
+    MESSAGE_WIRE_TYPE = 30001
+
+    def __init__(
+        self,
+        addresses: List[str] = None,
+    ) -> None:
+        self.addresses = addresses if addresses is not None else []
+
+    @classmethod
+    def get_fields(cls):
+        return {
+            1: ('addresses', p.UnicodeType, p.FLAG_REPEATED),
+        }
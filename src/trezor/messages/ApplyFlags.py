@@ -5,12 +5,14 @@ import protobuf as p
 
 class ApplyFlags(p.MessageType):
     MESSAGE_WIRE_TYPE = 28
+    flags = None
 
     def __init__(
         self,
         flags: int = None,
     ) -> None:
-        self.flags = flags
+        if flags is not None:
+            self.flags = flags
 
     @classmethod
     def get_fields(cls):
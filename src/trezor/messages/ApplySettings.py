@@ -5,6 +5,12 @@ import protobuf as p
 
 class ApplySettings(p.MessageType):
     MESSAGE_WIRE_TYPE = 25
+    language = None
+    label = None
+    use_passphrase = None
+    homescreen = None
+    passphrase_source = None
+    auto_lock_delay_ms = None
 
     def __init__(
         self,
@@ -15,12 +21,18 @@ class ApplySettings(p.MessageType):
         passphrase_source: int = None,
         auto_lock_delay_ms: int = None,
     ) -> None:
-        self.language = language
-        self.label = label
-        self.use_passphrase = use_passphrase
-        self.homescreen = homescreen
-        self.passphrase_source = passphrase_source
-        self.auto_lock_delay_ms = auto_lock_delay_ms
+        if language is not None:
+            self.language = language
+        if label is not None:
+            self.label = label
+        if use_passphrase is not None:
+            self.use_passphrase = use_passphrase
+        if homescreen is not None:
+            self.homescreen = homescreen
+        if passphrase_source is not None:
+            self.passphrase_source = passphrase_source
+        if auto_lock_delay_ms is not None:
+            self.auto_lock_delay_ms = auto_lock_delay_ms
 
     @classmethod
     def get_fields(cls):
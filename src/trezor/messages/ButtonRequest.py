@@ -5,14 +5,18 @@ import protobuf as p
 
 class ButtonRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 26
+    code = None
+    data = None
 
     def __init__(
         self,
         code: int = None,
         data: str = None,
     ) -> None:
-        self.code = code
-        self.data = data
+        if code is not None:
+            self.code = code
+        if data is not None:
+            self.data = data
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class CardanoAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 308
+    address = None
 
     def __init__(
         self,
         address: str = None,
     ) -> None:
-        self.address = address
+        if address is not None:
+            self.address = address
 
     @classmethod
     def get_fields(cls):
@@ -7,14 +7,18 @@ from .HDNodeType import HDNodeType
 
 class CardanoPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 306
+    xpub = None
+    node = None
 
     def __init__(
         self,
         xpub: str = None,
         node: HDNodeType = None,
     ) -> None:
-        self.xpub = xpub
-        self.node = node
+        if xpub is not None:
+            self.xpub = xpub
+        if node is not None:
+            self.node = node
 
     @classmethod
     def get_fields(cls):
@@ -14,6 +14,8 @@ if __debug__:
 
 class CardanoSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 303
+    transactions_count = None
+    protocol_magic = None
 
     def __init__(
         self,
@@ -24,8 +26,10 @@ class CardanoSignTx(p.MessageType):
     ) -> None:
         self.inputs = inputs if inputs is not None else []
         self.outputs = outputs if outputs is not None else []
-        self.transactions_count = transactions_count
-        self.protocol_magic = protocol_magic
+        if transactions_count is not None:
+            self.transactions_count = transactions_count
+        if protocol_magic is not None:
+            self.protocol_magic = protocol_magic
 
     @classmethod
     def get_fields(cls):
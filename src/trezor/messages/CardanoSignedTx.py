@@ -5,14 +5,18 @@ import protobuf as p
 
 class CardanoSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 310
+    tx_hash = None
+    tx_body = None
 
     def __init__(
         self,
         tx_hash: bytes = None,
         tx_body: bytes = None,
     ) -> None:
-        self.tx_hash = tx_hash
-        self.tx_body = tx_body
+        if tx_hash is not None:
+            self.tx_hash = tx_hash
+        if tx_body is not None:
+            self.tx_body = tx_body
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class CardanoTxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 309
+    transaction = None
 
     def __init__(
         self,
         transaction: bytes = None,
     ) -> None:
-        self.transaction = transaction
+        if transaction is not None:
+            self.transaction = transaction
 
     @classmethod
     def get_fields(cls):
@@ -10,6 +10,9 @@ if __debug__:
 
 
 class CardanoTxInputType(p.MessageType):
+    prev_hash = None
+    prev_index = None
+    type = None
 
     def __init__(
         self,
@@ -19,9 +22,12 @@ class CardanoTxInputType(p.MessageType):
         type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.prev_hash = prev_hash
-        self.prev_index = prev_index
-        self.type = type
+        if prev_hash is not None:
+            self.prev_hash = prev_hash
+        if prev_index is not None:
+            self.prev_index = prev_index
+        if type is not None:
+            self.type = type
 
     @classmethod
     def get_fields(cls):
@@ -10,6 +10,8 @@ if __debug__:
 
 
 class CardanoTxOutputType(p.MessageType):
+    address = None
+    amount = None
 
     def __init__(
         self,
@@ -17,9 +19,11 @@ class CardanoTxOutputType(p.MessageType):
         address_n: List[int] = None,
         amount: int = None,
     ) -> None:
-        self.address = address
+        if address is not None:
+            self.address = address
         self.address_n = address_n if address_n is not None else []
-        self.amount = amount
+        if amount is not None:
+            self.amount = amount
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class CardanoTxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 304
+    tx_index = None
+    tx_hash = None
+    tx_body = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class CardanoTxRequest(p.MessageType):
         tx_hash: bytes = None,
         tx_body: bytes = None,
     ) -> None:
-        self.tx_index = tx_index
-        self.tx_hash = tx_hash
-        self.tx_body = tx_body
+        if tx_index is not None:
+            self.tx_index = tx_index
+        if tx_hash is not None:
+            self.tx_hash = tx_hash
+        if tx_body is not None:
+            self.tx_body = tx_body
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class ChangePin(p.MessageType):
     MESSAGE_WIRE_TYPE = 4
+    remove = None
 
     def __init__(
         self,
         remove: bool = None,
     ) -> None:
-        self.remove = remove
+        if remove is not None:
+            self.remove = remove
 
     @classmethod
     def get_fields(cls):
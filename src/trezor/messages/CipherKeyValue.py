@@ -11,6 +11,12 @@ if __debug__:
 
 class CipherKeyValue(p.MessageType):
     MESSAGE_WIRE_TYPE = 23
+    key = None
+    value = None
+    encrypt = None
+    ask_on_encrypt = None
+    ask_on_decrypt = None
+    iv = None
 
     def __init__(
         self,
@@ -23,12 +29,18 @@ class CipherKeyValue(p.MessageType):
         iv: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.key = key
-        self.value = value
-        self.encrypt = encrypt
-        self.ask_on_encrypt = ask_on_encrypt
-        self.ask_on_decrypt = ask_on_decrypt
-        self.iv = iv
+        if key is not None:
+            self.key = key
+        if value is not None:
+            self.value = value
+        if encrypt is not None:
+            self.encrypt = encrypt
+        if ask_on_encrypt is not None:
+            self.ask_on_encrypt = ask_on_encrypt
+        if ask_on_decrypt is not None:
+            self.ask_on_decrypt = ask_on_decrypt
+        if iv is not None:
+            self.iv = iv
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class CipheredKeyValue(p.MessageType):
     MESSAGE_WIRE_TYPE = 48
+    value = None
 
     def __init__(
         self,
         value: bytes = None,
     ) -> None:
-        self.value = value
+        if value is not None:
+            self.value = value
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,7 @@ if __debug__:
 
 class CosiCommit(p.MessageType):
     MESSAGE_WIRE_TYPE = 71
+    data = None
 
     def __init__(
         self,
@@ -18,7 +19,8 @@ class CosiCommit(p.MessageType):
         data: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.data = data
+        if data is not None:
+            self.data = data
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class CosiCommitment(p.MessageType):
     MESSAGE_WIRE_TYPE = 72
+    commitment = None
+    pubkey = None
 
     def __init__(
         self,
         commitment: bytes = None,
         pubkey: bytes = None,
     ) -> None:
-        self.commitment = commitment
-        self.pubkey = pubkey
+        if commitment is not None:
+            self.commitment = commitment
+        if pubkey is not None:
+            self.pubkey = pubkey
 
     @classmethod
     def get_fields(cls):
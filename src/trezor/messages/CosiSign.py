@@ -11,6 +11,9 @@ if __debug__:
 
 class CosiSign(p.MessageType):
     MESSAGE_WIRE_TYPE = 73
+    data = None
+    global_commitment = None
+    global_pubkey = None
 
     def __init__(
         self,
@@ -20,9 +23,12 @@ class CosiSign(p.MessageType):
         global_pubkey: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.data = data
-        self.global_commitment = global_commitment
-        self.global_pubkey = global_pubkey
+        if data is not None:
+            self.data = data
+        if global_commitment is not None:
+            self.global_commitment = global_commitment
+        if global_pubkey is not None:
+            self.global_pubkey = global_pubkey
 
     @classmethod
     def get_fields(cls):
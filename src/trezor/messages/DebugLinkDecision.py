@@ -5,6 +5,9 @@ import protobuf as p
 
 class DebugLinkDecision(p.MessageType):
     MESSAGE_WIRE_TYPE = 100
+    yes_no = None
+    up_down = None
+    input = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class DebugLinkDecision(p.MessageType):
         up_down: bool = None,
         input: str = None,
     ) -> None:
-        self.yes_no = yes_no
-        self.up_down = up_down
-        self.input = input
+        if yes_no is not None:
+            self.yes_no = yes_no
+        if up_down is not None:
+            self.up_down = up_down
+        if input is not None:
+            self.input = input
 
     @classmethod
     def get_fields(cls):
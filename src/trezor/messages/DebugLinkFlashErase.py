@@ -5,12 +5,14 @@ import protobuf as p
 
 class DebugLinkFlashErase(p.MessageType):
     MESSAGE_WIRE_TYPE = 113
+    sector = None
 
     def __init__(
         self,
         sector: int = None,
     ) -> None:
-        self.sector = sector
+        if sector is not None:
+            self.sector = sector
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class DebugLinkLog(p.MessageType):
     MESSAGE_WIRE_TYPE = 104
+    level = None
+    bucket = None
+    text = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class DebugLinkLog(p.MessageType):
         bucket: str = None,
         text: str = None,
     ) -> None:
-        self.level = level
-        self.bucket = bucket
-        self.text = text
+        if level is not None:
+            self.level = level
+        if bucket is not None:
+            self.bucket = bucket
+        if text is not None:
+            self.text = text
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class DebugLinkMemory(p.MessageType):
     MESSAGE_WIRE_TYPE = 111
+    memory = None
 
     def __init__(
         self,
         memory: bytes = None,
     ) -> None:
-        self.memory = memory
+        if memory is not None:
+            self.memory = memory
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class DebugLinkMemoryRead(p.MessageType):
     MESSAGE_WIRE_TYPE = 110
+    address = None
+    length = None
 
     def __init__(
         self,
         address: int = None,
         length: int = None,
     ) -> None:
-        self.address = address
-        self.length = length
+        if address is not None:
+            self.address = address
+        if length is not None:
+            self.length = length
 
     @classmethod
     def get_fields(cls):
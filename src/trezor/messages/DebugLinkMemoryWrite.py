@@ -5,6 +5,9 @@ import protobuf as p
 
 class DebugLinkMemoryWrite(p.MessageType):
     MESSAGE_WIRE_TYPE = 112
+    address = None
+    memory = None
+    flash = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class DebugLinkMemoryWrite(p.MessageType):
         memory: bytes = None,
         flash: bool = None,
     ) -> None:
-        self.address = address
-        self.memory = memory
-        self.flash = flash
+        if address is not None:
+            self.address = address
+        if memory is not None:
+            self.memory = memory
+        if flash is not None:
+            self.flash = flash
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,18 @@ from .HDNodeType import HDNodeType
 
 class DebugLinkState(p.MessageType):
     MESSAGE_WIRE_TYPE = 102
+    layout = None
+    pin = None
+    matrix = None
+    mnemonic_secret = None
+    node = None
+    passphrase_protection = None
+    reset_word = None
+    reset_entropy = None
+    recovery_fake_word = None
+    recovery_word_pos = None
+    reset_word_pos = None
+    mnemonic_type = None
 
     def __init__(
         self,
@@ -23,18 +35,30 @@ class DebugLinkState(p.MessageType):
         reset_word_pos: int = None,
         mnemonic_type: int = None,
     ) -> None:
-        self.layout = layout
-        self.pin = pin
-        self.matrix = matrix
-        self.mnemonic_secret = mnemonic_secret
-        self.node = node
-        self.passphrase_protection = passphrase_protection
-        self.reset_word = reset_word
-        self.reset_entropy = reset_entropy
-        self.recovery_fake_word = recovery_fake_word
-        self.recovery_word_pos = recovery_word_pos
-        self.reset_word_pos = reset_word_pos
-        self.mnemonic_type = mnemonic_type
+        if layout is not None:
+            self.layout = layout
+        if pin is not None:
+            self.pin = pin
+        if matrix is not None:
+            self.matrix = matrix
+        if mnemonic_secret is not None:
+            self.mnemonic_secret = mnemonic_secret
+        if node is not None:
+            self.node = node
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
+        if reset_word is not None:
+            self.reset_word = reset_word
+        if reset_entropy is not None:
+            self.reset_entropy = reset_entropy
+        if recovery_fake_word is not None:
+            self.recovery_fake_word = recovery_fake_word
+        if recovery_word_pos is not None:
+            self.recovery_word_pos = recovery_word_pos
+        if reset_word_pos is not None:
+            self.reset_word_pos = reset_word_pos
+        if mnemonic_type is not None:
+            self.mnemonic_type = mnemonic_type
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,11 @@ if __debug__:
 
 class DebugMoneroDiagAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 547
+    ins = None
+    p1 = None
+    p2 = None
+    data1 = None
+    data2 = None
 
     def __init__(
         self,
@@ -21,12 +26,17 @@ class DebugMoneroDiagAck(p.MessageType):
         data1: bytes = None,
         data2: bytes = None,
     ) -> None:
-        self.ins = ins
-        self.p1 = p1
-        self.p2 = p2
+        if ins is not None:
+            self.ins = ins
+        if p1 is not None:
+            self.p1 = p1
+        if p2 is not None:
+            self.p2 = p2
         self.pd = pd if pd is not None else []
-        self.data1 = data1
-        self.data2 = data2
+        if data1 is not None:
+            self.data1 = data1
+        if data2 is not None:
+            self.data2 = data2
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class ECDHSessionKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 62
+    session_key = None
 
     def __init__(
         self,
         session_key: bytes = None,
     ) -> None:
-        self.session_key = session_key
+        if session_key is not None:
+            self.session_key = session_key
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class Entropy(p.MessageType):
     MESSAGE_WIRE_TYPE = 10
+    entropy = None
 
     def __init__(
         self,
         entropy: bytes = None,
     ) -> None:
-        self.entropy = entropy
+        if entropy is not None:
+            self.entropy = entropy
 
     @classmethod
     def get_fields(cls):
@@ -6,6 +6,9 @@ from .EosAsset import EosAsset
 
 
 class EosActionBuyRam(p.MessageType):
+    payer = None
+    receiver = None
+    quantity = None
 
     def __init__(
         self,
@@ -13,9 +16,12 @@ class EosActionBuyRam(p.MessageType):
         receiver: int = None,
         quantity: EosAsset = None,
     ) -> None:
-        self.payer = payer
-        self.receiver = receiver
-        self.quantity = quantity
+        if payer is not None:
+            self.payer = payer
+        if receiver is not None:
+            self.receiver = receiver
+        if quantity is not None:
+            self.quantity = quantity
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class EosActionBuyRamBytes(p.MessageType):
+    payer = None
+    receiver = None
+    bytes = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class EosActionBuyRamBytes(p.MessageType):
         receiver: int = None,
         bytes: int = None,
     ) -> None:
-        self.payer = payer
-        self.receiver = receiver
-        self.bytes = bytes
+        if payer is not None:
+            self.payer = payer
+        if receiver is not None:
+            self.receiver = receiver
+        if bytes is not None:
+            self.bytes = bytes
 
     @classmethod
     def get_fields(cls):
@@ -12,6 +12,8 @@ if __debug__:
 
 
 class EosActionCommon(p.MessageType):
+    account = None
+    name = None
 
     def __init__(
         self,
@@ -19,8 +21,10 @@ class EosActionCommon(p.MessageType):
         name: int = None,
         authorization: List[EosPermissionLevel] = None,
     ) -> None:
-        self.account = account
-        self.name = name
+        if account is not None:
+            self.account = account
+        if name is not None:
+            self.name = name
         self.authorization = authorization if authorization is not None else []
 
     @classmethod
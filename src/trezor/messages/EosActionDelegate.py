@@ -6,6 +6,11 @@ from .EosAsset import EosAsset
 
 
 class EosActionDelegate(p.MessageType):
+    sender = None
+    receiver = None
+    net_quantity = None
+    cpu_quantity = None
+    transfer = None
 
     def __init__(
         self,
@@ -15,11 +20,16 @@ class EosActionDelegate(p.MessageType):
         cpu_quantity: EosAsset = None,
         transfer: bool = None,
     ) -> None:
-        self.sender = sender
-        self.receiver = receiver
-        self.net_quantity = net_quantity
-        self.cpu_quantity = cpu_quantity
-        self.transfer = transfer
+        if sender is not None:
+            self.sender = sender
+        if receiver is not None:
+            self.receiver = receiver
+        if net_quantity is not None:
+            self.net_quantity = net_quantity
+        if cpu_quantity is not None:
+            self.cpu_quantity = cpu_quantity
+        if transfer is not None:
+            self.transfer = transfer
 
     @classmethod
     def get_fields(cls):
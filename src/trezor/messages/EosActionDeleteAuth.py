@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosActionDeleteAuth(p.MessageType):
+    account = None
+    permission = None
 
     def __init__(
         self,
         account: int = None,
         permission: int = None,
     ) -> None:
-        self.account = account
-        self.permission = permission
+        if account is not None:
+            self.account = account
+        if permission is not None:
+            self.permission = permission
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,10 @@ import protobuf as p
 
 
 class EosActionLinkAuth(p.MessageType):
+    account = None
+    code = None
+    type = None
+    requirement = None
 
     def __init__(
         self,
@@ -12,10 +16,14 @@ class EosActionLinkAuth(p.MessageType):
         type: int = None,
         requirement: int = None,
     ) -> None:
-        self.account = account
-        self.code = code
-        self.type = type
-        self.requirement = requirement
+        if account is not None:
+            self.account = account
+        if code is not None:
+            self.code = code
+        if type is not None:
+            self.type = type
+        if requirement is not None:
+            self.requirement = requirement
 
     @classmethod
     def get_fields(cls):
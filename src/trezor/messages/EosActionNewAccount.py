@@ -6,6 +6,10 @@ from .EosAuthorization import EosAuthorization
 
 
 class EosActionNewAccount(p.MessageType):
+    creator = None
+    name = None
+    owner = None
+    active = None
 
     def __init__(
         self,
@@ -14,10 +18,14 @@ class EosActionNewAccount(p.MessageType):
         owner: EosAuthorization = None,
         active: EosAuthorization = None,
     ) -> None:
-        self.creator = creator
-        self.name = name
-        self.owner = owner
-        self.active = active
+        if creator is not None:
+            self.creator = creator
+        if name is not None:
+            self.name = name
+        if owner is not None:
+            self.owner = owner
+        if active is not None:
+            self.active = active
 
     @classmethod
     def get_fields(cls):
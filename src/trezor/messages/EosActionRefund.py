@@ -4,12 +4,14 @@ import protobuf as p
 
 
 class EosActionRefund(p.MessageType):
+    owner = None
 
     def __init__(
         self,
         owner: int = None,
     ) -> None:
-        self.owner = owner
+        if owner is not None:
+            self.owner = owner
 
     @classmethod
     def get_fields(cls):
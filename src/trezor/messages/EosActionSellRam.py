@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosActionSellRam(p.MessageType):
+    account = None
+    bytes = None
 
     def __init__(
         self,
         account: int = None,
         bytes: int = None,
     ) -> None:
-        self.account = account
-        self.bytes = bytes
+        if account is not None:
+            self.account = account
+        if bytes is not None:
+            self.bytes = bytes
 
     @classmethod
     def get_fields(cls):
@@ -6,6 +6,10 @@ from .EosAsset import EosAsset
 
 
 class EosActionTransfer(p.MessageType):
+    sender = None
+    receiver = None
+    quantity = None
+    memo = None
 
     def __init__(
         self,
@@ -14,10 +18,14 @@ class EosActionTransfer(p.MessageType):
         quantity: EosAsset = None,
         memo: str = None,
     ) -> None:
-        self.sender = sender
-        self.receiver = receiver
-        self.quantity = quantity
-        self.memo = memo
+        if sender is not None:
+            self.sender = sender
+        if receiver is not None:
+            self.receiver = receiver
+        if quantity is not None:
+            self.quantity = quantity
+        if memo is not None:
+            self.memo = memo
 
     @classmethod
     def get_fields(cls):
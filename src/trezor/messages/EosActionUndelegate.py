@@ -6,6 +6,10 @@ from .EosAsset import EosAsset
 
 
 class EosActionUndelegate(p.MessageType):
+    sender = None
+    receiver = None
+    net_quantity = None
+    cpu_quantity = None
 
     def __init__(
         self,
@@ -14,10 +18,14 @@ class EosActionUndelegate(p.MessageType):
         net_quantity: EosAsset = None,
         cpu_quantity: EosAsset = None,
     ) -> None:
-        self.sender = sender
-        self.receiver = receiver
-        self.net_quantity = net_quantity
-        self.cpu_quantity = cpu_quantity
+        if sender is not None:
+            self.sender = sender
+        if receiver is not None:
+            self.receiver = receiver
+        if net_quantity is not None:
+            self.net_quantity = net_quantity
+        if cpu_quantity is not None:
+            self.cpu_quantity = cpu_quantity
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosActionUnknown(p.MessageType):
+    data_size = None
+    data_chunk = None
 
     def __init__(
         self,
         data_size: int = None,
         data_chunk: bytes = None,
     ) -> None:
-        self.data_size = data_size
-        self.data_chunk = data_chunk
+        if data_size is not None:
+            self.data_size = data_size
+        if data_chunk is not None:
+            self.data_chunk = data_chunk
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class EosActionUnlinkAuth(p.MessageType):
+    account = None
+    code = None
+    type = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class EosActionUnlinkAuth(p.MessageType):
         code: int = None,
         type: int = None,
     ) -> None:
-        self.account = account
-        self.code = code
-        self.type = type
+        if account is not None:
+            self.account = account
+        if code is not None:
+            self.code = code
+        if type is not None:
+            self.type = type
 
     @classmethod
     def get_fields(cls):
@@ -6,6 +6,10 @@ from .EosAuthorization import EosAuthorization
 
 
 class EosActionUpdateAuth(p.MessageType):
+    account = None
+    permission = None
+    parent = None
+    auth = None
 
     def __init__(
         self,
@@ -14,10 +18,14 @@ class EosActionUpdateAuth(p.MessageType):
         parent: int = None,
         auth: EosAuthorization = None,
     ) -> None:
-        self.account = account
-        self.permission = permission
-        self.parent = parent
-        self.auth = auth
+        if account is not None:
+            self.account = account
+        if permission is not None:
+            self.permission = permission
+        if parent is not None:
+            self.parent = parent
+        if auth is not None:
+            self.auth = auth
 
     @classmethod
     def get_fields(cls):
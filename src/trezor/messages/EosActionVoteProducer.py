@@ -10,6 +10,8 @@ if __debug__:
 
 
 class EosActionVoteProducer(p.MessageType):
+    voter = None
+    proxy = None
 
     def __init__(
         self,
@@ -17,8 +19,10 @@ class EosActionVoteProducer(p.MessageType):
         proxy: int = None,
         producers: List[int] = None,
     ) -> None:
-        self.voter = voter
-        self.proxy = proxy
+        if voter is not None:
+            self.voter = voter
+        if proxy is not None:
+            self.proxy = proxy
         self.producers = producers if producers is not None else []
 
     @classmethod
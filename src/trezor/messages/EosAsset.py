@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosAsset(p.MessageType):
+    amount = None
+    symbol = None
 
     def __init__(
         self,
         amount: int = None,
         symbol: int = None,
     ) -> None:
-        self.amount = amount
-        self.symbol = symbol
+        if amount is not None:
+            self.amount = amount
+        if symbol is not None:
+            self.symbol = symbol
 
     @classmethod
     def get_fields(cls):
@@ -14,6 +14,7 @@ if __debug__:
 
 
 class EosAuthorization(p.MessageType):
+    threshold = None
 
     def __init__(
         self,
@@ -22,7 +23,8 @@ class EosAuthorization(p.MessageType):
         accounts: List[EosAuthorizationAccount] = None,
         waits: List[EosAuthorizationWait] = None,
     ) -> None:
-        self.threshold = threshold
+        if threshold is not None:
+            self.threshold = threshold
         self.keys = keys if keys is not None else []
         self.accounts = accounts if accounts is not None else []
         self.waits = waits if waits is not None else []
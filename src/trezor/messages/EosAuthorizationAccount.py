@@ -6,14 +6,18 @@ from .EosPermissionLevel import EosPermissionLevel
 
 
 class EosAuthorizationAccount(p.MessageType):
+    account = None
+    weight = None
 
     def __init__(
         self,
         account: EosPermissionLevel = None,
         weight: int = None,
     ) -> None:
-        self.account = account
-        self.weight = weight
+        if account is not None:
+            self.account = account
+        if weight is not None:
+            self.weight = weight
 
     @classmethod
     def get_fields(cls):
@@ -10,6 +10,9 @@ if __debug__:
 
 
 class EosAuthorizationKey(p.MessageType):
+    type = None
+    key = None
+    weight = None
 
     def __init__(
         self,
@@ -18,10 +21,13 @@ class EosAuthorizationKey(p.MessageType):
         address_n: List[int] = None,
         weight: int = None,
     ) -> None:
-        self.type = type
-        self.key = key
+        if type is not None:
+            self.type = type
+        if key is not None:
+            self.key = key
         self.address_n = address_n if address_n is not None else []
-        self.weight = weight
+        if weight is not None:
+            self.weight = weight
 
     @classmethod
     def get_fields(cls):
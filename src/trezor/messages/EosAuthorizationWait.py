@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosAuthorizationWait(p.MessageType):
+    wait_sec = None
+    weight = None
 
     def __init__(
         self,
         wait_sec: int = None,
         weight: int = None,
     ) -> None:
-        self.wait_sec = wait_sec
-        self.weight = weight
+        if wait_sec is not None:
+            self.wait_sec = wait_sec
+        if weight is not None:
+            self.weight = weight
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class EosPermissionLevel(p.MessageType):
+    actor = None
+    permission = None
 
     def __init__(
         self,
         actor: int = None,
         permission: int = None,
     ) -> None:
-        self.actor = actor
-        self.permission = permission
+        if actor is not None:
+            self.actor = actor
+        if permission is not None:
+            self.permission = permission
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class EosPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 601
+    wif_public_key = None
+    raw_public_key = None
 
     def __init__(
         self,
         wif_public_key: str = None,
         raw_public_key: bytes = None,
     ) -> None:
-        self.wif_public_key = wif_public_key
-        self.raw_public_key = raw_public_key
+        if wif_public_key is not None:
+            self.wif_public_key = wif_public_key
+        if raw_public_key is not None:
+            self.raw_public_key = raw_public_key
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,9 @@ if __debug__:
 
 class EosSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 602
+    chain_id = None
+    header = None
+    num_actions = None
 
     def __init__(
         self,
@@ -22,9 +25,12 @@ class EosSignTx(p.MessageType):
         num_actions: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.chain_id = chain_id
-        self.header = header
-        self.num_actions = num_actions
+        if chain_id is not None:
+            self.chain_id = chain_id
+        if header is not None:
+            self.header = header
+        if num_actions is not None:
+            self.num_actions = num_actions
 
     @classmethod
     def get_fields(cls):
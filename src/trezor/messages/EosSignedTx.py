@@ -5,6 +5,9 @@ import protobuf as p
 
 class EosSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 605
+    signature_v = None
+    signature_r = None
+    signature_s = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class EosSignedTx(p.MessageType):
         signature_r: bytes = None,
         signature_s: bytes = None,
     ) -> None:
-        self.signature_v = signature_v
-        self.signature_r = signature_r
-        self.signature_s = signature_s
+        if signature_v is not None:
+            self.signature_v = signature_v
+        if signature_r is not None:
+            self.signature_r = signature_r
+        if signature_s is not None:
+            self.signature_s = signature_s
 
     @classmethod
     def get_fields(cls):
@@ -21,6 +21,21 @@ from .EosActionVoteProducer import EosActionVoteProducer
 
 class EosTxActionAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 604
+    common = None
+    transfer = None
+    delegate = None
+    undelegate = None
+    refund = None
+    buy_ram = None
+    buy_ram_bytes = None
+    sell_ram = None
+    vote_producer = None
+    update_auth = None
+    delete_auth = None
+    link_auth = None
+    unlink_auth = None
+    new_account = None
+    unknown = None
 
     def __init__(
         self,
@@ -40,21 +55,36 @@ class EosTxActionAck(p.MessageType):
         new_account: EosActionNewAccount = None,
         unknown: EosActionUnknown = None,
     ) -> None:
-        self.common = common
-        self.transfer = transfer
-        self.delegate = delegate
-        self.undelegate = undelegate
-        self.refund = refund
-        self.buy_ram = buy_ram
-        self.buy_ram_bytes = buy_ram_bytes
-        self.sell_ram = sell_ram
-        self.vote_producer = vote_producer
-        self.update_auth = update_auth
-        self.delete_auth = delete_auth
-        self.link_auth = link_auth
-        self.unlink_auth = unlink_auth
-        self.new_account = new_account
-        self.unknown = unknown
+        if common is not None:
+            self.common = common
+        if transfer is not None:
+            self.transfer = transfer
+        if delegate is not None:
+            self.delegate = delegate
+        if undelegate is not None:
+            self.undelegate = undelegate
+        if refund is not None:
+            self.refund = refund
+        if buy_ram is not None:
+            self.buy_ram = buy_ram
+        if buy_ram_bytes is not None:
+            self.buy_ram_bytes = buy_ram_bytes
+        if sell_ram is not None:
+            self.sell_ram = sell_ram
+        if vote_producer is not None:
+            self.vote_producer = vote_producer
+        if update_auth is not None:
+            self.update_auth = update_auth
+        if delete_auth is not None:
+            self.delete_auth = delete_auth
+        if link_auth is not None:
+            self.link_auth = link_auth
+        if unlink_auth is not None:
+            self.unlink_auth = unlink_auth
+        if new_account is not None:
+            self.new_account = new_account
+        if unknown is not None:
+            self.unknown = unknown
 
     @classmethod
     def get_fields(cls):
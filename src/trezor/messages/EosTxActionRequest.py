@@ -5,12 +5,14 @@ import protobuf as p
 
 class EosTxActionRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 603
+    data_size = None
 
     def __init__(
         self,
         data_size: int = None,
     ) -> None:
-        self.data_size = data_size
+        if data_size is not None:
+            self.data_size = data_size
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class EosTxHeader(p.MessageType):
+    expiration = None
+    ref_block_num = None
+    ref_block_prefix = None
+    max_net_usage_words = None
+    max_cpu_usage_ms = None
+    delay_sec = None
 
     def __init__(
         self,
@@ -14,12 +20,18 @@ class EosTxHeader(p.MessageType):
         max_cpu_usage_ms: int = None,
         delay_sec: int = None,
     ) -> None:
-        self.expiration = expiration
-        self.ref_block_num = ref_block_num
-        self.ref_block_prefix = ref_block_prefix
-        self.max_net_usage_words = max_net_usage_words
-        self.max_cpu_usage_ms = max_cpu_usage_ms
-        self.delay_sec = delay_sec
+        if expiration is not None:
+            self.expiration = expiration
+        if ref_block_num is not None:
+            self.ref_block_num = ref_block_num
+        if ref_block_prefix is not None:
+            self.ref_block_prefix = ref_block_prefix
+        if max_net_usage_words is not None:
+            self.max_net_usage_words = max_net_usage_words
+        if max_cpu_usage_ms is not None:
+            self.max_cpu_usage_ms = max_cpu_usage_ms
+        if delay_sec is not None:
+            self.delay_sec = delay_sec
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class EthereumAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 57
+    address = None
 
     def __init__(
         self,
         address: str = None,
     ) -> None:
-        self.address = address
+        if address is not None:
+            self.address = address
 
     @classmethod
     def get_fields(cls):
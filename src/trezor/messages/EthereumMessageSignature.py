@@ -5,14 +5,18 @@ import protobuf as p
 
 class EthereumMessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 66
+    signature = None
+    address = None
 
     def __init__(
         self,
         signature: bytes = None,
         address: str = None,
     ) -> None:
-        self.signature = signature
-        self.address = address
+        if signature is not None:
+            self.signature = signature
+        if address is not None:
+            self.address = address
 
     @classmethod
     def get_fields(cls):
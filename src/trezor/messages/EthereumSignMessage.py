@@ -11,6 +11,7 @@ if __debug__:
 
 class EthereumSignMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 64
+    message = None
 
     def __init__(
         self,
@@ -18,7 +19,8 @@ class EthereumSignMessage(p.MessageType):
         message: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.message = message
+        if message is not None:
+            self.message = message
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,15 @@ if __debug__:
 
 class EthereumSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 58
+    nonce = None
+    gas_price = None
+    gas_limit = None
+    to = None
+    value = None
+    data_initial_chunk = None
+    data_length = None
+    chain_id = None
+    tx_type = None
 
     def __init__(
         self,
@@ -26,15 +35,24 @@ class EthereumSignTx(p.MessageType):
         tx_type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.nonce = nonce
-        self.gas_price = gas_price
-        self.gas_limit = gas_limit
-        self.to = to
-        self.value = value
-        self.data_initial_chunk = data_initial_chunk
-        self.data_length = data_length
-        self.chain_id = chain_id
-        self.tx_type = tx_type
+        if nonce is not None:
+            self.nonce = nonce
+        if gas_price is not None:
+            self.gas_price = gas_price
+        if gas_limit is not None:
+            self.gas_limit = gas_limit
+        if to is not None:
+            self.to = to
+        if value is not None:
+            self.value = value
+        if data_initial_chunk is not None:
+            self.data_initial_chunk = data_initial_chunk
+        if data_length is not None:
+            self.data_length = data_length
+        if chain_id is not None:
+            self.chain_id = chain_id
+        if tx_type is not None:
+            self.tx_type = tx_type
 
     @classmethod
     def get_fields(cls):
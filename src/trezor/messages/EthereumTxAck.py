@@ -5,12 +5,14 @@ import protobuf as p
 
 class EthereumTxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 60
+    data_chunk = None
 
     def __init__(
         self,
         data_chunk: bytes = None,
     ) -> None:
-        self.data_chunk = data_chunk
+        if data_chunk is not None:
+            self.data_chunk = data_chunk
 
     @classmethod
     def get_fields(cls):
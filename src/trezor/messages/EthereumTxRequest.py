@@ -5,6 +5,10 @@ import protobuf as p
 
 class EthereumTxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 59
+    data_length = None
+    signature_v = None
+    signature_r = None
+    signature_s = None
 
     def __init__(
         self,
@@ -13,10 +17,14 @@ class EthereumTxRequest(p.MessageType):
         signature_r: bytes = None,
         signature_s: bytes = None,
     ) -> None:
-        self.data_length = data_length
-        self.signature_v = signature_v
-        self.signature_r = signature_r
-        self.signature_s = signature_s
+        if data_length is not None:
+            self.data_length = data_length
+        if signature_v is not None:
+            self.signature_v = signature_v
+        if signature_r is not None:
+            self.signature_r = signature_r
+        if signature_s is not None:
+            self.signature_s = signature_s
 
     @classmethod
     def get_fields(cls):
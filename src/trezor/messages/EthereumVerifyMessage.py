@@ -5,6 +5,9 @@ import protobuf as p
 
 class EthereumVerifyMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 65
+    signature = None
+    message = None
+    address = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class EthereumVerifyMessage(p.MessageType):
         message: bytes = None,
         address: str = None,
     ) -> None:
-        self.signature = signature
-        self.message = message
-        self.address = address
+        if signature is not None:
+            self.signature = signature
+        if message is not None:
+            self.message = message
+        if address is not None:
+            self.address = address
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class Failure(p.MessageType):
     MESSAGE_WIRE_TYPE = 3
+    code = None
+    message = None
 
     def __init__(
         self,
         code: int = None,
         message: str = None,
     ) -> None:
-        self.code = code
-        self.message = message
+        if code is not None:
+            self.code = code
+        if message is not None:
+            self.message = message
 
     @classmethod
     def get_fields(cls):
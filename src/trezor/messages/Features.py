@@ -5,6 +5,33 @@ import protobuf as p
 
 class Features(p.MessageType):
     MESSAGE_WIRE_TYPE = 17
+    vendor = None
+    major_version = None
+    minor_version = None
+    patch_version = None
+    bootloader_mode = None
+    device_id = None
+    pin_protection = None
+    passphrase_protection = None
+    language = None
+    label = None
+    initialized = None
+    revision = None
+    bootloader_hash = None
+    imported = None
+    pin_cached = None
+    passphrase_cached = None
+    firmware_present = None
+    needs_backup = None
+    flags = None
+    model = None
+    fw_major = None
+    fw_minor = None
+    fw_patch = None
+    fw_vendor = None
+    fw_vendor_keys = None
+    unfinished_backup = None
+    no_backup = None
 
     def __init__(
         self,
@@ -36,33 +63,60 @@ class Features(p.MessageType):
         unfinished_backup: bool = None,
         no_backup: bool = None,
     ) -> None:
-        self.vendor = vendor
-        self.major_version = major_version
-        self.minor_version = minor_version
-        self.patch_version = patch_version
-        self.bootloader_mode = bootloader_mode
-        self.device_id = device_id
-        self.pin_protection = pin_protection
-        self.passphrase_protection = passphrase_protection
-        self.language = language
-        self.label = label
-        self.initialized = initialized
-        self.revision = revision
-        self.bootloader_hash = bootloader_hash
-        self.imported = imported
-        self.pin_cached = pin_cached
-        self.passphrase_cached = passphrase_cached
-        self.firmware_present = firmware_present
-        self.needs_backup = needs_backup
-        self.flags = flags
-        self.model = model
-        self.fw_major = fw_major
-        self.fw_minor = fw_minor
-        self.fw_patch = fw_patch
-        self.fw_vendor = fw_vendor
-        self.fw_vendor_keys = fw_vendor_keys
-        self.unfinished_backup = unfinished_backup
-        self.no_backup = no_backup
+        if vendor is not None:
+            self.vendor = vendor
+        if major_version is not None:
+            self.major_version = major_version
+        if minor_version is not None:
+            self.minor_version = minor_version
+        if patch_version is not None:
+            self.patch_version = patch_version
+        if bootloader_mode is not None:
+            self.bootloader_mode = bootloader_mode
+        if device_id is not None:
+            self.device_id = device_id
+        if pin_protection is not None:
+            self.pin_protection = pin_protection
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
+        if language is not None:
+            self.language = language
+        if label is not None:
+            self.label = label
+        if initialized is not None:
+            self.initialized = initialized
+        if revision is not None:
+            self.revision = revision
+        if bootloader_hash is not None:
+            self.bootloader_hash = bootloader_hash
+        if imported is not None:
+            self.imported = imported
+        if pin_cached is not None:
+            self.pin_cached = pin_cached
+        if passphrase_cached is not None:
+            self.passphrase_cached = passphrase_cached
+        if firmware_present is not None:
+            self.firmware_present = firmware_present
+        if needs_backup is not None:
+            self.needs_backup = needs_backup
+        if flags is not None:
+            self.flags = flags
+        if model is not None:
+            self.model = model
+        if fw_major is not None:
+            self.fw_major = fw_major
+        if fw_minor is not None:
+            self.fw_minor = fw_minor
+        if fw_patch is not None:
+            self.fw_patch = fw_patch
+        if fw_vendor is not None:
+            self.fw_vendor = fw_vendor
+        if fw_vendor_keys is not None:
+            self.fw_vendor_keys = fw_vendor_keys
+        if unfinished_backup is not None:
+            self.unfinished_backup = unfinished_backup
+        if no_backup is not None:
+            self.no_backup = no_backup
 
     @classmethod
     def get_fields(cls):
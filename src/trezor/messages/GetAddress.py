@@ -13,6 +13,10 @@ if __debug__:
 
 class GetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 29
+    coin_name = None
+    show_display = None
+    multisig = None
+    script_type = None
 
     def __init__(
         self,
@@ -23,10 +27,14 @@ class GetAddress(p.MessageType):
         script_type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.coin_name = coin_name
-        self.show_display = show_display
-        self.multisig = multisig
-        self.script_type = script_type
+        if coin_name is not None:
+            self.coin_name = coin_name
+        if show_display is not None:
+            self.show_display = show_display
+        if multisig is not None:
+            self.multisig = multisig
+        if script_type is not None:
+            self.script_type = script_type
 
     @classmethod
     def get_fields(cls):
@@ -0,0 +1,45 @@
+# Automatically generated by pb2py
+# fmt: off
+import protobuf as p
+
+if __debug__:
+    try:
+        from typing import List
+    except ImportError:
+        List = None  # type: ignore
+
+
+class GetAddresses(p.MessageType):
+    MESSAGE_WIRE_TYPE = 30000
+    coin_name = None
+    script_type = None
+    start_index = None
+    count = None
+
+    def __init__(
+        self,
+        address_n: List[int] = None,
+        coin_name: str = None,
+        script_type: int = None,
+        start_index: int = None,
+        count: int = None,
+    ) -> None:
+        self.address_n = address_n if address_n is not None else []
+        if coin_name is not None:
+            self.coin_name = coin_name
+        if script_type is not None:
+            self.script_type = script_type
+        if start_index is not None:
+            self.start_index = start_index
+        if count is not None:
+            self.count = count
+
+    @classmethod
+    def get_fields(cls):
+        return {
+            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
+            2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
+            3: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
+            4: ('start_index', p.UVarintType, 0),  # default=0
+            5: ('count', p.UVarintType, 0),  # required
+        }
@@ -7,6 +7,9 @@ from .IdentityType import IdentityType
 
 class GetECDHSessionKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 61
+    identity = None
+    peer_public_key = None
+    ecdsa_curve_name = None
 
     def __init__(
         self,
@@ -14,9 +17,12 @@ class GetECDHSessionKey(p.MessageType):
         peer_public_key: bytes = None,
         ecdsa_curve_name: str = None,
     ) -> None:
-        self.identity = identity
-        self.peer_public_key = peer_public_key
-        self.ecdsa_curve_name = ecdsa_curve_name
+        if identity is not None:
+            self.identity = identity
+        if peer_public_key is not None:
+            self.peer_public_key = peer_public_key
+        if ecdsa_curve_name is not None:
+            self.ecdsa_curve_name = ecdsa_curve_name
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class GetEntropy(p.MessageType):
     MESSAGE_WIRE_TYPE = 9
+    size = None
 
     def __init__(
         self,
         size: int = None,
     ) -> None:
-        self.size = size
+        if size is not None:
+            self.size = size
 
     @classmethod
     def get_fields(cls):
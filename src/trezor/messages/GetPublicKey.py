@@ -11,6 +11,10 @@ if __debug__:
 
 class GetPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 11
+    ecdsa_curve_name = None
+    show_display = None
+    coin_name = None
+    script_type = None
 
     def __init__(
         self,
@@ -21,10 +25,14 @@ class GetPublicKey(p.MessageType):
         script_type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.ecdsa_curve_name = ecdsa_curve_name
-        self.show_display = show_display
-        self.coin_name = coin_name
-        self.script_type = script_type
+        if ecdsa_curve_name is not None:
+            self.ecdsa_curve_name = ecdsa_curve_name
+        if show_display is not None:
+            self.show_display = show_display
+        if coin_name is not None:
+            self.coin_name = coin_name
+        if script_type is not None:
+            self.script_type = script_type
 
     @classmethod
     def get_fields(cls):
@@ -12,13 +12,15 @@ if __debug__:
 
 
 class HDNodePathType(p.MessageType):
+    node = None
 
     def __init__(
         self,
         node: HDNodeType = None,
         address_n: List[int] = None,
     ) -> None:
-        self.node = node
+        if node is not None:
+            self.node = node
         self.address_n = address_n if address_n is not None else []
 
     @classmethod
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class HDNodeType(p.MessageType):
+    depth = None
+    fingerprint = None
+    child_num = None
+    chain_code = None
+    private_key = None
+    public_key = None
 
     def __init__(
         self,
@@ -14,12 +20,18 @@ class HDNodeType(p.MessageType):
         private_key: bytes = None,
         public_key: bytes = None,
     ) -> None:
-        self.depth = depth
-        self.fingerprint = fingerprint
-        self.child_num = child_num
-        self.chain_code = chain_code
-        self.private_key = private_key
-        self.public_key = public_key
+        if depth is not None:
+            self.depth = depth
+        if fingerprint is not None:
+            self.fingerprint = fingerprint
+        if child_num is not None:
+            self.child_num = child_num
+        if chain_code is not None:
+            self.chain_code = chain_code
+        if private_key is not None:
+            self.private_key = private_key
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class IdentityType(p.MessageType):
+    proto = None
+    user = None
+    host = None
+    port = None
+    path = None
+    index = None
 
     def __init__(
         self,
@@ -14,12 +20,18 @@ class IdentityType(p.MessageType):
         path: str = None,
         index: int = None,
     ) -> None:
-        self.proto = proto
-        self.user = user
-        self.host = host
-        self.port = port
-        self.path = path
-        self.index = index
+        if proto is not None:
+            self.proto = proto
+        if user is not None:
+            self.user = user
+        if host is not None:
+            self.host = host
+        if port is not None:
+            self.port = port
+        if path is not None:
+            self.path = path
+        if index is not None:
+            self.index = index
 
     @classmethod
     def get_fields(cls):
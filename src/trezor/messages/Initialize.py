@@ -5,14 +5,18 @@ import protobuf as p
 
 class Initialize(p.MessageType):
     MESSAGE_WIRE_TYPE = 0
+    state = None
+    skip_passphrase = None
 
     def __init__(
         self,
         state: bytes = None,
         skip_passphrase: bool = None,
     ) -> None:
-        self.state = state
-        self.skip_passphrase = skip_passphrase
+        if state is not None:
+            self.state = state
+        if skip_passphrase is not None:
+            self.skip_passphrase = skip_passphrase
 
     @classmethod
     def get_fields(cls):
@@ -4,12 +4,14 @@ import protobuf as p
 
 
 class LiskDelegateType(p.MessageType):
+    username = None
 
     def __init__(
         self,
         username: str = None,
     ) -> None:
-        self.username = username
+        if username is not None:
+            self.username = username
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,7 @@ if __debug__:
 
 class LiskGetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 114
+    show_display = None
 
     def __init__(
         self,
@@ -18,7 +19,8 @@ class LiskGetAddress(p.MessageType):
         show_display: bool = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.show_display = show_display
+        if show_display is not None:
+            self.show_display = show_display
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class LiskMessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 119
+    public_key = None
+    signature = None
 
     def __init__(
         self,
         public_key: bytes = None,
         signature: bytes = None,
     ) -> None:
-        self.public_key = public_key
-        self.signature = signature
+        if public_key is not None:
+            self.public_key = public_key
+        if signature is not None:
+            self.signature = signature
 
     @classmethod
     def get_fields(cls):
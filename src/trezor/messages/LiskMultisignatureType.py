@@ -10,6 +10,8 @@ if __debug__:
 
 
 class LiskMultisignatureType(p.MessageType):
+    min = None
+    life_time = None
 
     def __init__(
         self,
@@ -17,8 +19,10 @@ class LiskMultisignatureType(p.MessageType):
         life_time: int = None,
         keys_group: List[str] = None,
     ) -> None:
-        self.min = min
-        self.life_time = life_time
+        if min is not None:
+            self.min = min
+        if life_time is not None:
+            self.life_time = life_time
         self.keys_group = keys_group if keys_group is not None else []
 
     @classmethod
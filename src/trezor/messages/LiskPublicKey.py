@@ -5,12 +5,14 @@ import protobuf as p
 
 class LiskPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 122
+    public_key = None
 
     def __init__(
         self,
         public_key: bytes = None,
     ) -> None:
-        self.public_key = public_key
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,7 @@ if __debug__:
 
 class LiskSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 116
+    transaction = None
 
     def __init__(
         self,
@@ -20,7 +21,8 @@ class LiskSignTx(p.MessageType):
         transaction: LiskTransactionCommon = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.transaction = transaction
+        if transaction is not None:
+            self.transaction = transaction
 
     @classmethod
     def get_fields(cls):
@@ -4,12 +4,14 @@ import protobuf as p
 
 
 class LiskSignatureType(p.MessageType):
+    public_key = None
 
     def __init__(
         self,
         public_key: bytes = None,
     ) -> None:
-        self.public_key = public_key
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class LiskSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 117
+    signature = None
 
     def __init__(
         self,
         signature: bytes = None,
     ) -> None:
-        self.signature = signature
+        if signature is not None:
+            self.signature = signature
 
     @classmethod
     def get_fields(cls):
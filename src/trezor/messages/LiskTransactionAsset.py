@@ -14,6 +14,10 @@ if __debug__:
 
 
 class LiskTransactionAsset(p.MessageType):
+    signature = None
+    delegate = None
+    multisignature = None
+    data = None
 
     def __init__(
         self,
@@ -23,11 +27,15 @@ class LiskTransactionAsset(p.MessageType):
         multisignature: LiskMultisignatureType = None,
         data: str = None,
     ) -> None:
-        self.signature = signature
-        self.delegate = delegate
+        if signature is not None:
+            self.signature = signature
+        if delegate is not None:
+            self.delegate = delegate
         self.votes = votes if votes is not None else []
-        self.multisignature = multisignature
-        self.data = data
+        if multisignature is not None:
+            self.multisignature = multisignature
+        if data is not None:
+            self.data = data
 
     @classmethod
     def get_fields(cls):
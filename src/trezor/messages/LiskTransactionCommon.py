@@ -6,6 +6,15 @@ from .LiskTransactionAsset import LiskTransactionAsset
 
 
 class LiskTransactionCommon(p.MessageType):
+    type = None
+    amount = None
+    fee = None
+    recipient_id = None
+    sender_public_key = None
+    requester_public_key = None
+    signature = None
+    timestamp = None
+    asset = None
 
     def __init__(
         self,
@@ -19,15 +28,24 @@ class LiskTransactionCommon(p.MessageType):
         timestamp: int = None,
         asset: LiskTransactionAsset = None,
     ) -> None:
-        self.type = type
-        self.amount = amount
-        self.fee = fee
-        self.recipient_id = recipient_id
-        self.sender_public_key = sender_public_key
-        self.requester_public_key = requester_public_key
-        self.signature = signature
-        self.timestamp = timestamp
-        self.asset = asset
+        if type is not None:
+            self.type = type
+        if amount is not None:
+            self.amount = amount
+        if fee is not None:
+            self.fee = fee
+        if recipient_id is not None:
+            self.recipient_id = recipient_id
+        if sender_public_key is not None:
+            self.sender_public_key = sender_public_key
+        if requester_public_key is not None:
+            self.requester_public_key = requester_public_key
+        if signature is not None:
+            self.signature = signature
+        if timestamp is not None:
+            self.timestamp = timestamp
+        if asset is not None:
+            self.asset = asset
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class LiskVerifyMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 120
+    public_key = None
+    signature = None
+    message = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class LiskVerifyMessage(p.MessageType):
         signature: bytes = None,
         message: bytes = None,
     ) -> None:
-        self.public_key = public_key
-        self.signature = signature
-        self.message = message
+        if public_key is not None:
+            self.public_key = public_key
+        if signature is not None:
+            self.signature = signature
+        if message is not None:
+            self.message = message
 
     @classmethod
     def get_fields(cls):
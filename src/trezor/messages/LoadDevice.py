@@ -7,6 +7,14 @@ from .HDNodeType import HDNodeType
 
 class LoadDevice(p.MessageType):
     MESSAGE_WIRE_TYPE = 13
+    mnemonic = None
+    node = None
+    pin = None
+    passphrase_protection = None
+    language = None
+    label = None
+    skip_checksum = None
+    u2f_counter = None
 
     def __init__(
         self,
@@ -19,14 +27,22 @@ class LoadDevice(p.MessageType):
         skip_checksum: bool = None,
         u2f_counter: int = None,
     ) -> None:
-        self.mnemonic = mnemonic
-        self.node = node
-        self.pin = pin
-        self.passphrase_protection = passphrase_protection
-        self.language = language
-        self.label = label
-        self.skip_checksum = skip_checksum
-        self.u2f_counter = u2f_counter
+        if mnemonic is not None:
+            self.mnemonic = mnemonic
+        if node is not None:
+            self.node = node
+        if pin is not None:
+            self.pin = pin
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
+        if language is not None:
+            self.language = language
+        if label is not None:
+            self.label = label
+        if skip_checksum is not None:
+            self.skip_checksum = skip_checksum
+        if u2f_counter is not None:
+            self.u2f_counter = u2f_counter
 
     @classmethod
     def get_fields(cls):
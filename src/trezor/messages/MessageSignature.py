@@ -5,14 +5,18 @@ import protobuf as p
 
 class MessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 40
+    address = None
+    signature = None
 
     def __init__(
         self,
         address: str = None,
         signature: bytes = None,
     ) -> None:
-        self.address = address
-        self.signature = signature
+        if address is not None:
+            self.address = address
+        if signature is not None:
+            self.signature = signature
 
     @classmethod
     def get_fields(cls):
@@ -42,6 +42,8 @@ TxRequest = 21
 TxAck = 22
 GetAddress = 29
 Address = 30
+GetAddresses = 30000
+Addresses = 30001
 SignMessage = 38
 VerifyMessage = 39
 MessageSignature = 40
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class MoneroAccountPublicAddress(p.MessageType):
+    spend_public_key = None
+    view_public_key = None
 
     def __init__(
         self,
         spend_public_key: bytes = None,
         view_public_key: bytes = None,
     ) -> None:
-        self.spend_public_key = spend_public_key
-        self.view_public_key = view_public_key
+        if spend_public_key is not None:
+            self.spend_public_key = spend_public_key
+        if view_public_key is not None:
+            self.view_public_key = view_public_key
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class MoneroExportedKeyImage(p.MessageType):
+    iv = None
+    blob = None
 
     def __init__(
         self,
         iv: bytes = None,
         blob: bytes = None,
     ) -> None:
-        self.iv = iv
-        self.blob = blob
+        if iv is not None:
+            self.iv = iv
+        if blob is not None:
+            self.blob = blob
 
     @classmethod
     def get_fields(cls):
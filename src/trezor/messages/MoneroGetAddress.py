@@ -11,6 +11,10 @@ if __debug__:
 
 class MoneroGetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 540
+    show_display = None
+    network_type = None
+    account = None
+    minor = None
 
     def __init__(
         self,
@@ -21,10 +25,14 @@ class MoneroGetAddress(p.MessageType):
         minor: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.show_display = show_display
-        self.network_type = network_type
-        self.account = account
-        self.minor = minor
+        if show_display is not None:
+            self.show_display = show_display
+        if network_type is not None:
+            self.network_type = network_type
+        if account is not None:
+            self.account = account
+        if minor is not None:
+            self.minor = minor
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class MoneroGetTxKeyAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 551
+    salt = None
+    tx_keys = None
+    tx_derivations = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class MoneroGetTxKeyAck(p.MessageType):
         tx_keys: bytes = None,
         tx_derivations: bytes = None,
     ) -> None:
-        self.salt = salt
-        self.tx_keys = tx_keys
-        self.tx_derivations = tx_derivations
+        if salt is not None:
+            self.salt = salt
+        if tx_keys is not None:
+            self.tx_keys = tx_keys
+        if tx_derivations is not None:
+            self.tx_derivations = tx_derivations
 
     @classmethod
     def get_fields(cls):
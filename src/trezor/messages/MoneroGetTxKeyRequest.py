@@ -11,6 +11,13 @@ if __debug__:
 
 class MoneroGetTxKeyRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 550
+    network_type = None
+    salt1 = None
+    salt2 = None
+    tx_enc_keys = None
+    tx_prefix_hash = None
+    reason = None
+    view_public_key = None
 
     def __init__(
         self,
@@ -24,13 +31,20 @@ class MoneroGetTxKeyRequest(p.MessageType):
         view_public_key: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network_type = network_type
-        self.salt1 = salt1
-        self.salt2 = salt2
-        self.tx_enc_keys = tx_enc_keys
-        self.tx_prefix_hash = tx_prefix_hash
-        self.reason = reason
-        self.view_public_key = view_public_key
+        if network_type is not None:
+            self.network_type = network_type
+        if salt1 is not None:
+            self.salt1 = salt1
+        if salt2 is not None:
+            self.salt2 = salt2
+        if tx_enc_keys is not None:
+            self.tx_enc_keys = tx_enc_keys
+        if tx_prefix_hash is not None:
+            self.tx_prefix_hash = tx_prefix_hash
+        if reason is not None:
+            self.reason = reason
+        if view_public_key is not None:
+            self.view_public_key = view_public_key
 
     @classmethod
     def get_fields(cls):
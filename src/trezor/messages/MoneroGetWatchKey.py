@@ -11,6 +11,7 @@ if __debug__:
 
 class MoneroGetWatchKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 542
+    network_type = None
 
     def __init__(
         self,
@@ -18,7 +19,8 @@ class MoneroGetWatchKey(p.MessageType):
         network_type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network_type = network_type
+        if network_type is not None:
+            self.network_type = network_type
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,9 @@ if __debug__:
 
 class MoneroKeyImageExportInitRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 530
+    num = None
+    hash = None
+    network_type = None
 
     def __init__(
         self,
@@ -22,10 +25,13 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
         network_type: int = None,
         subs: List[MoneroSubAddressIndicesList] = None,
     ) -> None:
-        self.num = num
-        self.hash = hash
+        if num is not None:
+            self.num = num
+        if hash is not None:
+            self.hash = hash
         self.address_n = address_n if address_n is not None else []
-        self.network_type = network_type
+        if network_type is not None:
+            self.network_type = network_type
         self.subs = subs if subs is not None else []
 
     @classmethod
@@ -5,12 +5,14 @@ import protobuf as p
 
 class MoneroKeyImageSyncFinalAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 535
+    enc_key = None
 
     def __init__(
         self,
         enc_key: bytes = None,
     ) -> None:
-        self.enc_key = enc_key
+        if enc_key is not None:
+            self.enc_key = enc_key
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class MoneroLiveRefreshStepAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 555
+    salt = None
+    key_image = None
 
     def __init__(
         self,
         salt: bytes = None,
         key_image: bytes = None,
     ) -> None:
-        self.salt = salt
-        self.key_image = key_image
+        if salt is not None:
+            self.salt = salt
+        if key_image is not None:
+            self.key_image = key_image
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,11 @@ import protobuf as p
 
 class MoneroLiveRefreshStepRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 554
+    out_key = None
+    recv_deriv = None
+    real_out_idx = None
+    sub_addr_major = None
+    sub_addr_minor = None
 
     def __init__(
         self,
@@ -14,11 +19,16 @@ class MoneroLiveRefreshStepRequest(p.MessageType):
         sub_addr_major: int = None,
         sub_addr_minor: int = None,
     ) -> None:
-        self.out_key = out_key
-        self.recv_deriv = recv_deriv
-        self.real_out_idx = real_out_idx
-        self.sub_addr_major = sub_addr_major
-        self.sub_addr_minor = sub_addr_minor
+        if out_key is not None:
+            self.out_key = out_key
+        if recv_deriv is not None:
+            self.recv_deriv = recv_deriv
+        if real_out_idx is not None:
+            self.real_out_idx = real_out_idx
+        if sub_addr_major is not None:
+            self.sub_addr_major = sub_addr_major
+        if sub_addr_minor is not None:
+            self.sub_addr_minor = sub_addr_minor
 
     @classmethod
     def get_fields(cls):
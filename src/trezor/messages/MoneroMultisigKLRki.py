@@ -4,6 +4,10 @@ import protobuf as p
 
 
 class MoneroMultisigKLRki(p.MessageType):
+    K = None
+    L = None
+    R = None
+    ki = None
 
     def __init__(
         self,
@@ -12,10 +16,14 @@ class MoneroMultisigKLRki(p.MessageType):
         R: bytes = None,
         ki: bytes = None,
     ) -> None:
-        self.K = K
-        self.L = L
-        self.R = R
-        self.ki = ki
+        if K is not None:
+            self.K = K
+        if L is not None:
+            self.L = L
+        if R is not None:
+            self.R = R
+        if ki is not None:
+            self.ki = ki
 
     @classmethod
     def get_fields(cls):
@@ -6,14 +6,18 @@ from .MoneroRctKeyPublic import MoneroRctKeyPublic
 
 
 class MoneroOutputEntry(p.MessageType):
+    idx = None
+    key = None
 
     def __init__(
         self,
         idx: int = None,
         key: MoneroRctKeyPublic = None,
     ) -> None:
-        self.idx = idx
-        self.key = key
+        if idx is not None:
+            self.idx = idx
+        if key is not None:
+            self.key = key
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class MoneroRctKeyPublic(p.MessageType):
+    dest = None
+    commitment = None
 
     def __init__(
         self,
         dest: bytes = None,
         commitment: bytes = None,
     ) -> None:
-        self.dest = dest
-        self.commitment = commitment
+        if dest is not None:
+            self.dest = dest
+        if commitment is not None:
+            self.commitment = commitment
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class MoneroRingCtSig(p.MessageType):
+    txn_fee = None
+    message = None
+    rv_type = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class MoneroRingCtSig(p.MessageType):
         message: bytes = None,
         rv_type: int = None,
     ) -> None:
-        self.txn_fee = txn_fee
-        self.message = message
-        self.rv_type = rv_type
+        if txn_fee is not None:
+            self.txn_fee = txn_fee
+        if message is not None:
+            self.message = message
+        if rv_type is not None:
+            self.rv_type = rv_type
 
     @classmethod
     def get_fields(cls):
@@ -10,13 +10,15 @@ if __debug__:
 
 
 class MoneroSubAddressIndicesList(p.MessageType):
+    account = None
 
     def __init__(
         self,
         account: int = None,
         minor_indices: List[int] = None,
     ) -> None:
-        self.account = account
+        if account is not None:
+            self.account = account
         self.minor_indices = minor_indices if minor_indices is not None else []
 
     @classmethod
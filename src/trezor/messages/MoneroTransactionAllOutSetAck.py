@@ -7,6 +7,10 @@ from .MoneroRingCtSig import MoneroRingCtSig
 
 class MoneroTransactionAllOutSetAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 514
+    extra = None
+    tx_prefix_hash = None
+    rv = None
+    full_message_hash = None
 
     def __init__(
         self,
@@ -15,10 +19,14 @@ class MoneroTransactionAllOutSetAck(p.MessageType):
         rv: MoneroRingCtSig = None,
         full_message_hash: bytes = None,
     ) -> None:
-        self.extra = extra
-        self.tx_prefix_hash = tx_prefix_hash
-        self.rv = rv
-        self.full_message_hash = full_message_hash
+        if extra is not None:
+            self.extra = extra
+        if tx_prefix_hash is not None:
+            self.tx_prefix_hash = tx_prefix_hash
+        if rv is not None:
+            self.rv = rv
+        if full_message_hash is not None:
+            self.full_message_hash = full_message_hash
 
     @classmethod
     def get_fields(cls):
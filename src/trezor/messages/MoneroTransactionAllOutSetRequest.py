@@ -7,12 +7,14 @@ from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
 class MoneroTransactionAllOutSetRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 513
+    rsig_data = None
 
     def __init__(
         self,
         rsig_data: MoneroTransactionRsigData = None,
     ) -> None:
-        self.rsig_data = rsig_data
+        if rsig_data is not None:
+            self.rsig_data = rsig_data
 
     @classmethod
     def get_fields(cls):
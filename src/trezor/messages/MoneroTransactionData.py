@@ -13,6 +13,16 @@ if __debug__:
 
 
 class MoneroTransactionData(p.MessageType):
+    version = None
+    payment_id = None
+    unlock_time = None
+    change_dts = None
+    num_inputs = None
+    mixin = None
+    fee = None
+    account = None
+    rsig_data = None
+    client_version = None
 
     def __init__(
         self,
@@ -30,19 +40,29 @@ class MoneroTransactionData(p.MessageType):
         integrated_indices: List[int] = None,
         client_version: int = None,
     ) -> None:
-        self.version = version
-        self.payment_id = payment_id
-        self.unlock_time = unlock_time
+        if version is not None:
+            self.version = version
+        if payment_id is not None:
+            self.payment_id = payment_id
+        if unlock_time is not None:
+            self.unlock_time = unlock_time
         self.outputs = outputs if outputs is not None else []
-        self.change_dts = change_dts
-        self.num_inputs = num_inputs
-        self.mixin = mixin
-        self.fee = fee
-        self.account = account
+        if change_dts is not None:
+            self.change_dts = change_dts
+        if num_inputs is not None:
+            self.num_inputs = num_inputs
+        if mixin is not None:
+            self.mixin = mixin
+        if fee is not None:
+            self.fee = fee
+        if account is not None:
+            self.account = account
         self.minor_indices = minor_indices if minor_indices is not None else []
-        self.rsig_data = rsig_data
+        if rsig_data is not None:
+            self.rsig_data = rsig_data
         self.integrated_indices = integrated_indices if integrated_indices is not None else []
-        self.client_version = client_version
+        if client_version is not None:
+            self.client_version = client_version
 
     @classmethod
     def get_fields(cls):
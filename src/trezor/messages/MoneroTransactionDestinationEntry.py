@@ -6,6 +6,11 @@ from .MoneroAccountPublicAddress import MoneroAccountPublicAddress
 
 
 class MoneroTransactionDestinationEntry(p.MessageType):
+    amount = None
+    addr = None
+    is_subaddress = None
+    original = None
+    is_integrated = None
 
     def __init__(
         self,
@@ -15,11 +20,16 @@ class MoneroTransactionDestinationEntry(p.MessageType):
         original: bytes = None,
         is_integrated: bool = None,
     ) -> None:
-        self.amount = amount
-        self.addr = addr
-        self.is_subaddress = is_subaddress
-        self.original = original
-        self.is_integrated = is_integrated
+        if amount is not None:
+            self.amount = amount
+        if addr is not None:
+            self.addr = addr
+        if is_subaddress is not None:
+            self.is_subaddress = is_subaddress
+        if original is not None:
+            self.original = original
+        if is_integrated is not None:
+            self.is_integrated = is_integrated
 
     @classmethod
     def get_fields(cls):
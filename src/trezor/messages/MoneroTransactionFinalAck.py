@@ -5,6 +5,10 @@ import protobuf as p
 
 class MoneroTransactionFinalAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 518
+    cout_key = None
+    salt = None
+    rand_mult = None
+    tx_enc_keys = None
 
     def __init__(
         self,
@@ -13,10 +17,14 @@ class MoneroTransactionFinalAck(p.MessageType):
         rand_mult: bytes = None,
         tx_enc_keys: bytes = None,
     ) -> None:
-        self.cout_key = cout_key
-        self.salt = salt
-        self.rand_mult = rand_mult
-        self.tx_enc_keys = tx_enc_keys
+        if cout_key is not None:
+            self.cout_key = cout_key
+        if salt is not None:
+            self.salt = salt
+        if rand_mult is not None:
+            self.rand_mult = rand_mult
+        if tx_enc_keys is not None:
+            self.tx_enc_keys = tx_enc_keys
 
     @classmethod
     def get_fields(cls):
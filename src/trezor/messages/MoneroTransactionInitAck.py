@@ -13,6 +13,7 @@ if __debug__:
 
 class MoneroTransactionInitAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 502
+    rsig_data = None
 
     def __init__(
         self,
@@ -20,7 +21,8 @@ class MoneroTransactionInitAck(p.MessageType):
         rsig_data: MoneroTransactionRsigData = None,
     ) -> None:
         self.hmacs = hmacs if hmacs is not None else []
-        self.rsig_data = rsig_data
+        if rsig_data is not None:
+            self.rsig_data = rsig_data
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,9 @@ if __debug__:
 
 class MoneroTransactionInitRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 501
+    version = None
+    network_type = None
+    tsx_data = None
 
     def __init__(
         self,
@@ -21,10 +24,13 @@ class MoneroTransactionInitRequest(p.MessageType):
         network_type: int = None,
         tsx_data: MoneroTransactionData = None,
     ) -> None:
-        self.version = version
+        if version is not None:
+            self.version = version
         self.address_n = address_n if address_n is not None else []
-        self.network_type = network_type
-        self.tsx_data = tsx_data
+        if network_type is not None:
+            self.network_type = network_type
+        if tsx_data is not None:
+            self.tsx_data = tsx_data
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,11 @@ from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
 class MoneroTransactionInputViniRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 507
+    src_entr = None
+    vini = None
+    vini_hmac = None
+    pseudo_out = None
+    pseudo_out_hmac = None
 
     def __init__(
         self,
@@ -16,11 +21,16 @@ class MoneroTransactionInputViniRequest(p.MessageType):
         pseudo_out: bytes = None,
         pseudo_out_hmac: bytes = None,
     ) -> None:
-        self.src_entr = src_entr
-        self.vini = vini
-        self.vini_hmac = vini_hmac
-        self.pseudo_out = pseudo_out
-        self.pseudo_out_hmac = pseudo_out_hmac
+        if src_entr is not None:
+            self.src_entr = src_entr
+        if vini is not None:
+            self.vini = vini
+        if vini_hmac is not None:
+            self.vini_hmac = vini_hmac
+        if pseudo_out is not None:
+            self.pseudo_out = pseudo_out
+        if pseudo_out_hmac is not None:
+            self.pseudo_out_hmac = pseudo_out_hmac
 
     @classmethod
     def get_fields(cls):
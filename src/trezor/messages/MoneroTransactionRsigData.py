@@ -10,6 +10,11 @@ if __debug__:
 
 
 class MoneroTransactionRsigData(p.MessageType):
+    rsig_type = None
+    offload_type = None
+    mask = None
+    rsig = None
+    bp_version = None
 
     def __init__(
         self,
@@ -21,13 +26,18 @@ class MoneroTransactionRsigData(p.MessageType):
         rsig_parts: List[bytes] = None,
         bp_version: int = None,
     ) -> None:
-        self.rsig_type = rsig_type
-        self.offload_type = offload_type
+        if rsig_type is not None:
+            self.rsig_type = rsig_type
+        if offload_type is not None:
+            self.offload_type = offload_type
         self.grouping = grouping if grouping is not None else []
-        self.mask = mask
-        self.rsig = rsig
+        if mask is not None:
+            self.mask = mask
+        if rsig is not None:
+            self.rsig = rsig
         self.rsig_parts = rsig_parts if rsig_parts is not None else []
-        self.bp_version = bp_version
+        if bp_version is not None:
+            self.bp_version = bp_version
 
     @classmethod
     def get_fields(cls):
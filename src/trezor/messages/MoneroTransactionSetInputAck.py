@@ -5,6 +5,12 @@ import protobuf as p
 
 class MoneroTransactionSetInputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 504
+    vini = None
+    vini_hmac = None
+    pseudo_out = None
+    pseudo_out_hmac = None
+    pseudo_out_alpha = None
+    spend_key = None
 
     def __init__(
         self,
@@ -15,12 +21,18 @@ class MoneroTransactionSetInputAck(p.MessageType):
         pseudo_out_alpha: bytes = None,
         spend_key: bytes = None,
     ) -> None:
-        self.vini = vini
-        self.vini_hmac = vini_hmac
-        self.pseudo_out = pseudo_out
-        self.pseudo_out_hmac = pseudo_out_hmac
-        self.pseudo_out_alpha = pseudo_out_alpha
-        self.spend_key = spend_key
+        if vini is not None:
+            self.vini = vini
+        if vini_hmac is not None:
+            self.vini_hmac = vini_hmac
+        if pseudo_out is not None:
+            self.pseudo_out = pseudo_out
+        if pseudo_out_hmac is not None:
+            self.pseudo_out_hmac = pseudo_out_hmac
+        if pseudo_out_alpha is not None:
+            self.pseudo_out_alpha = pseudo_out_alpha
+        if spend_key is not None:
+            self.spend_key = spend_key
 
     @classmethod
     def get_fields(cls):
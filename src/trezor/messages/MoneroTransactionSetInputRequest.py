@@ -7,12 +7,14 @@ from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
 class MoneroTransactionSetInputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 503
+    src_entr = None
 
     def __init__(
         self,
         src_entr: MoneroTransactionSourceEntry = None,
     ) -> None:
-        self.src_entr = src_entr
+        if src_entr is not None:
+            self.src_entr = src_entr
 
     @classmethod
     def get_fields(cls):
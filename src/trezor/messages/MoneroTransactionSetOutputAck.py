@@ -7,6 +7,11 @@ from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
 class MoneroTransactionSetOutputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 512
+    tx_out = None
+    vouti_hmac = None
+    rsig_data = None
+    out_pk = None
+    ecdh_info = None
 
     def __init__(
         self,
@@ -16,11 +21,16 @@ class MoneroTransactionSetOutputAck(p.MessageType):
         out_pk: bytes = None,
         ecdh_info: bytes = None,
     ) -> None:
-        self.tx_out = tx_out
-        self.vouti_hmac = vouti_hmac
-        self.rsig_data = rsig_data
-        self.out_pk = out_pk
-        self.ecdh_info = ecdh_info
+        if tx_out is not None:
+            self.tx_out = tx_out
+        if vouti_hmac is not None:
+            self.vouti_hmac = vouti_hmac
+        if rsig_data is not None:
+            self.rsig_data = rsig_data
+        if out_pk is not None:
+            self.out_pk = out_pk
+        if ecdh_info is not None:
+            self.ecdh_info = ecdh_info
 
     @classmethod
     def get_fields(cls):
@@ -8,6 +8,10 @@ from .MoneroTransactionRsigData import MoneroTransactionRsigData
 
 class MoneroTransactionSetOutputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 511
+    dst_entr = None
+    dst_entr_hmac = None
+    rsig_data = None
+    is_offloaded_bp = None
 
     def __init__(
         self,
@@ -16,10 +20,14 @@ class MoneroTransactionSetOutputRequest(p.MessageType):
         rsig_data: MoneroTransactionRsigData = None,
         is_offloaded_bp: bool = None,
     ) -> None:
-        self.dst_entr = dst_entr
-        self.dst_entr_hmac = dst_entr_hmac
-        self.rsig_data = rsig_data
-        self.is_offloaded_bp = is_offloaded_bp
+        if dst_entr is not None:
+            self.dst_entr = dst_entr
+        if dst_entr_hmac is not None:
+            self.dst_entr_hmac = dst_entr_hmac
+        if rsig_data is not None:
+            self.rsig_data = rsig_data
+        if is_offloaded_bp is not None:
+            self.is_offloaded_bp = is_offloaded_bp
 
     @classmethod
     def get_fields(cls):
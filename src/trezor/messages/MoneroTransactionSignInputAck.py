@@ -5,14 +5,18 @@ import protobuf as p
 
 class MoneroTransactionSignInputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 516
+    signature = None
+    pseudo_out = None
 
     def __init__(
         self,
         signature: bytes = None,
         pseudo_out: bytes = None,
     ) -> None:
-        self.signature = signature
-        self.pseudo_out = pseudo_out
+        if signature is not None:
+            self.signature = signature
+        if pseudo_out is not None:
+            self.pseudo_out = pseudo_out
 
     @classmethod
     def get_fields(cls):
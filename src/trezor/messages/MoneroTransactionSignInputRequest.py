@@ -7,6 +7,13 @@ from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
 
 class MoneroTransactionSignInputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 515
+    src_entr = None
+    vini = None
+    vini_hmac = None
+    pseudo_out = None
+    pseudo_out_hmac = None
+    pseudo_out_alpha = None
+    spend_key = None
 
     def __init__(
         self,
@@ -18,13 +25,20 @@ class MoneroTransactionSignInputRequest(p.MessageType):
         pseudo_out_alpha: bytes = None,
         spend_key: bytes = None,
     ) -> None:
-        self.src_entr = src_entr
-        self.vini = vini
-        self.vini_hmac = vini_hmac
-        self.pseudo_out = pseudo_out
-        self.pseudo_out_hmac = pseudo_out_hmac
-        self.pseudo_out_alpha = pseudo_out_alpha
-        self.spend_key = spend_key
+        if src_entr is not None:
+            self.src_entr = src_entr
+        if vini is not None:
+            self.vini = vini
+        if vini_hmac is not None:
+            self.vini_hmac = vini_hmac
+        if pseudo_out is not None:
+            self.pseudo_out = pseudo_out
+        if pseudo_out_hmac is not None:
+            self.pseudo_out_hmac = pseudo_out_hmac
+        if pseudo_out_alpha is not None:
+            self.pseudo_out_alpha = pseudo_out_alpha
+        if spend_key is not None:
+            self.spend_key = spend_key
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,13 @@ if __debug__:
 
 
 class MoneroTransactionSourceEntry(p.MessageType):
+    real_output = None
+    real_out_tx_key = None
+    real_output_in_tx_index = None
+    amount = None
+    rct = None
+    mask = None
+    multisig_kLRki = None
 
     def __init__(
         self,
@@ -27,14 +34,21 @@ class MoneroTransactionSourceEntry(p.MessageType):
         multisig_kLRki: MoneroMultisigKLRki = None,
     ) -> None:
         self.outputs = outputs if outputs is not None else []
-        self.real_output = real_output
-        self.real_out_tx_key = real_out_tx_key
+        if real_output is not None:
+            self.real_output = real_output
+        if real_out_tx_key is not None:
+            self.real_out_tx_key = real_out_tx_key
         self.real_out_additional_tx_keys = real_out_additional_tx_keys if real_out_additional_tx_keys is not None else []
-        self.real_output_in_tx_index = real_output_in_tx_index
-        self.amount = amount
-        self.rct = rct
-        self.mask = mask
-        self.multisig_kLRki = multisig_kLRki
+        if real_output_in_tx_index is not None:
+            self.real_output_in_tx_index = real_output_in_tx_index
+        if amount is not None:
+            self.amount = amount
+        if rct is not None:
+            self.rct = rct
+        if mask is not None:
+            self.mask = mask
+        if multisig_kLRki is not None:
+            self.multisig_kLRki = multisig_kLRki
 
     @classmethod
     def get_fields(cls):
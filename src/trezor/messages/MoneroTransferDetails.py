@@ -10,6 +10,9 @@ if __debug__:
 
 
 class MoneroTransferDetails(p.MessageType):
+    out_key = None
+    tx_pub_key = None
+    internal_output_index = None
 
     def __init__(
         self,
@@ -18,10 +21,13 @@ class MoneroTransferDetails(p.MessageType):
         additional_tx_pub_keys: List[bytes] = None,
         internal_output_index: int = None,
     ) -> None:
-        self.out_key = out_key
-        self.tx_pub_key = tx_pub_key
+        if out_key is not None:
+            self.out_key = out_key
+        if tx_pub_key is not None:
+            self.tx_pub_key = tx_pub_key
         self.additional_tx_pub_keys = additional_tx_pub_keys if additional_tx_pub_keys is not None else []
-        self.internal_output_index = internal_output_index
+        if internal_output_index is not None:
+            self.internal_output_index = internal_output_index
 
     @classmethod
     def get_fields(cls):
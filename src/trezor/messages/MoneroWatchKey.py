@@ -5,14 +5,18 @@ import protobuf as p
 
 class MoneroWatchKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 543
+    watch_key = None
+    address = None
 
     def __init__(
         self,
         watch_key: bytes = None,
         address: bytes = None,
     ) -> None:
-        self.watch_key = watch_key
-        self.address = address
+        if watch_key is not None:
+            self.watch_key = watch_key
+        if address is not None:
+            self.address = address
 
     @classmethod
     def get_fields(cls):
@@ -13,6 +13,7 @@ if __debug__:
 
 
 class MultisigRedeemScriptType(p.MessageType):
+    m = None
 
     def __init__(
         self,
@@ -24,7 +25,8 @@ class MultisigRedeemScriptType(p.MessageType):
     ) -> None:
         self.pubkeys = pubkeys if pubkeys is not None else []
         self.signatures = signatures if signatures is not None else []
-        self.m = m
+        if m is not None:
+            self.m = m
         self.nodes = nodes if nodes is not None else []
         self.address_n = address_n if address_n is not None else []
 
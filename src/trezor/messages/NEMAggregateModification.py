@@ -12,6 +12,7 @@ if __debug__:
 
 
 class NEMAggregateModification(p.MessageType):
+    relative_change = None
 
     def __init__(
         self,
@@ -19,7 +20,8 @@ class NEMAggregateModification(p.MessageType):
         relative_change: int = None,
     ) -> None:
         self.modifications = modifications if modifications is not None else []
-        self.relative_change = relative_change
+        if relative_change is not None:
+            self.relative_change = relative_change
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class NEMCosignatoryModification(p.MessageType):
+    type = None
+    public_key = None
 
     def __init__(
         self,
         type: int = None,
         public_key: bytes = None,
     ) -> None:
-        self.type = type
-        self.public_key = public_key
+        if type is not None:
+            self.type = type
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
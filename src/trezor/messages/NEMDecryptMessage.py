@@ -11,6 +11,9 @@ if __debug__:
 
 class NEMDecryptMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 75
+    network = None
+    public_key = None
+    payload = None
 
     def __init__(
         self,
@@ -20,9 +23,12 @@ class NEMDecryptMessage(p.MessageType):
         payload: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network = network
-        self.public_key = public_key
-        self.payload = payload
+        if network is not None:
+            self.network = network
+        if public_key is not None:
+            self.public_key = public_key
+        if payload is not None:
+            self.payload = payload
 
     @classmethod
     def get_fields(cls):
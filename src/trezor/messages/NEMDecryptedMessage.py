@@ -5,12 +5,14 @@ import protobuf as p
 
 class NEMDecryptedMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 76
+    payload = None
 
     def __init__(
         self,
         payload: bytes = None,
     ) -> None:
-        self.payload = payload
+        if payload is not None:
+            self.payload = payload
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,8 @@ if __debug__:
 
 class NEMGetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 67
+    network = None
+    show_display = None
 
     def __init__(
         self,
@@ -19,8 +21,10 @@ class NEMGetAddress(p.MessageType):
         show_display: bool = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network = network
-        self.show_display = show_display
+        if network is not None:
+            self.network = network
+        if show_display is not None:
+            self.show_display = show_display
 
     @classmethod
     def get_fields(cls):
@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class NEMImportanceTransfer(p.MessageType):
+    mode = None
+    public_key = None
 
     def __init__(
         self,
         mode: int = None,
         public_key: bytes = None,
     ) -> None:
-        self.mode = mode
-        self.public_key = public_key
+        if mode is not None:
+            self.mode = mode
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class NEMMosaic(p.MessageType):
+    namespace = None
+    mosaic = None
+    quantity = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class NEMMosaic(p.MessageType):
         mosaic: str = None,
         quantity: int = None,
     ) -> None:
-        self.namespace = namespace
-        self.mosaic = mosaic
-        self.quantity = quantity
+        if namespace is not None:
+            self.namespace = namespace
+        if mosaic is not None:
+            self.mosaic = mosaic
+        if quantity is not None:
+            self.quantity = quantity
 
     @classmethod
     def get_fields(cls):
@@ -6,6 +6,9 @@ from .NEMMosaicDefinition import NEMMosaicDefinition
 
 
 class NEMMosaicCreation(p.MessageType):
+    definition = None
+    sink = None
+    fee = None
 
     def __init__(
         self,
@@ -13,9 +16,12 @@ class NEMMosaicCreation(p.MessageType):
         sink: str = None,
         fee: int = None,
     ) -> None:
-        self.definition = definition
-        self.sink = sink
-        self.fee = fee
+        if definition is not None:
+            self.definition = definition
+        if sink is not None:
+            self.sink = sink
+        if fee is not None:
+            self.fee = fee
 
     @classmethod
     def get_fields(cls):
@@ -10,6 +10,20 @@ if __debug__:
 
 
 class NEMMosaicDefinition(p.MessageType):
+    name = None
+    ticker = None
+    namespace = None
+    mosaic = None
+    divisibility = None
+    levy = None
+    fee = None
+    levy_address = None
+    levy_namespace = None
+    levy_mosaic = None
+    supply = None
+    mutable_supply = None
+    transferable = None
+    description = None
 
     def __init__(
         self,
@@ -29,20 +43,34 @@ class NEMMosaicDefinition(p.MessageType):
         description: str = None,
         networks: List[int] = None,
     ) -> None:
-        self.name = name
-        self.ticker = ticker
-        self.namespace = namespace
-        self.mosaic = mosaic
-        self.divisibility = divisibility
-        self.levy = levy
-        self.fee = fee
-        self.levy_address = levy_address
-        self.levy_namespace = levy_namespace
-        self.levy_mosaic = levy_mosaic
-        self.supply = supply
-        self.mutable_supply = mutable_supply
-        self.transferable = transferable
-        self.description = description
+        if name is not None:
+            self.name = name
+        if ticker is not None:
+            self.ticker = ticker
+        if namespace is not None:
+            self.namespace = namespace
+        if mosaic is not None:
+            self.mosaic = mosaic
+        if divisibility is not None:
+            self.divisibility = divisibility
+        if levy is not None:
+            self.levy = levy
+        if fee is not None:
+            self.fee = fee
+        if levy_address is not None:
+            self.levy_address = levy_address
+        if levy_namespace is not None:
+            self.levy_namespace = levy_namespace
+        if levy_mosaic is not None:
+            self.levy_mosaic = levy_mosaic
+        if supply is not None:
+            self.supply = supply
+        if mutable_supply is not None:
+            self.mutable_supply = mutable_supply
+        if transferable is not None:
+            self.transferable = transferable
+        if description is not None:
+            self.description = description
         self.networks = networks if networks is not None else []
 
     @classmethod
@@ -4,6 +4,10 @@ import protobuf as p
 
 
 class NEMMosaicSupplyChange(p.MessageType):
+    namespace = None
+    mosaic = None
+    type = None
+    delta = None
 
     def __init__(
         self,
@@ -12,10 +16,14 @@ class NEMMosaicSupplyChange(p.MessageType):
         type: int = None,
         delta: int = None,
     ) -> None:
-        self.namespace = namespace
-        self.mosaic = mosaic
-        self.type = type
-        self.delta = delta
+        if namespace is not None:
+            self.namespace = namespace
+        if mosaic is not None:
+            self.mosaic = mosaic
+        if type is not None:
+            self.type = type
+        if delta is not None:
+            self.delta = delta
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,10 @@ import protobuf as p
 
 
 class NEMProvisionNamespace(p.MessageType):
+    namespace = None
+    parent = None
+    sink = None
+    fee = None
 
     def __init__(
         self,
@@ -12,10 +16,14 @@ class NEMProvisionNamespace(p.MessageType):
         sink: str = None,
         fee: int = None,
     ) -> None:
-        self.namespace = namespace
-        self.parent = parent
-        self.sink = sink
-        self.fee = fee
+        if namespace is not None:
+            self.namespace = namespace
+        if parent is not None:
+            self.parent = parent
+        if sink is not None:
+            self.sink = sink
+        if fee is not None:
+            self.fee = fee
 
     @classmethod
     def get_fields(cls):
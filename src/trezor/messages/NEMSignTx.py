@@ -13,6 +13,15 @@ from .NEMTransfer import NEMTransfer
 
 class NEMSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 69
+    transaction = None
+    multisig = None
+    transfer = None
+    cosigning = None
+    provision_namespace = None
+    mosaic_creation = None
+    supply_change = None
+    aggregate_modification = None
+    importance_transfer = None
 
     def __init__(
         self,
@@ -26,15 +35,24 @@ class NEMSignTx(p.MessageType):
         aggregate_modification: NEMAggregateModification = None,
         importance_transfer: NEMImportanceTransfer = None,
     ) -> None:
-        self.transaction = transaction
-        self.multisig = multisig
-        self.transfer = transfer
-        self.cosigning = cosigning
-        self.provision_namespace = provision_namespace
-        self.mosaic_creation = mosaic_creation
-        self.supply_change = supply_change
-        self.aggregate_modification = aggregate_modification
-        self.importance_transfer = importance_transfer
+        if transaction is not None:
+            self.transaction = transaction
+        if multisig is not None:
+            self.multisig = multisig
+        if transfer is not None:
+            self.transfer = transfer
+        if cosigning is not None:
+            self.cosigning = cosigning
+        if provision_namespace is not None:
+            self.provision_namespace = provision_namespace
+        if mosaic_creation is not None:
+            self.mosaic_creation = mosaic_creation
+        if supply_change is not None:
+            self.supply_change = supply_change
+        if aggregate_modification is not None:
+            self.aggregate_modification = aggregate_modification
+        if importance_transfer is not None:
+            self.importance_transfer = importance_transfer
 
     @classmethod
     def get_fields(cls):
@@ -5,14 +5,18 @@ import protobuf as p
 
 class NEMSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 70
+    data = None
+    signature = None
 
     def __init__(
         self,
         data: bytes = None,
         signature: bytes = None,
     ) -> None:
-        self.data = data
-        self.signature = signature
+        if data is not None:
+            self.data = data
+        if signature is not None:
+            self.signature = signature
 
     @classmethod
     def get_fields(cls):
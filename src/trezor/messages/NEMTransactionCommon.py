@@ -10,6 +10,11 @@ if __debug__:
 
 
 class NEMTransactionCommon(p.MessageType):
+    network = None
+    timestamp = None
+    fee = None
+    deadline = None
+    signer = None
 
     def __init__(
         self,
@@ -21,11 +26,16 @@ class NEMTransactionCommon(p.MessageType):
         signer: bytes = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network = network
-        self.timestamp = timestamp
-        self.fee = fee
-        self.deadline = deadline
-        self.signer = signer
+        if network is not None:
+            self.network = network
+        if timestamp is not None:
+            self.timestamp = timestamp
+        if fee is not None:
+            self.fee = fee
+        if deadline is not None:
+            self.deadline = deadline
+        if signer is not None:
+            self.signer = signer
 
     @classmethod
     def get_fields(cls):
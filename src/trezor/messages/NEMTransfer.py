@@ -12,6 +12,10 @@ if __debug__:
 
 
 class NEMTransfer(p.MessageType):
+    recipient = None
+    amount = None
+    payload = None
+    public_key = None
 
     def __init__(
         self,
@@ -21,10 +25,14 @@ class NEMTransfer(p.MessageType):
         public_key: bytes = None,
         mosaics: List[NEMMosaic] = None,
     ) -> None:
-        self.recipient = recipient
-        self.amount = amount
-        self.payload = payload
-        self.public_key = public_key
+        if recipient is not None:
+            self.recipient = recipient
+        if amount is not None:
+            self.amount = amount
+        if payload is not None:
+            self.payload = payload
+        if public_key is not None:
+            self.public_key = public_key
         self.mosaics = mosaics if mosaics is not None else []
 
     @classmethod
@@ -5,14 +5,18 @@ import protobuf as p
 
 class PassphraseAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 42
+    passphrase = None
+    state = None
 
     def __init__(
         self,
         passphrase: str = None,
         state: bytes = None,
     ) -> None:
-        self.passphrase = passphrase
-        self.state = state
+        if passphrase is not None:
+            self.passphrase = passphrase
+        if state is not None:
+            self.state = state
 
     @classmethod
     def get_fields(cls):
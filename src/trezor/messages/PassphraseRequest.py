@@ -5,12 +5,14 @@ import protobuf as p
 
 class PassphraseRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 41
+    on_device = None
 
     def __init__(
         self,
         on_device: bool = None,
     ) -> None:
-        self.on_device = on_device
+        if on_device is not None:
+            self.on_device = on_device
 
     @classmethod
     def get_fields(cls):
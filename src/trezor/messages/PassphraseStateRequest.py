@@ -5,12 +5,14 @@ import protobuf as p
 
 class PassphraseStateRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 77
+    state = None
 
     def __init__(
         self,
         state: bytes = None,
     ) -> None:
-        self.state = state
+        if state is not None:
+            self.state = state
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class PinMatrixAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 19
+    pin = None
 
     def __init__(
         self,
         pin: str = None,
     ) -> None:
-        self.pin = pin
+        if pin is not None:
+            self.pin = pin
 
     @classmethod
     def get_fields(cls):
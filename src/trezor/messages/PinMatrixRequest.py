@@ -5,12 +5,14 @@ import protobuf as p
 
 class PinMatrixRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 18
+    type = None
 
     def __init__(
         self,
         type: int = None,
     ) -> None:
-        self.type = type
+        if type is not None:
+            self.type = type
 
     @classmethod
     def get_fields(cls):
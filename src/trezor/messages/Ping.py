@@ -5,6 +5,10 @@ import protobuf as p
 
 class Ping(p.MessageType):
     MESSAGE_WIRE_TYPE = 1
+    message = None
+    button_protection = None
+    pin_protection = None
+    passphrase_protection = None
 
     def __init__(
         self,
@@ -13,10 +17,14 @@ class Ping(p.MessageType):
         pin_protection: bool = None,
         passphrase_protection: bool = None,
     ) -> None:
-        self.message = message
-        self.button_protection = button_protection
-        self.pin_protection = pin_protection
-        self.passphrase_protection = passphrase_protection
+        if message is not None:
+            self.message = message
+        if button_protection is not None:
+            self.button_protection = button_protection
+        if pin_protection is not None:
+            self.pin_protection = pin_protection
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
 
     @classmethod
     def get_fields(cls):
@@ -7,14 +7,18 @@ from .HDNodeType import HDNodeType
 
 class PublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 12
+    node = None
+    xpub = None
 
     def __init__(
         self,
         node: HDNodeType = None,
         xpub: str = None,
     ) -> None:
-        self.node = node
-        self.xpub = xpub
+        if node is not None:
+            self.node = node
+        if xpub is not None:
+            self.xpub = xpub
 
     @classmethod
     def get_fields(cls):
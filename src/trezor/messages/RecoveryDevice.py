@@ -5,6 +5,15 @@ import protobuf as p
 
 class RecoveryDevice(p.MessageType):
     MESSAGE_WIRE_TYPE = 45
+    word_count = None
+    passphrase_protection = None
+    pin_protection = None
+    language = None
+    label = None
+    enforce_wordlist = None
+    type = None
+    u2f_counter = None
+    dry_run = None
 
     def __init__(
         self,
@@ -18,15 +27,24 @@ class RecoveryDevice(p.MessageType):
         u2f_counter: int = None,
         dry_run: bool = None,
     ) -> None:
-        self.word_count = word_count
-        self.passphrase_protection = passphrase_protection
-        self.pin_protection = pin_protection
-        self.language = language
-        self.label = label
-        self.enforce_wordlist = enforce_wordlist
-        self.type = type
-        self.u2f_counter = u2f_counter
-        self.dry_run = dry_run
+        if word_count is not None:
+            self.word_count = word_count
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
+        if pin_protection is not None:
+            self.pin_protection = pin_protection
+        if language is not None:
+            self.language = language
+        if label is not None:
+            self.label = label
+        if enforce_wordlist is not None:
+            self.enforce_wordlist = enforce_wordlist
+        if type is not None:
+            self.type = type
+        if u2f_counter is not None:
+            self.u2f_counter = u2f_counter
+        if dry_run is not None:
+            self.dry_run = dry_run
 
     @classmethod
     def get_fields(cls):
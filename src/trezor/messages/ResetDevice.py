@@ -5,6 +5,15 @@ import protobuf as p
 
 class ResetDevice(p.MessageType):
     MESSAGE_WIRE_TYPE = 14
+    display_random = None
+    strength = None
+    passphrase_protection = None
+    pin_protection = None
+    language = None
+    label = None
+    u2f_counter = None
+    skip_backup = None
+    no_backup = None
 
     def __init__(
         self,
@@ -18,15 +27,24 @@ class ResetDevice(p.MessageType):
         skip_backup: bool = None,
         no_backup: bool = None,
     ) -> None:
-        self.display_random = display_random
-        self.strength = strength
-        self.passphrase_protection = passphrase_protection
-        self.pin_protection = pin_protection
-        self.language = language
-        self.label = label
-        self.u2f_counter = u2f_counter
-        self.skip_backup = skip_backup
-        self.no_backup = no_backup
+        if display_random is not None:
+            self.display_random = display_random
+        if strength is not None:
+            self.strength = strength
+        if passphrase_protection is not None:
+            self.passphrase_protection = passphrase_protection
+        if pin_protection is not None:
+            self.pin_protection = pin_protection
+        if language is not None:
+            self.language = language
+        if label is not None:
+            self.label = label
+        if u2f_counter is not None:
+            self.u2f_counter = u2f_counter
+        if skip_backup is not None:
+            self.skip_backup = skip_backup
+        if no_backup is not None:
+            self.no_backup = no_backup
 
     @classmethod
     def get_fields(cls):
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class RipplePayment(p.MessageType):
+    amount = None
+    destination = None
+    destination_tag = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class RipplePayment(p.MessageType):
         destination: str = None,
         destination_tag: int = None,
     ) -> None:
-        self.amount = amount
-        self.destination = destination
-        self.destination_tag = destination_tag
+        if amount is not None:
+            self.amount = amount
+        if destination is not None:
+            self.destination = destination
+        if destination_tag is not None:
+            self.destination_tag = destination_tag
 
     @classmethod
     def get_fields(cls):
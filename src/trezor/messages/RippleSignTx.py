@@ -13,6 +13,11 @@ if __debug__:
 
 class RippleSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 402
+    fee = None
+    flags = None
+    sequence = None
+    last_ledger_sequence = None
+    payment = None
 
     def __init__(
         self,
@@ -24,11 +29,16 @@ class RippleSignTx(p.MessageType):
         payment: RipplePayment = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.fee = fee
-        self.flags = flags
-        self.sequence = sequence
-        self.last_ledger_sequence = last_ledger_sequence
-        self.payment = payment
+        if fee is not None:
+            self.fee = fee
+        if flags is not None:
+            self.flags = flags
+        if sequence is not None:
+            self.sequence = sequence
+        if last_ledger_sequence is not None:
+            self.last_ledger_sequence = last_ledger_sequence
+        if payment is not None:
+            self.payment = payment
 
     @classmethod
     def get_fields(cls):
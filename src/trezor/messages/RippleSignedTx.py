@@ -5,14 +5,18 @@ import protobuf as p
 
 class RippleSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 403
+    signature = None
+    serialized_tx = None
 
     def __init__(
         self,
         signature: bytes = None,
         serialized_tx: bytes = None,
     ) -> None:
-        self.signature = signature
-        self.serialized_tx = serialized_tx
+        if signature is not None:
+            self.signature = signature
+        if serialized_tx is not None:
+            self.serialized_tx = serialized_tx
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class SetU2FCounter(p.MessageType):
     MESSAGE_WIRE_TYPE = 63
+    u2f_counter = None
 
     def __init__(
         self,
         u2f_counter: int = None,
     ) -> None:
-        self.u2f_counter = u2f_counter
+        if u2f_counter is not None:
+            self.u2f_counter = u2f_counter
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,10 @@ from .IdentityType import IdentityType
 
 class SignIdentity(p.MessageType):
     MESSAGE_WIRE_TYPE = 53
+    identity = None
+    challenge_hidden = None
+    challenge_visual = None
+    ecdsa_curve_name = None
 
     def __init__(
         self,
@@ -15,10 +19,14 @@ class SignIdentity(p.MessageType):
         challenge_visual: str = None,
         ecdsa_curve_name: str = None,
     ) -> None:
-        self.identity = identity
-        self.challenge_hidden = challenge_hidden
-        self.challenge_visual = challenge_visual
-        self.ecdsa_curve_name = ecdsa_curve_name
+        if identity is not None:
+            self.identity = identity
+        if challenge_hidden is not None:
+            self.challenge_hidden = challenge_hidden
+        if challenge_visual is not None:
+            self.challenge_visual = challenge_visual
+        if ecdsa_curve_name is not None:
+            self.ecdsa_curve_name = ecdsa_curve_name
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,9 @@ if __debug__:
 
 class SignMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 38
+    message = None
+    coin_name = None
+    script_type = None
 
     def __init__(
         self,
@@ -20,9 +23,12 @@ class SignMessage(p.MessageType):
         script_type: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.message = message
-        self.coin_name = coin_name
-        self.script_type = script_type
+        if message is not None:
+            self.message = message
+        if coin_name is not None:
+            self.coin_name = coin_name
+        if script_type is not None:
+            self.script_type = script_type
 
     @classmethod
     def get_fields(cls):
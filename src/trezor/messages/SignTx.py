@@ -5,6 +5,17 @@ import protobuf as p
 
 class SignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 15
+    outputs_count = None
+    inputs_count = None
+    coin_name = None
+    version = None
+    lock_time = None
+    expiry = None
+    overwintered = None
+    version_group_id = None
+    timestamp = None
+    branch_id = None
+    batch_size = None
 
     def __init__(
         self,
@@ -18,17 +29,30 @@ class SignTx(p.MessageType):
         version_group_id: int = None,
         timestamp: int = None,
         branch_id: int = None,
+        batch_size: int = None,
     ) -> None:
-        self.outputs_count = outputs_count
-        self.inputs_count = inputs_count
-        self.coin_name = coin_name
-        self.version = version
-        self.lock_time = lock_time
-        self.expiry = expiry
-        self.overwintered = overwintered
-        self.version_group_id = version_group_id
-        self.timestamp = timestamp
-        self.branch_id = branch_id
+        if outputs_count is not None:
+            self.outputs_count = outputs_count
+        if inputs_count is not None:
+            self.inputs_count = inputs_count
+        if coin_name is not None:
+            self.coin_name = coin_name
+        if version is not None:
+            self.version = version
+        if lock_time is not None:
+            self.lock_time = lock_time
+        if expiry is not None:
+            self.expiry = expiry
+        if overwintered is not None:
+            self.overwintered = overwintered
+        if version_group_id is not None:
+            self.version_group_id = version_group_id
+        if timestamp is not None:
+            self.timestamp = timestamp
+        if branch_id is not None:
+            self.branch_id = branch_id
+        if batch_size is not None:
+            self.batch_size = batch_size
 
     @classmethod
     def get_fields(cls):
@@ -43,4 +67,5 @@ class SignTx(p.MessageType):
             8: ('version_group_id', p.UVarintType, 0),
             9: ('timestamp', p.UVarintType, 0),
             10: ('branch_id', p.UVarintType, 0),
+            1000: ('batch_size', p.UVarintType, 0),
         }
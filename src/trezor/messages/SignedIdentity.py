@@ -5,6 +5,9 @@ import protobuf as p
 
 class SignedIdentity(p.MessageType):
     MESSAGE_WIRE_TYPE = 54
+    address = None
+    public_key = None
+    signature = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class SignedIdentity(p.MessageType):
         public_key: bytes = None,
         signature: bytes = None,
     ) -> None:
-        self.address = address
-        self.public_key = public_key
-        self.signature = signature
+        if address is not None:
+            self.address = address
+        if public_key is not None:
+            self.public_key = public_key
+        if signature is not None:
+            self.signature = signature
 
     @classmethod
     def get_fields(cls):
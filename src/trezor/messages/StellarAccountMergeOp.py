@@ -5,14 +5,18 @@ import protobuf as p
 
 class StellarAccountMergeOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 218
+    source_account = None
+    destination_account = None
 
     def __init__(
         self,
         source_account: str = None,
         destination_account: str = None,
     ) -> None:
-        self.source_account = source_account
-        self.destination_account = destination_account
+        if source_account is not None:
+            self.source_account = source_account
+        if destination_account is not None:
+            self.destination_account = destination_account
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,11 @@ import protobuf as p
 
 class StellarAllowTrustOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 217
+    source_account = None
+    trusted_account = None
+    asset_type = None
+    asset_code = None
+    is_authorized = None
 
     def __init__(
         self,
@@ -14,11 +19,16 @@ class StellarAllowTrustOp(p.MessageType):
         asset_code: str = None,
         is_authorized: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.trusted_account = trusted_account
-        self.asset_type = asset_type
-        self.asset_code = asset_code
-        self.is_authorized = is_authorized
+        if source_account is not None:
+            self.source_account = source_account
+        if trusted_account is not None:
+            self.trusted_account = trusted_account
+        if asset_type is not None:
+            self.asset_type = asset_type
+        if asset_code is not None:
+            self.asset_code = asset_code
+        if is_authorized is not None:
+            self.is_authorized = is_authorized
 
     @classmethod
     def get_fields(cls):
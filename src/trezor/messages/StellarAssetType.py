@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class StellarAssetType(p.MessageType):
+    type = None
+    code = None
+    issuer = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class StellarAssetType(p.MessageType):
         code: str = None,
         issuer: str = None,
     ) -> None:
-        self.type = type
-        self.code = code
-        self.issuer = issuer
+        if type is not None:
+            self.type = type
+        if code is not None:
+            self.code = code
+        if issuer is not None:
+            self.issuer = issuer
 
     @classmethod
     def get_fields(cls):
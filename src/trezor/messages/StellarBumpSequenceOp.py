@@ -5,14 +5,18 @@ import protobuf as p
 
 class StellarBumpSequenceOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 221
+    source_account = None
+    bump_to = None
 
     def __init__(
         self,
         source_account: str = None,
         bump_to: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.bump_to = bump_to
+        if source_account is not None:
+            self.source_account = source_account
+        if bump_to is not None:
+            self.bump_to = bump_to
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,9 @@ from .StellarAssetType import StellarAssetType
 
 class StellarChangeTrustOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 216
+    source_account = None
+    asset = None
+    limit = None
 
     def __init__(
         self,
@@ -14,9 +17,12 @@ class StellarChangeTrustOp(p.MessageType):
         asset: StellarAssetType = None,
         limit: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.asset = asset
-        self.limit = limit
+        if source_account is not None:
+            self.source_account = source_account
+        if asset is not None:
+            self.asset = asset
+        if limit is not None:
+            self.limit = limit
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class StellarCreateAccountOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 210
+    source_account = None
+    new_account = None
+    starting_balance = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class StellarCreateAccountOp(p.MessageType):
         new_account: str = None,
         starting_balance: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.new_account = new_account
-        self.starting_balance = starting_balance
+        if source_account is not None:
+            self.source_account = source_account
+        if new_account is not None:
+            self.new_account = new_account
+        if starting_balance is not None:
+            self.starting_balance = starting_balance
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,12 @@ from .StellarAssetType import StellarAssetType
 
 class StellarCreatePassiveOfferOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 214
+    source_account = None
+    selling_asset = None
+    buying_asset = None
+    amount = None
+    price_n = None
+    price_d = None
 
     def __init__(
         self,
@@ -17,12 +23,18 @@ class StellarCreatePassiveOfferOp(p.MessageType):
         price_n: int = None,
         price_d: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.selling_asset = selling_asset
-        self.buying_asset = buying_asset
-        self.amount = amount
-        self.price_n = price_n
-        self.price_d = price_d
+        if source_account is not None:
+            self.source_account = source_account
+        if selling_asset is not None:
+            self.selling_asset = selling_asset
+        if buying_asset is not None:
+            self.buying_asset = buying_asset
+        if amount is not None:
+            self.amount = amount
+        if price_n is not None:
+            self.price_n = price_n
+        if price_d is not None:
+            self.price_d = price_d
 
     @classmethod
     def get_fields(cls):
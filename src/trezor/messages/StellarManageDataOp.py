@@ -5,6 +5,9 @@ import protobuf as p
 
 class StellarManageDataOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 220
+    source_account = None
+    key = None
+    value = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class StellarManageDataOp(p.MessageType):
         key: str = None,
         value: bytes = None,
     ) -> None:
-        self.source_account = source_account
-        self.key = key
-        self.value = value
+        if source_account is not None:
+            self.source_account = source_account
+        if key is not None:
+            self.key = key
+        if value is not None:
+            self.value = value
 
     @classmethod
     def get_fields(cls):
@@ -7,6 +7,13 @@ from .StellarAssetType import StellarAssetType
 
 class StellarManageOfferOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 213
+    source_account = None
+    selling_asset = None
+    buying_asset = None
+    amount = None
+    price_n = None
+    price_d = None
+    offer_id = None
 
     def __init__(
         self,
@@ -18,13 +25,20 @@ class StellarManageOfferOp(p.MessageType):
         price_d: int = None,
         offer_id: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.selling_asset = selling_asset
-        self.buying_asset = buying_asset
-        self.amount = amount
-        self.price_n = price_n
-        self.price_d = price_d
-        self.offer_id = offer_id
+        if source_account is not None:
+            self.source_account = source_account
+        if selling_asset is not None:
+            self.selling_asset = selling_asset
+        if buying_asset is not None:
+            self.buying_asset = buying_asset
+        if amount is not None:
+            self.amount = amount
+        if price_n is not None:
+            self.price_n = price_n
+        if price_d is not None:
+            self.price_d = price_d
+        if offer_id is not None:
+            self.offer_id = offer_id
 
     @classmethod
     def get_fields(cls):
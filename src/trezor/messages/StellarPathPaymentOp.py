@@ -13,6 +13,12 @@ if __debug__:
 
 class StellarPathPaymentOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 212
+    source_account = None
+    send_asset = None
+    send_max = None
+    destination_account = None
+    destination_asset = None
+    destination_amount = None
 
     def __init__(
         self,
@@ -24,12 +30,18 @@ class StellarPathPaymentOp(p.MessageType):
         destination_amount: int = None,
         paths: List[StellarAssetType] = None,
     ) -> None:
-        self.source_account = source_account
-        self.send_asset = send_asset
-        self.send_max = send_max
-        self.destination_account = destination_account
-        self.destination_asset = destination_asset
-        self.destination_amount = destination_amount
+        if source_account is not None:
+            self.source_account = source_account
+        if send_asset is not None:
+            self.send_asset = send_asset
+        if send_max is not None:
+            self.send_max = send_max
+        if destination_account is not None:
+            self.destination_account = destination_account
+        if destination_asset is not None:
+            self.destination_asset = destination_asset
+        if destination_amount is not None:
+            self.destination_amount = destination_amount
         self.paths = paths if paths is not None else []
 
     @classmethod
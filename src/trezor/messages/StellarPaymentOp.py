@@ -7,6 +7,10 @@ from .StellarAssetType import StellarAssetType
 
 class StellarPaymentOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 211
+    source_account = None
+    destination_account = None
+    asset = None
+    amount = None
 
     def __init__(
         self,
@@ -15,10 +19,14 @@ class StellarPaymentOp(p.MessageType):
         asset: StellarAssetType = None,
         amount: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.destination_account = destination_account
-        self.asset = asset
-        self.amount = amount
+        if source_account is not None:
+            self.source_account = source_account
+        if destination_account is not None:
+            self.destination_account = destination_account
+        if asset is not None:
+            self.asset = asset
+        if amount is not None:
+            self.amount = amount
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,18 @@ import protobuf as p
 
 class StellarSetOptionsOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 215
+    source_account = None
+    inflation_destination_account = None
+    clear_flags = None
+    set_flags = None
+    master_weight = None
+    low_threshold = None
+    medium_threshold = None
+    high_threshold = None
+    home_domain = None
+    signer_type = None
+    signer_key = None
+    signer_weight = None
 
     def __init__(
         self,
@@ -21,18 +33,30 @@ class StellarSetOptionsOp(p.MessageType):
         signer_key: bytes = None,
         signer_weight: int = None,
     ) -> None:
-        self.source_account = source_account
-        self.inflation_destination_account = inflation_destination_account
-        self.clear_flags = clear_flags
-        self.set_flags = set_flags
-        self.master_weight = master_weight
-        self.low_threshold = low_threshold
-        self.medium_threshold = medium_threshold
-        self.high_threshold = high_threshold
-        self.home_domain = home_domain
-        self.signer_type = signer_type
-        self.signer_key = signer_key
-        self.signer_weight = signer_weight
+        if source_account is not None:
+            self.source_account = source_account
+        if inflation_destination_account is not None:
+            self.inflation_destination_account = inflation_destination_account
+        if clear_flags is not None:
+            self.clear_flags = clear_flags
+        if set_flags is not None:
+            self.set_flags = set_flags
+        if master_weight is not None:
+            self.master_weight = master_weight
+        if low_threshold is not None:
+            self.low_threshold = low_threshold
+        if medium_threshold is not None:
+            self.medium_threshold = medium_threshold
+        if high_threshold is not None:
+            self.high_threshold = high_threshold
+        if home_domain is not None:
+            self.home_domain = home_domain
+        if signer_type is not None:
+            self.signer_type = signer_type
+        if signer_key is not None:
+            self.signer_key = signer_key
+        if signer_weight is not None:
+            self.signer_weight = signer_weight
 
     @classmethod
     def get_fields(cls):
@@ -11,6 +11,17 @@ if __debug__:
 
 class StellarSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 202
+    network_passphrase = None
+    source_account = None
+    fee = None
+    sequence_number = None
+    timebounds_start = None
+    timebounds_end = None
+    memo_type = None
+    memo_text = None
+    memo_id = None
+    memo_hash = None
+    num_operations = None
 
     def __init__(
         self,
@@ -28,17 +39,28 @@ class StellarSignTx(p.MessageType):
         num_operations: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.network_passphrase = network_passphrase
-        self.source_account = source_account
-        self.fee = fee
-        self.sequence_number = sequence_number
-        self.timebounds_start = timebounds_start
-        self.timebounds_end = timebounds_end
-        self.memo_type = memo_type
-        self.memo_text = memo_text
-        self.memo_id = memo_id
-        self.memo_hash = memo_hash
-        self.num_operations = num_operations
+        if network_passphrase is not None:
+            self.network_passphrase = network_passphrase
+        if source_account is not None:
+            self.source_account = source_account
+        if fee is not None:
+            self.fee = fee
+        if sequence_number is not None:
+            self.sequence_number = sequence_number
+        if timebounds_start is not None:
+            self.timebounds_start = timebounds_start
+        if timebounds_end is not None:
+            self.timebounds_end = timebounds_end
+        if memo_type is not None:
+            self.memo_type = memo_type
+        if memo_text is not None:
+            self.memo_text = memo_text
+        if memo_id is not None:
+            self.memo_id = memo_id
+        if memo_hash is not None:
+            self.memo_hash = memo_hash
+        if num_operations is not None:
+            self.num_operations = num_operations
 
     @classmethod
     def get_fields(cls):
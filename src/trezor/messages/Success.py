@@ -5,12 +5,14 @@ import protobuf as p
 
 class Success(p.MessageType):
     MESSAGE_WIRE_TYPE = 2
+    message = None
 
     def __init__(
         self,
         message: str = None,
     ) -> None:
-        self.message = message
+        if message is not None:
+            self.message = message
 
     @classmethod
     def get_fields(cls):
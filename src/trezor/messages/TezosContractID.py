@@ -4,14 +4,18 @@ import protobuf as p
 
 
 class TezosContractID(p.MessageType):
+    tag = None
+    hash = None
 
     def __init__(
         self,
         tag: int = None,
         hash: bytes = None,
     ) -> None:
-        self.tag = tag
-        self.hash = hash
+        if tag is not None:
+            self.tag = tag
+        if hash is not None:
+            self.hash = hash
 
     @classmethod
     def get_fields(cls):
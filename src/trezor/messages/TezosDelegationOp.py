@@ -6,6 +6,12 @@ from .TezosContractID import TezosContractID
 
 
 class TezosDelegationOp(p.MessageType):
+    source = None
+    fee = None
+    counter = None
+    gas_limit = None
+    storage_limit = None
+    delegate = None
 
     def __init__(
         self,
@@ -16,12 +22,18 @@ class TezosDelegationOp(p.MessageType):
         storage_limit: int = None,
         delegate: bytes = None,
     ) -> None:
-        self.source = source
-        self.fee = fee
-        self.counter = counter
-        self.gas_limit = gas_limit
-        self.storage_limit = storage_limit
-        self.delegate = delegate
+        if source is not None:
+            self.source = source
+        if fee is not None:
+            self.fee = fee
+        if counter is not None:
+            self.counter = counter
+        if gas_limit is not None:
+            self.gas_limit = gas_limit
+        if storage_limit is not None:
+            self.storage_limit = storage_limit
+        if delegate is not None:
+            self.delegate = delegate
 
     @classmethod
     def get_fields(cls):
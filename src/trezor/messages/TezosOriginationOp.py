@@ -6,6 +6,17 @@ from .TezosContractID import TezosContractID
 
 
 class TezosOriginationOp(p.MessageType):
+    source = None
+    fee = None
+    counter = None
+    gas_limit = None
+    storage_limit = None
+    manager_pubkey = None
+    balance = None
+    spendable = None
+    delegatable = None
+    delegate = None
+    script = None
 
     def __init__(
         self,
@@ -21,17 +32,28 @@ class TezosOriginationOp(p.MessageType):
         delegate: bytes = None,
         script: bytes = None,
     ) -> None:
-        self.source = source
-        self.fee = fee
-        self.counter = counter
-        self.gas_limit = gas_limit
-        self.storage_limit = storage_limit
-        self.manager_pubkey = manager_pubkey
-        self.balance = balance
-        self.spendable = spendable
-        self.delegatable = delegatable
-        self.delegate = delegate
-        self.script = script
+        if source is not None:
+            self.source = source
+        if fee is not None:
+            self.fee = fee
+        if counter is not None:
+            self.counter = counter
+        if gas_limit is not None:
+            self.gas_limit = gas_limit
+        if storage_limit is not None:
+            self.storage_limit = storage_limit
+        if manager_pubkey is not None:
+            self.manager_pubkey = manager_pubkey
+        if balance is not None:
+            self.balance = balance
+        if spendable is not None:
+            self.spendable = spendable
+        if delegatable is not None:
+            self.delegatable = delegatable
+        if delegate is not None:
+            self.delegate = delegate
+        if script is not None:
+            self.script = script
 
     @classmethod
     def get_fields(cls):
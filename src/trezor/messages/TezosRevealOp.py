@@ -6,6 +6,12 @@ from .TezosContractID import TezosContractID
 
 
 class TezosRevealOp(p.MessageType):
+    source = None
+    fee = None
+    counter = None
+    gas_limit = None
+    storage_limit = None
+    public_key = None
 
     def __init__(
         self,
@@ -16,12 +22,18 @@ class TezosRevealOp(p.MessageType):
         storage_limit: int = None,
         public_key: bytes = None,
     ) -> None:
-        self.source = source
-        self.fee = fee
-        self.counter = counter
-        self.gas_limit = gas_limit
-        self.storage_limit = storage_limit
-        self.public_key = public_key
+        if source is not None:
+            self.source = source
+        if fee is not None:
+            self.fee = fee
+        if counter is not None:
+            self.counter = counter
+        if gas_limit is not None:
+            self.gas_limit = gas_limit
+        if storage_limit is not None:
+            self.storage_limit = storage_limit
+        if public_key is not None:
+            self.public_key = public_key
 
     @classmethod
     def get_fields(cls):
@@ -16,6 +16,11 @@ if __debug__:
 
 class TezosSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 152
+    branch = None
+    reveal = None
+    transaction = None
+    origination = None
+    delegation = None
 
     def __init__(
         self,
@@ -27,11 +32,16 @@ class TezosSignTx(p.MessageType):
         delegation: TezosDelegationOp = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.branch = branch
-        self.reveal = reveal
-        self.transaction = transaction
-        self.origination = origination
-        self.delegation = delegation
+        if branch is not None:
+            self.branch = branch
+        if reveal is not None:
+            self.reveal = reveal
+        if transaction is not None:
+            self.transaction = transaction
+        if origination is not None:
+            self.origination = origination
+        if delegation is not None:
+            self.delegation = delegation
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,9 @@ import protobuf as p
 
 class TezosSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 153
+    signature = None
+    sig_op_contents = None
+    operation_hash = None
 
     def __init__(
         self,
@@ -12,9 +15,12 @@ class TezosSignedTx(p.MessageType):
         sig_op_contents: bytes = None,
         operation_hash: str = None,
     ) -> None:
-        self.signature = signature
-        self.sig_op_contents = sig_op_contents
-        self.operation_hash = operation_hash
+        if signature is not None:
+            self.signature = signature
+        if sig_op_contents is not None:
+            self.sig_op_contents = sig_op_contents
+        if operation_hash is not None:
+            self.operation_hash = operation_hash
 
     @classmethod
     def get_fields(cls):
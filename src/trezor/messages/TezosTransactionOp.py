@@ -6,6 +6,14 @@ from .TezosContractID import TezosContractID
 
 
 class TezosTransactionOp(p.MessageType):
+    source = None
+    fee = None
+    counter = None
+    gas_limit = None
+    storage_limit = None
+    amount = None
+    destination = None
+    parameters = None
 
     def __init__(
         self,
@@ -18,14 +26,22 @@ class TezosTransactionOp(p.MessageType):
         destination: TezosContractID = None,
         parameters: bytes = None,
     ) -> None:
-        self.source = source
-        self.fee = fee
-        self.counter = counter
-        self.gas_limit = gas_limit
-        self.storage_limit = storage_limit
-        self.amount = amount
-        self.destination = destination
-        self.parameters = parameters
+        if source is not None:
+            self.source = source
+        if fee is not None:
+            self.fee = fee
+        if counter is not None:
+            self.counter = counter
+        if gas_limit is not None:
+            self.gas_limit = gas_limit
+        if storage_limit is not None:
+            self.storage_limit = storage_limit
+        if amount is not None:
+            self.amount = amount
+        if destination is not None:
+            self.destination = destination
+        if parameters is not None:
+            self.parameters = parameters
 
     @classmethod
     def get_fields(cls):
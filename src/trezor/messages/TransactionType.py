@@ -14,6 +14,17 @@ if __debug__:
 
 
 class TransactionType(p.MessageType):
+    version = None
+    lock_time = None
+    inputs_cnt = None
+    outputs_cnt = None
+    extra_data = None
+    extra_data_len = None
+    expiry = None
+    overwintered = None
+    version_group_id = None
+    timestamp = None
+    branch_id = None
 
     def __init__(
         self,
@@ -32,20 +43,31 @@ class TransactionType(p.MessageType):
         timestamp: int = None,
         branch_id: int = None,
     ) -> None:
-        self.version = version
+        if version is not None:
+            self.version = version
         self.inputs = inputs if inputs is not None else []
         self.bin_outputs = bin_outputs if bin_outputs is not None else []
-        self.lock_time = lock_time
+        if lock_time is not None:
+            self.lock_time = lock_time
         self.outputs = outputs if outputs is not None else []
-        self.inputs_cnt = inputs_cnt
-        self.outputs_cnt = outputs_cnt
-        self.extra_data = extra_data
-        self.extra_data_len = extra_data_len
-        self.expiry = expiry
-        self.overwintered = overwintered
-        self.version_group_id = version_group_id
-        self.timestamp = timestamp
-        self.branch_id = branch_id
+        if inputs_cnt is not None:
+            self.inputs_cnt = inputs_cnt
+        if outputs_cnt is not None:
+            self.outputs_cnt = outputs_cnt
+        if extra_data is not None:
+            self.extra_data = extra_data
+        if extra_data_len is not None:
+            self.extra_data_len = extra_data_len
+        if expiry is not None:
+            self.expiry = expiry
+        if overwintered is not None:
+            self.overwintered = overwintered
+        if version_group_id is not None:
+            self.version_group_id = version_group_id
+        if timestamp is not None:
+            self.timestamp = timestamp
+        if branch_id is not None:
+            self.branch_id = branch_id
 
     @classmethod
     def get_fields(cls):
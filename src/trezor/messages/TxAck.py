@@ -7,12 +7,14 @@ from .TransactionType import TransactionType
 
 class TxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 22
+    tx = None
 
     def __init__(
         self,
         tx: TransactionType = None,
     ) -> None:
-        self.tx = tx
+        if tx is not None:
+            self.tx = tx
 
     @classmethod
     def get_fields(cls):
@@ -12,6 +12,17 @@ if __debug__:
 
 
 class TxInputType(p.MessageType):
+    prev_hash = None
+    prev_index = None
+    script_sig = None
+    sequence = None
+    script_type = None
+    multisig = None
+    amount = None
+    decred_tree = None
+    decred_script_version = None
+    prev_block_hash_bip115 = None
+    prev_block_height_bip115 = None
 
     def __init__(
         self,
@@ -29,17 +40,28 @@ class TxInputType(p.MessageType):
         prev_block_height_bip115: int = None,
     ) -> None:
         self.address_n = address_n if address_n is not None else []
-        self.prev_hash = prev_hash
-        self.prev_index = prev_index
-        self.script_sig = script_sig
-        self.sequence = sequence
-        self.script_type = script_type
-        self.multisig = multisig
-        self.amount = amount
-        self.decred_tree = decred_tree
-        self.decred_script_version = decred_script_version
-        self.prev_block_hash_bip115 = prev_block_hash_bip115
-        self.prev_block_height_bip115 = prev_block_height_bip115
+        if prev_hash is not None:
+            self.prev_hash = prev_hash
+        if prev_index is not None:
+            self.prev_index = prev_index
+        if script_sig is not None:
+            self.script_sig = script_sig
+        if sequence is not None:
+            self.sequence = sequence
+        if script_type is not None:
+            self.script_type = script_type
+        if multisig is not None:
+            self.multisig = multisig
+        if amount is not None:
+            self.amount = amount
+        if decred_tree is not None:
+            self.decred_tree = decred_tree
+        if decred_script_version is not None:
+            self.decred_script_version = decred_script_version
+        if prev_block_hash_bip115 is not None:
+            self.prev_block_hash_bip115 = prev_block_hash_bip115
+        if prev_block_height_bip115 is not None:
+            self.prev_block_height_bip115 = prev_block_height_bip115
 
     @classmethod
     def get_fields(cls):
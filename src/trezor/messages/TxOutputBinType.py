@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class TxOutputBinType(p.MessageType):
+    amount = None
+    script_pubkey = None
+    decred_script_version = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class TxOutputBinType(p.MessageType):
         script_pubkey: bytes = None,
         decred_script_version: int = None,
     ) -> None:
-        self.amount = amount
-        self.script_pubkey = script_pubkey
-        self.decred_script_version = decred_script_version
+        if amount is not None:
+            self.amount = amount
+        if script_pubkey is not None:
+            self.script_pubkey = script_pubkey
+        if decred_script_version is not None:
+            self.decred_script_version = decred_script_version
 
     @classmethod
     def get_fields(cls):
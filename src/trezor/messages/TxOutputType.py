@@ -12,6 +12,14 @@ if __debug__:
 
 
 class TxOutputType(p.MessageType):
+    address = None
+    amount = None
+    script_type = None
+    multisig = None
+    op_return_data = None
+    decred_script_version = None
+    block_hash_bip115 = None
+    block_height_bip115 = None
 
     def __init__(
         self,
@@ -25,15 +33,23 @@ class TxOutputType(p.MessageType):
         block_hash_bip115: bytes = None,
         block_height_bip115: int = None,
     ) -> None:
-        self.address = address
+        if address is not None:
+            self.address = address
         self.address_n = address_n if address_n is not None else []
-        self.amount = amount
-        self.script_type = script_type
-        self.multisig = multisig
-        self.op_return_data = op_return_data
-        self.decred_script_version = decred_script_version
-        self.block_hash_bip115 = block_hash_bip115
-        self.block_height_bip115 = block_height_bip115
+        if amount is not None:
+            self.amount = amount
+        if script_type is not None:
+            self.script_type = script_type
+        if multisig is not None:
+            self.multisig = multisig
+        if op_return_data is not None:
+            self.op_return_data = op_return_data
+        if decred_script_version is not None:
+            self.decred_script_version = decred_script_version
+        if block_hash_bip115 is not None:
+            self.block_hash_bip115 = block_hash_bip115
+        if block_height_bip115 is not None:
+            self.block_height_bip115 = block_height_bip115
 
     @classmethod
     def get_fields(cls):
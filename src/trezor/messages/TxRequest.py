@@ -8,6 +8,9 @@ from .TxRequestSerializedType import TxRequestSerializedType
 
 class TxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 21
+    request_type = None
+    details = None
+    serialized = None
 
     def __init__(
         self,
@@ -15,9 +18,12 @@ class TxRequest(p.MessageType):
         details: TxRequestDetailsType = None,
         serialized: TxRequestSerializedType = None,
     ) -> None:
-        self.request_type = request_type
-        self.details = details
-        self.serialized = serialized
+        if request_type is not None:
+            self.request_type = request_type
+        if details is not None:
+            self.details = details
+        if serialized is not None:
+            self.serialized = serialized
 
     @classmethod
     def get_fields(cls):
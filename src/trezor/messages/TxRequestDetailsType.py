@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TxRequestDetailsType(p.MessageType):
+    request_index = None
+    tx_hash = None
+    extra_data_len = None
+    extra_data_offset = None
+    request_count = None
 
     def __init__(
         self,
@@ -11,11 +16,18 @@ class TxRequestDetailsType(p.MessageType):
         tx_hash: bytes = None,
         extra_data_len: int = None,
         extra_data_offset: int = None,
+        request_count: int = None,
     ) -> None:
-        self.request_index = request_index
-        self.tx_hash = tx_hash
-        self.extra_data_len = extra_data_len
-        self.extra_data_offset = extra_data_offset
+        if request_index is not None:
+            self.request_index = request_index
+        if tx_hash is not None:
+            self.tx_hash = tx_hash
+        if extra_data_len is not None:
+            self.extra_data_len = extra_data_len
+        if extra_data_offset is not None:
+            self.extra_data_offset = extra_data_offset
+        if request_count is not None:
+            self.request_count = request_count
 
     @classmethod
     def get_fields(cls):
@@ -24,4 +36,5 @@ class TxRequestDetailsType(p.MessageType):
             2: ('tx_hash', p.BytesType, 0),
             3: ('extra_data_len', p.UVarintType, 0),
             4: ('extra_data_offset', p.UVarintType, 0),
+            1000: ('request_count', p.UVarintType, 0),
         }
@@ -4,6 +4,9 @@ import protobuf as p
 
 
 class TxRequestSerializedType(p.MessageType):
+    signature_index = None
+    signature = None
+    serialized_tx = None
 
     def __init__(
         self,
@@ -11,9 +14,12 @@ class TxRequestSerializedType(p.MessageType):
         signature: bytes = None,
         serialized_tx: bytes = None,
     ) -> None:
-        self.signature_index = signature_index
-        self.signature = signature
-        self.serialized_tx = serialized_tx
+        if signature_index is not None:
+            self.signature_index = signature_index
+        if signature is not None:
+            self.signature = signature
+        if serialized_tx is not None:
+            self.serialized_tx = serialized_tx
 
     @classmethod
     def get_fields(cls):
@@ -5,6 +5,10 @@ import protobuf as p
 
 class VerifyMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 39
+    address = None
+    signature = None
+    message = None
+    coin_name = None
 
     def __init__(
         self,
@@ -13,10 +17,14 @@ class VerifyMessage(p.MessageType):
         message: bytes = None,
         coin_name: str = None,
     ) -> None:
-        self.address = address
-        self.signature = signature
-        self.message = message
-        self.coin_name = coin_name
+        if address is not None:
+            self.address = address
+        if signature is not None:
+            self.signature = signature
+        if message is not None:
+            self.message = message
+        if coin_name is not None:
+            self.coin_name = coin_name
 
     @classmethod
     def get_fields(cls):
@@ -5,12 +5,14 @@ import protobuf as p
 
 class WordAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 47
+    word = None
 
     def __init__(
         self,
         word: str = None,
     ) -> None:
-        self.word = word
+        if word is not None:
+            self.word = word
 
     @classmethod
     def get_fields(cls):
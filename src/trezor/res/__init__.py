@@ -1,14 +1,44 @@
+import ustruct
+
 try:
     from .resources import resdata
 except ImportError:
     resdata = None
 
+_loaded = {}  # resources already looked up, so loads return the same object
+
 
 def load(name):
     """
-    Loads resource of a given name as bytes.
+    Loads resource of a given name as a read-only buffer.
     """
-    return resdata[name]
+    data = _loaded.get(name)
+    if data is None:
+        data = _loaded[name] = _find(name)
+    return data
+
+
+def _find(name):
+    # binary search over the sorted index of the archive, see tools/res_collect
+    key = name.encode()
+    count = ustruct.unpack_from("<H", resdata, 0)[0]
+    lo = 0
+    hi = count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        name_ofs, data_ofs = ustruct.unpack_from("<II", resdata, 2 + mid * 8)
+        entry = resdata[name_ofs:data_ofs]
+        if entry < key:
+            lo = mid + 1
+        elif key < entry:
+            hi = mid
+        else:
+            if mid + 1 < count:
+                end = ustruct.unpack_from("<I", resdata, 2 + (mid + 1) * 8)[0]
+            else:
+                end = len(resdata)
+            return memoryview(resdata)[data_ofs:end]
+    raise KeyError(name)
 
 
 def gettext(message):
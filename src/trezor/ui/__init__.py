@@ -7,18 +7,46 @@ from trezor import io, loop, res, utils, workflow
 
 display = Display()
 
-# in debug mode, display an indicator in top right corner
-if __debug__:
-
-    def debug_display_refresh():
+# minimal delay between two display refreshes, in microseconds
+_REFRESH_US = const(1000000 // 60)
+_refresh_last = 0
+_refresh_pending = False
+
+
+def _display_refresh():
+    global _refresh_last, _refresh_pending
+    _refresh_pending = False
+    _refresh_last = utime.ticks_us()
+    if __debug__:
+        # in debug mode, display an indicator in top right corner
         display.bar(Display.WIDTH - 8, 0, 8, 8, 0xF800)
-        display.refresh()
+    display.refresh()
+
+
+async def _deferred_refresh():
+    _display_refresh()
+
+
+def _schedule_refresh():
+    """
+    Refreshes the display after a task step, at most once per frame.  Steps
+    that come too soon after the last refresh are coalesced into one refresh
+    scheduled at the start of the next frame.
+    """
+    global _refresh_pending
+    if _refresh_pending:
+        return
+    deadline = utime.ticks_add(_refresh_last, _REFRESH_US)
+    if utime.ticks_diff(deadline, utime.ticks_us()) <= 0:
+        _display_refresh()
+    else:
+        _refresh_pending = True
+        loop.schedule(_deferred_refresh(), None, deadline)
 
-    loop.after_step_hook = debug_display_refresh
 
 # in both debug and production, emulator needs to draw the screen explicitly
-elif utils.EMULATOR:
-    loop.after_step_hook = display.refresh
+if __debug__ or utils.EMULATOR:
+    loop.after_step_hook = _schedule_refresh
 
 # re-export constants from modtrezorui
 NORMAL = Display.FONT_NORMAL
@@ -14,6 +14,7 @@ class Loader(ui.Widget):
         self.active_style = style["active"] or ui.LDR_DEFAULT["active"]
         self.start_ms = None
         self.stop_ms = None
+        self.drawn = None  # last rendered (progress, style)
 
     def start(self):
         self.start_ms = utime.ticks_ms()
@@ -46,6 +47,9 @@ class Loader(ui.Widget):
             s = self.active_style
         else:
             s = self.normal_style
+        if self.drawn is not None and self.drawn[0] == r and self.drawn[1] is s:
+            return  # nothing changed since the last frame
+        self.drawn = (r, s)
         if s["icon"] is None:
             ui.display.loader(r, -24, s["fg-color"], s["bg-color"])
         elif s["icon-fg-color"] is None:
@@ -63,6 +67,7 @@ class Loader(ui.Widget):
     def __iter__(self):
         sleep = loop.sleep(1000000 // 30)  # 30 fps
         ui.display.bar(0, 32, ui.WIDTH, ui.HEIGHT - 83, ui.BG)  # clear
+        self.drawn = None
         while self.is_active():
             self.render()
             yield sleep
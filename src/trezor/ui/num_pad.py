@@ -23,27 +23,35 @@ class NumPad(ui.Widget):
 
         self._generate_buttons()
 
+    def taint(self):
+        super().taint()
+        for btn in self.buttons:
+            btn.taint()
+
     def render(self):
         for btn in self.buttons:
             btn.render()
 
         # header label
-        display.text_center(ui.WIDTH // 2, 36, self.label, ui.BOLD, ui.GREY, ui.BG)
+        if self.tainted:
+            display.text_center(ui.WIDTH // 2, 36, self.label, ui.BOLD, ui.GREY, ui.BG)
+            self.tainted = False
 
     def touch(self, event, pos):
         for btn in self.buttons:
             if btn.touch(event, pos) == BTN_CLICKED:
-                if "+" in btn.content:
-                    self.page += 1
-                    self._generate_buttons()
-                elif isinstance(btn.content, bytes):
+                if not isinstance(btn.content, str):
                     self.page -= 1
                     self._generate_buttons()
+                elif "+" in btn.content:
+                    self.page += 1
+                    self._generate_buttons()
                 else:
                     return btn.content
 
     def _generate_buttons(self):
         display.clear()  # we need to clear old buttons
+        self.tainted = True
         start = self.start + (ITEMS_PER_PAGE + 1) * self.page - self.page
         end = min(self.end, (ITEMS_PER_PAGE + 1) * (self.page + 1) - self.page)
 
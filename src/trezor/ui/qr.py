@@ -8,4 +8,6 @@ class Qr(ui.Widget):
         self.scale = scale
 
     def render(self):
-        ui.display.qrcode(self.pos[0], self.pos[1], self.data, self.scale)
+        if self.tainted:
+            ui.display.qrcode(self.pos[0], self.pos[1], self.data, self.scale)
+            self.tainted = False
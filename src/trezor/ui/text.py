@@ -13,11 +13,28 @@ BR = const(-256)
 BR_HALF = const(-257)
 
 
-def render_text(words: list, new_lines: bool, max_lines: int) -> None:
+_advances = {}  # font -> advance widths of printable ASCII glyphs
+
+
+def char_width(char: str, font: int) -> int:
+    advances = _advances.get(font)
+    if advances is None:
+        advances = _advances[font] = ui.display.text_advances(font)
+    c = ord(char) - 32
+    if 0 <= c < len(advances):
+        return advances[c]
+    return ui.display.text_width(char, font)
+
+
+def layout_text(words: list, new_lines: bool, max_lines: int) -> list:
+    """
+    Breaks words into lines and returns a list of spans to draw, each
+    given as (x, y, text, font, fgcolor).
+    """
+    spans = []
     # initial rendering state
     font = ui.NORMAL
     fg = ui.FG
-    bg = ui.BG
     offset_x = TEXT_MARGIN_LEFT
     offset_y = TEXT_HEADER_HEIGHT + TEXT_LINE_HEIGHT
     OFFSET_X_MAX = ui.WIDTH
@@ -25,9 +42,9 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
     FONTS = (ui.NORMAL, ui.BOLD, ui.MONO, ui.MONO_BOLD)
 
     # sizes of common glyphs
-    SPACE = ui.display.text_width(" ", font)
-    DASH = ui.display.text_width("-", ui.BOLD)
-    ELLIPSIS = ui.display.text_width("...", ui.BOLD)
+    SPACE = char_width(" ", font)
+    DASH = char_width("-", ui.BOLD)
+    ELLIPSIS = char_width(".", ui.BOLD) * 3
 
     for word_index, word in enumerate(words):
         has_next_word = word_index < len(words) - 1
@@ -36,8 +53,8 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
             if word in [BR, BR_HALF]:
                 # line break or half-line break
                 if offset_y >= OFFSET_Y_MAX:
-                    ui.display.text(offset_x, offset_y, "...", ui.BOLD, ui.GREY, bg)
-                    return
+                    spans.append((offset_x, offset_y, "...", ui.BOLD, ui.GREY))
+                    return spans
                 offset_x = TEXT_MARGIN_LEFT
                 offset_y += TEXT_LINE_HEIGHT if word == BR else TEXT_LINE_HEIGHT_HALF
             elif word in FONTS:
@@ -73,33 +90,31 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
                 splitw = ELLIPSIS
             # find span that fits
             for index in range(len(word) - 1, 0, -1):
-                letter = word[index]
-                width -= ui.display.text_width(letter, font)
+                width -= char_width(word[index], font)
                 if offset_x + width + splitw < OFFSET_X_MAX:
                     break
             else:
                 index = 0
-            span = word[:index]
-            # render word span
-            ui.display.text(offset_x, offset_y, span, font, fg, bg)
-            ui.display.text(offset_x + width, offset_y, split, ui.BOLD, ui.GREY, bg)
+            # word span
+            spans.append((offset_x, offset_y, word[:index], font, fg))
+            spans.append((offset_x + width, offset_y, split, ui.BOLD, ui.GREY))
             # line break
             if offset_y >= OFFSET_Y_MAX:
-                return
+                return spans
             offset_x = TEXT_MARGIN_LEFT
             offset_y += TEXT_LINE_HEIGHT
             # continue with the rest
             word = word[index:]
             width = ui.display.text_width(word, font)
 
-        # render word
-        ui.display.text(offset_x, offset_y, word, font, fg, bg)
+        # word
+        spans.append((offset_x, offset_y, word, font, fg))
 
         if new_lines and has_next_word:
             # line break
             if offset_y >= OFFSET_Y_MAX:
-                ui.display.text(offset_x, offset_y, "...", ui.BOLD, ui.GREY, bg)
-                return
+                spans.append((offset_x, offset_y, "...", ui.BOLD, ui.GREY))
+                return spans
             offset_x = TEXT_MARGIN_LEFT
             offset_y += TEXT_LINE_HEIGHT
         else:
@@ -107,6 +122,18 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
             offset_x += width
             offset_x += SPACE
 
+    return spans
+
+
+def render_spans(spans: list) -> None:
+    bg = ui.BG
+    for x, y, text, font, fg in spans:
+        ui.display.text(x, y, text, font, fg, bg)
+
+
+def render_text(words: list, new_lines: bool, max_lines: int) -> None:
+    render_spans(layout_text(words, new_lines, max_lines))
+
 
 class Text(ui.Widget):
     def __init__(
@@ -123,28 +150,36 @@ class Text(ui.Widget):
         self.max_lines = max_lines
         self.new_lines = new_lines
         self.content = []
+        self.spans = None  # cached layout of content, reset on every change
+        self.spans_args = None  # new_lines and max_lines used for the layout
 
     def normal(self, *content):
         self.content.append(ui.NORMAL)
         self.content.extend(content)
+        self.spans = None
 
     def bold(self, *content):
         self.content.append(ui.BOLD)
         self.content.extend(content)
+        self.spans = None
 
     def mono(self, *content):
         self.content.append(ui.MONO)
         self.content.extend(content)
+        self.spans = None
 
     def mono_bold(self, *content):
         self.content.append(ui.MONO_BOLD)
         self.content.extend(content)
+        self.spans = None
 
     def br(self):
         self.content.append(BR)
+        self.spans = None
 
     def br_half(self):
         self.content.append(BR_HALF)
+        self.spans = None
 
     def render(self):
         if self.tainted:
@@ -155,5 +190,9 @@ class Text(ui.Widget):
                 ui.BG,
                 self.icon_color,
             )
-            render_text(self.content, self.new_lines, self.max_lines)
+            args = (self.new_lines, self.max_lines)
+            if self.spans is None or self.spans_args != args:
+                self.spans = layout_text(self.content, *args)
+                self.spans_args = args
+            render_spans(self.spans)
             self.tainted = False
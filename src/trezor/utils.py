@@ -90,12 +90,16 @@ class HashWriter:
 
 def obj_eq(l, r):
     """
-    Compares object contents, supports __slots__.
+    Compares object contents, either the attributes listed in `__slots__`
+    or the instance `__dict__`.
     """
     if l.__class__ is not r.__class__:
         return False
     if hasattr(l, "__slots__"):
-        return obj_slots_dict(l) == obj_slots_dict(r)
+        for f in l.__slots__:
+            if getattr(l, f, None) != getattr(r, f, None):
+                return False
+        return True
     else:
         return l.__dict__ == r.__dict__
 
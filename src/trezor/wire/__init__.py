@@ -52,11 +52,13 @@ class Context:
         del msg
         return await self.read(types)
 
-    async def read(self, types):
+    async def read(self, types, max_size=None):
         """
         Wait for incoming message on this wire context and return it.  Raises
         `UnexpectedMessageError` if the message type does not match one of
-        `types`; and caller should always make sure to re-raise it.
+        `types`; and caller should always make sure to re-raise it.  Raises
+        `DataError` without decoding the message if it is longer than
+        `max_size` bytes.
         """
         reader = self.getreader()
 
@@ -72,6 +74,11 @@ class Context:
         if reader.type not in types:
             raise UnexpectedMessageError(reader)
 
+        # drop a message that is too large before it is decoded on the heap
+        if max_size is not None and reader.size > max_size:
+            await reader.askip(reader.size)
+            raise DataError("Message too large")
+
         # look up the protobuf class and parse the message
         pbtype = messages.get_type(reader.type)
         return await protobuf.load_message(reader, pbtype)
@@ -87,13 +94,13 @@ class Context:
                 __name__, "%s:%x write: %s", self.iface.iface_num(), self.sid, msg
             )
 
-        # get the message size
-        fields = msg.get_fields()
-        size = protobuf.count_message(msg, fields)
+        # get the message size, together with the sizes of nested messages
+        sizes = []
+        size = protobuf.count_message(msg, sizes)
 
         # write the message
         writer.setheader(msg.MESSAGE_WIRE_TYPE, size)
-        await protobuf.dump_message(writer, msg, fields)
+        await protobuf.dump_message(writer, msg, sizes)
         await writer.aclose()
 
     def wait(self, *tasks):
@@ -201,9 +208,7 @@ async def unexpected_msg(ctx, reader):
     from trezor.messages.Failure import Failure
 
     # receive the message and throw it away
-    while reader.size > 0:
-        buf = bytearray(reader.size)
-        await reader.areadinto(buf)
+    await reader.askip(reader.size)
 
     # respond with an unknown message error
     await ctx.write(
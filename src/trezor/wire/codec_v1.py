@@ -62,17 +62,15 @@ class Reader:
         if self.size < len(buf):
             raise EOFError
 
-        read = loop.wait(self.iface.iface_num() | io.POLL_READ)
+        read = None
         nread = 0
         while nread < len(buf):
             if self.ofs == len(self.data):
                 # we are at the end of received data
                 # wait for continuation report
-                while True:
-                    report = await read
-                    marker = report[0]
-                    if marker == _REP_MARKER:
-                        break
+                if read is None:
+                    read = loop.wait(self.iface.iface_num() | io.POLL_READ)
+                report = await _read_cont_report(read)
                 self.data = report[_REP_CONT_DATA : _REP_CONT_DATA + self.size]
                 self.ofs = 0
 
@@ -84,6 +82,57 @@ class Reader:
 
         return nread
 
+    async def askip(self, n):
+        """
+        Skip the next `n` bytes of the message, waiting for additional reports,
+        if needed.  Reports that are skipped over entirely are dropped without
+        copying their data.  Raises `EOFError` if end-of-message is encountered
+        before `n` bytes can be skipped.
+        """
+        if self.size < n:
+            raise EOFError
+
+        read = None
+        while n > 0:
+            if self.ofs == len(self.data):
+                if read is None:
+                    read = loop.wait(self.iface.iface_num() | io.POLL_READ)
+                report = await _read_cont_report(read)
+                nbytes = min(len(report) - _REP_CONT_DATA, self.size)
+                if nbytes <= n:
+                    # drop the whole report
+                    n -= nbytes
+                    self.size -= nbytes
+                    continue
+                self.data = report[_REP_CONT_DATA : _REP_CONT_DATA + self.size]
+                self.ofs = 0
+
+            nbytes = min(n, len(self.data) - self.ofs)
+            n -= nbytes
+            self.ofs += nbytes
+            self.size -= nbytes
+
+    def readbyte(self):
+        """
+        Read one byte from the already received report data, without waiting.
+        Returns -1 if the report is exhausted, in which case `areadinto()` has
+        to be awaited to continue (or to raise `EOFError`).
+        """
+        ofs = self.ofs
+        if ofs < len(self.data):
+            self.ofs = ofs + 1
+            self.size -= 1
+            return self.data[ofs]
+        return -1
+
+
+async def _read_cont_report(read):
+    while True:
+        report = await read
+        marker = report[0]
+        if marker == _REP_MARKER:
+            return report
+
 
 class Writer:
     """
@@ -5,3 +5,12 @@ sys.path.append('../src')
 from ubinascii import hexlify, unhexlify  # noqa: F401
 
 import unittest  # noqa: F401
+
+
+def run(task):
+    """Drives a coroutine that does not wait on any event to completion."""
+    try:
+        while True:
+            task.send(None)
+    except StopIteration as e:
+        return e.value
@@ -0,0 +1,76 @@
+from trezor import utils
+from trezor.crypto.hashlib import sha256
+from trezor.messages.RequestType import TXINPUT, TXMETA, TXOUTPUT
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxRequest import TxRequest
+
+from apps.wallet.sign_tx import writers
+
+
+def make_inputs(n):
+    return [TxInputType(prev_hash=bytes(32), prev_index=i, script_sig=b"\x51", sequence=0xffffffff) for i in range(n)]
+
+
+def make_outputs(n):
+    return [TxOutputBinType(amount=(o + 1) * 1000, script_pubkey=b"\x51") for o in range(n)]
+
+
+def make_prevtx(inputs_cnt, outputs_cnt):
+    """
+    Returns the meta, inputs, outputs and hash of a previous transaction,
+    output `o` has an amount of `(o + 1) * 1000`.
+    """
+    inputs = make_inputs(inputs_cnt)
+    outputs = make_outputs(outputs_cnt)
+    meta = TransactionType(version=1, lock_time=0, inputs_cnt=inputs_cnt, outputs_cnt=outputs_cnt, extra_data_len=0)
+
+    h = utils.HashWriter(sha256())
+    writers.write_uint32(h, 1)
+    writers.write_varint(h, inputs_cnt)
+    for i in inputs:
+        writers.write_tx_input(h, i)
+    writers.write_varint(h, outputs_cnt)
+    for o in outputs:
+        writers.write_tx_output(h, o)
+    writers.write_uint32(h, 0)
+    prev_hash = writers.get_tx_hash(h, double=True, reverse=True)
+    return meta, inputs, outputs, prev_hash
+
+
+class Host:
+    """
+    Answers the TxRequests for one transaction, identified by `tx_hash`, and
+    records each of them as a tuple of request type, index, count and whether
+    serialized data was attached.
+    """
+
+    def __init__(self, meta, inputs, outputs, tx_hash=None):
+        self.meta = meta
+        self.inputs = inputs
+        self.outputs = outputs
+        self.tx_hash = tx_hash
+        self.requests = []
+
+    def ack(self, req):
+        assert isinstance(req, TxRequest)
+        assert req.details.tx_hash == self.tx_hash
+        self.requests.append((req.request_type, req.details.request_index, req.details.request_count, req.serialized is not None))
+        if req.request_type == TXMETA:
+            return TxAck(tx=self.meta)
+        i = req.details.request_index
+        n = req.details.request_count or 1
+        if req.request_type == TXINPUT:
+            return TxAck(tx=TransactionType(inputs=self.inputs[i:i + n]))
+        if req.request_type == TXOUTPUT:
+            return TxAck(tx=TransactionType(bin_outputs=self.outputs[i:i + n]))
+
+    def run(self, task):
+        res = None
+        try:
+            while True:
+                res = self.ack(task.send(res))
+        except StopIteration as e:
+            return e.value
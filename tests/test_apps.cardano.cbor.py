@@ -3,7 +3,8 @@ from common import *
 from apps.cardano.cbor import (
     Tagged,
     IndefiniteLengthArray,
-    encode
+    encode,
+    encode_streamed,
 )
 from ubinascii import unhexlify
 
@@ -51,6 +52,8 @@ class TestCardanoCbor(unittest.TestCase):
         for val, expected in test_vectors:
             encoded = encode(val)
             self.assertEqual(unhexlify(expected), encoded)
+            streamed = b"".join(encode_streamed(val))
+            self.assertEqual(unhexlify(expected), streamed)
 
 if __name__ == '__main__':
     unittest.main()
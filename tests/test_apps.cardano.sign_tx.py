@@ -0,0 +1,42 @@
+from common import *
+
+from apps.cardano import cbor
+from apps.cardano.sign_tx import process_transaction
+from trezor.crypto import hashlib
+from trezor.messages.CardanoTxInputType import CardanoTxInputType
+
+
+def make_transaction(amounts):
+    outputs = [[("address %d" % i).encode(), amount] for i, amount in enumerate(amounts)]
+    raw = cbor.encode([[], outputs, {}])
+    return raw, hashlib.blake2b(data=raw, outlen=32).digest()
+
+
+class TestCardanoSignTx(unittest.TestCase):
+
+    def test_process_transaction(self):
+        raw1, hash1 = make_transaction([100, 200, 300])
+        raw2, hash2 = make_transaction([5000])
+        inputs = [
+            CardanoTxInputType(prev_hash=hash2, prev_index=0),
+            CardanoTxInputType(prev_hash=hash1, prev_index=2),
+            CardanoTxInputType(prev_hash=bytes(32), prev_index=0),
+            CardanoTxInputType(prev_hash=hash1, prev_index=0),
+        ]
+        input_coins = [None] * len(inputs)
+        process_transaction(inputs, input_coins, raw1)
+        self.assertEqual(input_coins, [None, 300, None, 100])
+        process_transaction(inputs, input_coins, raw2)
+        self.assertEqual(input_coins, [5000, 300, None, 100])
+
+    def test_many_inputs(self):
+        for count in (1, 10, 50):
+            raw, tx_hash = make_transaction(list(range(1, count + 1)))
+            inputs = [CardanoTxInputType(prev_hash=tx_hash, prev_index=i) for i in range(count)]
+            input_coins = [None] * count
+            process_transaction(inputs, input_coins, raw)
+            self.assertEqual(sum(input_coins), count * (count + 1) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,11 +20,19 @@ class TestCoins(unittest.TestCase):
             self.assertEqual(c1, c2)
             self.assertEqual(c1.address_type, a)
 
+    def test_slip44(self):
+        self.assertEqual(coins.by_slip44(0).coin_name, 'Bitcoin')
+        self.assertEqual(coins.by_slip44(1).coin_name, 'Testnet')
+        self.assertEqual(coins.by_slip44(2).coin_shortcut, 'LTC')
+        self.assertTrue(coins.by_slip44(0) is coins.by_name('Bitcoin'))
+
     def test_failure(self):
         with self.assertRaises(ValueError):
             coins.by_shortcut('XXX')
         with self.assertRaises(ValueError):
             coins.by_name('XXXXX')
+        with self.assertRaises(ValueError):
+            coins.by_slip44(0xFFFF)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+from common import *
+
+from trezor import wire
+from trezor.crypto import bip32, bip39
+from apps.common import HARDENED, cache
+from apps.common.seed import Keychain, _NODE_CACHE_SIZE
+
+
+class TestKeychain(unittest.TestCase):
+
+    def test_derive_cached(self):
+        seed = bip39.seed("alcohol woman abuse must during monitor noble actual mixed trade anger aisle", "")
+        keychain = Keychain(seed, [["secp256k1", 44 | HARDENED]])
+        account = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED]
+
+        for chain in range(2):
+            for i in range(5):
+                path = account + [chain, i]
+                node = keychain.derive(path)
+                expected = bip32.from_seed(seed, "secp256k1")
+                expected.derive_path(path)
+                self.assertEqual(node.private_key(), expected.private_key())
+                self.assertEqual(node.fingerprint(), expected.fingerprint())
+                self.assertEqual(node.depth(), 5)
+
+        # one parent node per chain
+        self.assertEqual(len(keychain.nodes), 2)
+
+    def test_derive_evicted(self):
+        seed = bip39.seed("alcohol woman abuse must during monitor noble actual mixed trade anger aisle", "")
+        keychain = Keychain(seed, [["secp256k1", 44 | HARDENED]])
+
+        for account in range(_NODE_CACHE_SIZE + 2):
+            keychain.derive([44 | HARDENED, 0 | HARDENED, account | HARDENED, 0, 0])
+        self.assertEqual(len(keychain.nodes), _NODE_CACHE_SIZE)
+
+        # the least recently used parent was evicted and is derived again
+        path = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED, 0, 1]
+        expected = bip32.from_seed(seed, "secp256k1")
+        expected.derive_path(path)
+        self.assertEqual(keychain.derive(path).private_key(), expected.private_key())
+
+        # short paths are derived from the root directly
+        path = [44 | HARDENED, 0 | HARDENED]
+        expected = bip32.from_seed(seed, "secp256k1")
+        expected.derive_path(path)
+        self.assertEqual(keychain.derive(path).private_key(), expected.private_key())
+
+    def test_derive_public(self):
+        seed = bip39.seed("alcohol woman abuse must during monitor noble actual mixed trade anger aisle", "")
+        cache.clear()
+        cache.set_seed(seed)
+        account = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED]
+
+        for i in range(3):
+            keychain = Keychain(seed, [["secp256k1", 44 | HARDENED]])
+            path = account + [0, i]
+            node = keychain.derive_public(path)
+            expected = keychain.derive(path)
+            self.assertEqual(node.public_key(), expected.public_key())
+            self.assertEqual(node.fingerprint(), expected.fingerprint())
+            self.assertEqual(node.chain_code(), expected.chain_code())
+            self.assertEqual(node.private_key(), bytes(32))
+            keychain.__del__()
+
+        # the account node is shared across keychains
+        self.assertEqual(cache.get_public_node("secp256k1", account).public_key(), Keychain(seed, [["secp256k1"]]).derive(account).public_key())
+
+        # but not across key-spaces
+        keychain = Keychain(seed, [["secp256k1", 49 | HARDENED]])
+        with self.assertRaises(wire.DataError):
+            keychain.derive_public(account + [0, 0])
+
+        cache.set_passphrase("secret")
+        self.assertEqual(cache.get_public_node("secp256k1", account), None)
+        cache.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
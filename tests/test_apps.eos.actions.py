@@ -0,0 +1,134 @@
+from common import *
+
+import gc
+from trezor.crypto.hashlib import sha256
+from trezor.messages.EosActionCommon import EosActionCommon
+from trezor.messages.EosActionTransfer import EosActionTransfer
+from trezor.messages.EosActionUnknown import EosActionUnknown
+from trezor.messages.EosAsset import EosAsset
+from trezor.messages.EosPermissionLevel import EosPermissionLevel
+from trezor.messages.EosTxActionAck import EosTxActionAck
+from trezor.utils import HashWriter
+
+from apps.eos import actions, writers
+
+ACCOUNT_EOSIO_TOKEN = 0x5530EA033482A600  # eosio.token
+ACCOUNT_CUSTOM = 0x3232C6C8D4B2A000
+NAME_TRANSFER = 0xCDCD3C2D57000000  # transfer
+NAME_CUSTOM = 0x3232C6C8D4B2A000
+
+CHUNK_SIZE = 2048
+
+
+async def confirm(*args):
+    pass
+
+
+class Context:
+    def __init__(self, ack):
+        self.ack = ack
+        self.calls = 0
+
+    async def call(self, msg, *types):
+        self.calls += 1
+        return self.ack
+
+
+def common(account, name):
+    return EosActionCommon(
+        account=account,
+        name=name,
+        authorization=[EosPermissionLevel(actor=ACCOUNT_CUSTOM, permission=1)],
+    )
+
+
+def process(ctx, action):
+    sha = HashWriter(sha256())
+    run(actions.process_action(ctx, sha, action))
+    return sha.get_digest()
+
+
+class TestEosActions(unittest.TestCase):
+    def setUp(self):
+        self.layout = (actions.layout.confirm_action_transfer, actions.layout.confirm_action_unknown)
+        actions.layout.confirm_action_transfer = confirm
+        actions.layout.confirm_action_unknown = confirm
+
+    def tearDown(self):
+        actions.layout.confirm_action_transfer, actions.layout.confirm_action_unknown = self.layout
+
+    def test_transfer(self):
+        transfer = EosActionTransfer(
+            sender=ACCOUNT_CUSTOM,
+            receiver=ACCOUNT_EOSIO_TOKEN,
+            quantity=EosAsset(amount=10000, symbol=0x534f4504),
+            memo="memo",
+        )
+        action = EosTxActionAck(common=common(ACCOUNT_EOSIO_TOKEN, NAME_TRANSFER), transfer=transfer)
+
+        data = bytearray()
+        writers.write_action_transfer(data, transfer)
+        expected = bytearray()
+        writers.write_action_common(expected, action.common)
+        writers.write_variant32(expected, len(data))
+        expected.extend(data)
+
+        self.assertEqual(process(None, action), sha256(expected).digest())
+
+    def test_unknown(self):
+        data_size = 3 * CHUNK_SIZE + 100
+        data = bytes(i & 0xFF for i in range(data_size))
+
+        class ChunkedContext:
+            def __init__(self):
+                self.ofs = CHUNK_SIZE
+
+            async def call(self, msg, *types):
+                self.ofs += CHUNK_SIZE
+                chunk = data[self.ofs - CHUNK_SIZE : self.ofs]
+                return EosTxActionAck(unknown=EosActionUnknown(data_size=data_size, data_chunk=chunk))
+
+        action = EosTxActionAck(
+            common=common(ACCOUNT_CUSTOM, NAME_CUSTOM),
+            unknown=EosActionUnknown(data_size=data_size, data_chunk=data[:CHUNK_SIZE]),
+        )
+
+        expected = bytearray()
+        writers.write_action_common(expected, action.common)
+        writers.write_variant32(expected, data_size)
+        expected.extend(data)
+
+        self.assertEqual(process(ChunkedContext(), action), sha256(expected).digest())
+
+    def test_unknown_overflow(self):
+        action = EosTxActionAck(
+            common=common(ACCOUNT_CUSTOM, NAME_CUSTOM),
+            unknown=EosActionUnknown(data_size=10, data_chunk=bytes(20)),
+        )
+        with self.assertRaises(ValueError):
+            process(Context(None), action)
+
+    def test_unknown_heap(self):
+        chunk = bytes(CHUNK_SIZE)
+
+        def heap_used(data_size):
+            ack = EosTxActionAck(unknown=EosActionUnknown(data_size=data_size, data_chunk=chunk))
+            action = EosTxActionAck(common=common(ACCOUNT_CUSTOM, NAME_CUSTOM), unknown=ack.unknown)
+            ctx = Context(ack)
+            gc.collect()
+            gc.disable()
+            before = gc.mem_alloc()
+            process(ctx, action)
+            used = gc.mem_alloc() - before
+            gc.enable()
+            self.assertEqual(ctx.calls, data_size // CHUNK_SIZE - 1)
+            return used
+
+        used_small = heap_used(CHUNK_SIZE)
+        used_large = heap_used(32 * CHUNK_SIZE)  # 64 KB
+        # the payload is hashed as it arrives and never buffered
+        self.assertTrue(used_large - used_small < 8 * CHUNK_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
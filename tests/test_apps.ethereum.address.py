@@ -1,7 +1,7 @@
 from common import *
 from apps.common.paths import HARDENED
 from apps.ethereum.address import address_from_bytes, bytes_from_address, validate_full_path
-from apps.ethereum.networks import NetworkInfo, by_chain_id
+from apps.ethereum.networks import NetworkInfo, by_chain_id, by_slip44
 
 
 class TestEthereumGetAddress(unittest.TestCase):
@@ -78,6 +78,15 @@ class TestEthereumGetAddress(unittest.TestCase):
         for path in correct_paths:
             self.assertTrue(validate_full_path(path))
 
+    def test_networks(self):
+        n = by_chain_id(1)
+        self.assertEqual((n.chain_id, n.slip44, n.shortcut, n.rskip60), (1, 60, 'ETH', False))
+        n = by_chain_id(30)
+        self.assertEqual((n.shortcut, n.rskip60), ('RBTC', True))
+        self.assertEqual(by_slip44(6060).chain_id, 60)
+        self.assertEqual(by_chain_id(999999), None)
+        self.assertEqual(by_slip44(999999), None)
+
 
 if __name__ == '__main__':
     unittest.main()
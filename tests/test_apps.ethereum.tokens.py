@@ -20,10 +20,23 @@ class TestEthereumTokens(unittest.TestCase):
         token = tokens.token_by_chain_address(8, b'\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67')
         self.assertEqual(token[2], 'QWARK')
 
+        # first and last record of the table
+        token = tokens.token_by_chain_address(1, b'\x00\x00\x00\x00\x00\x08\x5d\x47\x80\xb7\x31\x19\xb6\x44\xae\x5e\xcd\x22\xb3\x76')
+        self.assertEqual(token[2], 'TUSD')
+        self.assertEqual(token[3], 18)
+
+        token = tokens.token_by_chain_address(31102, b'\x72\xea\x35\x08\xd9\xd8\x17\xa9\x14\x65\xab\xb5\x9b\xe1\x0f\xef\x98\x57\xa0\x55')
+        self.assertEqual(token[2], 'DGT')
+        self.assertEqual(token[3], 0)
+
         # invalid adress, invalid chain
         token = tokens.token_by_chain_address(999, b'\x00\xFF')
         self.assertIs(token, tokens.UNKNOWN_TOKEN)
 
+        # unknown address on a known chain
+        token = tokens.token_by_chain_address(1, bytes(20))
+        self.assertIs(token, tokens.UNKNOWN_TOKEN)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -428,6 +428,27 @@ class TestMoneroBulletproof(unittest.TestCase):
         )
         self.assertEqual(res, res2)
 
+    def test_generators_beyond_prefix(self):
+        bpi = bp.BulletProofBuilder()
+        Gprec = bpi._gprec_aux(320)
+        Hprec = bpi._hprec_aux(320)
+        for i in (0, 255, 256, 300, 319):
+            self.assertEqual(bytes(Gprec[i]), bytes(bp.get_exponent(None, bp.XMR_H, i * 2 + 1)))
+            self.assertEqual(bytes(Hprec.to(i)), bytes(bp.get_exponent(None, bp.XMR_H, i * 2)))
+
+    def test_multiexp_windowed(self):
+        points = [crypto.encodepoint(crypto.scalarmult_base(crypto.sc_init(i + 1))) for i in range(20)]
+        scalars = [crypto.encodeint(crypto.random_scalar()) for _ in range(20)]
+
+        for n in (1, 2, 3, 20):
+            for budget in (1000, 8000, 65536):
+                seq = bp.MultiExpSequential(points=points[:n])
+                win = bp.MultiExpWindowed(size=n, points=points[:n], budget=budget)
+                for i in range(n):
+                    seq.add_scalar(scalars[i])
+                    win.add_scalar(scalars[i])
+                self.assertEqual(bp.multiexp(None, win), bp.multiexp(None, seq))
+
     def test_prove_batch(self):
         bpi = bp.BulletProofBuilder()
         sv = [crypto.sc_init(123), crypto.sc_init(768)]
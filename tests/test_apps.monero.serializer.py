@@ -153,6 +153,57 @@ class TestMoneroSerializer(unittest.TestCase):
         self.assertEqual(test_deser.__class__, TxinToKey)
         self.assertEqual(msg1, test_deser)
 
+    def test_readwriter_bulk(self):
+        data = bytes(range(256)) * 8
+        writer = MemoryReaderWriter()
+        for i in range(0, len(data), 7):
+            writer.write(data[i : i + 7])
+        self.assertEqual(bytes(writer.get_buffer()), data)
+        # capacity grows geometrically
+        self.assertTrue(len(writer.buffer) < 2 * len(data))
+
+        # trimmed to the data, the spare capacity is released
+        self.assertEqual(bytes(writer.get_buffer(trim=True)), data)
+        self.assertEqual(len(writer.buffer), len(data))
+
+        reader = MemoryReaderWriter(writer.get_buffer())
+        buf = bytearray(100)
+        res = bytearray()
+        while not reader.is_empty():
+            res.extend(buf[: reader.readinto(buf)])
+        self.assertEqual(res, data)
+        with self.assertRaises(EOFError):
+            reader.readinto(buf)
+
+    def test_readwriter_fixed(self):
+        writer = MemoryReaderWriter(preallocate=32, fixed=True)
+        writer.write(bytes(range(32)))
+        self.assertEqual(bytes(writer.get_buffer()), bytes(range(32)))
+        with self.assertRaises(ValueError):
+            writer.write(b"\x00")
+
+        # a fixed arena is never trimmed
+        buffer = bytearray(64)
+        writer = MemoryReaderWriter(buffer, fixed=True)
+        writer.write(bytes(range(32)))
+        self.assertEqual(bytes(writer.get_buffer(trim=True)), bytes(range(32)))
+        self.assertTrue(writer.buffer is buffer)
+
+        buffer = bytearray(32)
+        writer = MemoryReaderWriter(buffer, fixed=True)
+        writer.write(bytes(range(16)))
+        writer.write(bytes(range(16, 32)))
+        self.assertTrue(writer.buffer is buffer)
+        self.assertEqual(buffer, bytearray(range(32)))
+        with self.assertRaises(ValueError):
+            writer.write(b"\x00")
+
+        writer = MemoryReaderWriter()
+        writer.reserve(100)
+        buffer = writer.buffer
+        writer.write(bytes(100))
+        self.assertTrue(writer.buffer is buffer)
+
 
 if __name__ == "__main__":
     unittest.main()
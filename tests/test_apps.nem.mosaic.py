@@ -1,7 +1,9 @@
 from common import *
+from trezor.messages import NEMMosaicLevy
 from trezor.messages.NEMMosaic import NEMMosaic
 from apps.nem.mosaic.helpers import get_mosaic_definition
 from apps.nem.transfer import *
+from apps.nem.transfer.layout import _get_levy_msg
 from apps.nem.transfer.serialize import *
 
 
@@ -22,6 +24,32 @@ class TestNemMosaic(unittest.TestCase):
         self.assertEqual(m["name"], "PacNEM Score Tokens")
         self.assertEqual(m["ticker"], " PAC:CHS")
         self.assertEqual(m["fee"], 100)
+        self.assertEqual(m["levy"], NEMMosaicLevy.MosaicLevy_Percentile)
+        self.assertEqual(m["levy_namespace"], "nem")
+        self.assertEqual(m["levy_mosaic"], "xem")
+
+        m = get_mosaic_definition("dim", "token", 104)
+        self.assertEqual(m["divisibility"], 6)
+        self.assertFalse("levy" in m)
+
+    def test_get_mosaic_definition_network(self):
+        # nem.xem is not restricted to any network
+        for network in (0x68, 0x98, 0x60, 0x01):
+            m = get_mosaic_definition("nem", "xem", network)
+            self.assertEqual(m["name"], "NEM")
+
+        self.assertEqual(get_mosaic_definition("dim", "coin", 0x68)["name"], "DIMCOIN")
+        self.assertEqual(get_mosaic_definition("dim", "coin", 0x98), None)
+        self.assertEqual(get_mosaic_definition("dim", "coin", 0x01), None)
+
+    def test_levy_msg(self):
+        # pacnem.cheese levies 100 / 10000 of the quantity in nem.xem
+        m = get_mosaic_definition("pacnem", "cheese", 104)
+        self.assertEqual(_get_levy_msg(m, 2000000, 104), "0.02 XEM")
+
+        # an absolute levy is the fee itself, whatever the quantity
+        m["levy"] = NEMMosaicLevy.MosaicLevy_Absolute
+        self.assertEqual(_get_levy_msg(m, 2000000, 104), "0.0001 XEM")
 
     def test_mosaic_canonicalization(self):
         a = NEMMosaic()
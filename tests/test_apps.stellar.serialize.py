@@ -0,0 +1,49 @@
+from common import *
+from apps.stellar import consts, writers
+from apps.stellar.operations import serialize
+from trezor.crypto.hashlib import sha256
+from trezor.messages.StellarAssetType import StellarAssetType
+from trezor.messages.StellarManageDataOp import StellarManageDataOp
+from trezor.messages.StellarPaymentOp import StellarPaymentOp
+from trezor.utils import HashWriter
+
+ACCOUNT = "GBOVKZBEM2YYLOCDCUXJ4IMRKHN4LCJAE7WEAEA2KF562XFAGDBOB64V"
+
+
+def write_operations(w, count):
+    writers.write_uint32(w, count)
+    for i in range(count):
+        if i % 2:
+            op = StellarPaymentOp(
+                destination_account=ACCOUNT,
+                asset=StellarAssetType(type=consts.ASSET_TYPE_ALPHANUM4, code="USD", issuer=ACCOUNT),
+                amount=i * 1000,
+            )
+            serialize.write_account(w, op.source_account)
+            writers.write_uint32(w, consts.get_op_code(op))
+            serialize.write_payment_op(w, op)
+        else:
+            op = StellarManageDataOp(source_account=ACCOUNT, key="key %d" % i, value=bytes([i]) * 64)
+            serialize.write_account(w, op.source_account)
+            writers.write_uint32(w, consts.get_op_code(op))
+            serialize.write_manage_data_op(w, op)
+
+
+class TestStellarSerialize(unittest.TestCase):
+
+    def test_streamed_digest(self):
+        # maximal number of operations in a transaction
+        buffered = bytearray()
+        write_operations(buffered, 100)
+        streamed = HashWriter(sha256())
+        write_operations(streamed, 100)
+        self.assertEqual(streamed.get_digest(), sha256(buffered).digest())
+
+    def test_string_padding(self):
+        w = bytearray()
+        writers.write_string(w, "abcde")
+        self.assertEqual(w, unhexlify("00000005" + "6162636465" + "000000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from common import *
+
+from trezor import wire
+from trezor.crypto import bip39
+from trezor.messages import InputScriptType
+from trezor.messages.GetAddresses import GetAddresses
+
+from apps.common import HARDENED
+from apps.common.seed import Keychain
+from apps.wallet.get_addresses import get_addresses, _MAX_ADDRESSES
+
+
+class TestGetAddresses(unittest.TestCase):
+
+    def setUp(self):
+        seed = bip39.seed(" ".join(["all"] * 12), "")
+        self.keychain = Keychain(seed, [["secp256k1"]])
+
+    def test_range(self):
+        msg = GetAddresses(
+            address_n=[49 | HARDENED, 1 | HARDENED, 0 | HARDENED, 1],
+            coin_name="Testnet",
+            script_type=InputScriptType.SPENDP2SHWITNESS,
+            start_index=0,
+            count=2,
+        )
+        res = run(get_addresses(None, msg, self.keychain))
+        self.assertEqual(res.addresses, ["2N1LGaGg836mqSQqiuUBLfcyGBhyZbremDX", "2NFWLCJQBSpz1oUJwwLpX8ECifFWGznBVqs"])
+
+        msg.start_index = 1
+        msg.count = 1
+        res = run(get_addresses(None, msg, self.keychain))
+        self.assertEqual(res.addresses, ["2NFWLCJQBSpz1oUJwwLpX8ECifFWGznBVqs"])
+
+    def test_count_bounds(self):
+        msg = GetAddresses(
+            address_n=[49 | HARDENED, 1 | HARDENED, 0 | HARDENED, 1],
+            coin_name="Testnet",
+            script_type=InputScriptType.SPENDP2SHWITNESS,
+        )
+        for count in (None, 0, _MAX_ADDRESSES + 1):
+            msg.count = count
+            with self.assertRaises(wire.DataError):
+                run(get_addresses(None, msg, self.keychain))
+
+    def test_start_bounds(self):
+        msg = GetAddresses(
+            address_n=[49 | HARDENED, 1 | HARDENED, 0 | HARDENED, 1],
+            coin_name="Testnet",
+            script_type=InputScriptType.SPENDP2SHWITNESS,
+            count=2,
+        )
+        # the range must not reach hardened indexes
+        for start in (HARDENED - 1, HARDENED, 0xffffffff):
+            msg.start_index = start
+            with self.assertRaises(wire.DataError):
+                run(get_addresses(None, msg, self.keychain))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from common import *
+
+from trezor.crypto import bip32
+from trezor.messages.HDNodeType import HDNodeType
+from trezor.messages.MultisigRedeemScriptType import MultisigRedeemScriptType
+
+from apps.wallet.sign_tx import multisig
+
+
+def make_nodes(n):
+    nodes = []
+    for i in range(n):
+        node = bip32.from_seed(bytes([i]) * 32, "secp256k1")
+        node.derive_path([45 | 0x80000000])
+        nodes.append(HDNodeType(
+            depth=node.depth(),
+            fingerprint=node.fingerprint(),
+            child_num=node.child_num(),
+            chain_code=node.chain_code(),
+            public_key=node.public_key(),
+        ))
+    return nodes
+
+
+class TestMultisigCache(unittest.TestCase):
+
+    def test_pubkeys_cached(self):
+        multisig.clear_cache()
+        nodes = make_nodes(3)
+        ms = MultisigRedeemScriptType(nodes=nodes, address_n=[0, 5], m=2)
+
+        pubkeys = multisig.multisig_get_pubkeys(ms)
+        self.assertEqual(pubkeys, [multisig._derive_pubkey(n, [0, 5]) for n in nodes])
+        self.assertEqual(len(multisig._pubkeys), 3)
+        self.assertEqual(multisig.multisig_get_pubkeys(ms), pubkeys)
+        self.assertEqual(multisig.multisig_pubkey_index(ms, pubkeys[2]), 2)
+        self.assertEqual(len(multisig._pubkeys), 3)
+
+        # a different path is a different entry
+        other = MultisigRedeemScriptType(nodes=nodes, address_n=[0, 6], m=2)
+        self.assertNotEqual(multisig.multisig_get_pubkeys(other), pubkeys)
+
+        # a full cache evicts a single entry
+        for i in range(40):
+            multisig.multisig_get_pubkey(nodes[0], [1, i])
+        self.assertEqual(len(multisig._pubkeys), multisig._PUBKEY_CACHE_MIN)
+
+        multisig.clear_cache()
+        self.assertEqual(len(multisig._pubkeys), 0)
+
+    def test_pubkeys_cache_size(self):
+        # room for the pubkeys of all inputs of a 15-of-15 script
+        multisig.clear_cache(10)
+        self.assertEqual(multisig._pubkeys_limit, 15 * 10)
+        multisig.clear_cache(1000)
+        self.assertEqual(multisig._pubkeys_limit, multisig._PUBKEY_CACHE_MAX)
+        multisig.clear_cache()
+        self.assertEqual(multisig._pubkeys_limit, multisig._PUBKEY_CACHE_MIN)
+
+    def test_fingerprint_cached(self):
+        multisig.clear_cache()
+        nodes = make_nodes(3)
+        fp = multisig.multisig_fingerprint(MultisigRedeemScriptType(nodes=nodes, m=2))
+        self.assertEqual(fp, multisig._compute_fingerprint(2, nodes))
+
+        # the fingerprint does not depend on the order of the nodes
+        fp2 = multisig.multisig_fingerprint(MultisigRedeemScriptType(nodes=list(reversed(nodes)), m=2))
+        self.assertEqual(fp, fp2)
+        self.assertNotEqual(fp, multisig.multisig_fingerprint(MultisigRedeemScriptType(nodes=nodes, m=3)))
+
+        # cached by content, a newly decoded equal multisig is a cache hit
+        count = len(multisig._fingerprints)
+        ms = MultisigRedeemScriptType(nodes=make_nodes(3), m=2)
+        self.assertEqual(multisig.multisig_fingerprint(ms), fp)
+        self.assertEqual(len(multisig._fingerprints), count)
+        self.assertTrue(len(multisig._fingerprints) <= multisig._FINGERPRINT_CACHE_SIZE)
+
+        multisig.clear_cache()
+        self.assertEqual(len(multisig._fingerprints), 0)
+
+        with self.assertRaises(multisig.MultisigError):
+            multisig.multisig_fingerprint(MultisigRedeemScriptType(nodes=nodes, m=16))
+
+
+if __name__ == "__main__":
+    unittest.main()
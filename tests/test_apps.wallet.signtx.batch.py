@@ -0,0 +1,102 @@
+from common import *
+
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.RequestType import TXINPUT
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+from trezor.messages.TxRequestSerializedType import TxRequestSerializedType
+from trezor import wire
+
+from apps.common import coins
+from apps.wallet.sign_tx import helpers, signing
+
+from signtx_host import Host, make_inputs, make_prevtx
+
+
+class TestSignTxBatch(unittest.TestCase):
+
+    def test_unbatched(self):
+        self.assertEqual(helpers.input_batch(None, 10), None)
+        self.assertEqual(helpers.input_batch(1, 10), None)
+
+    def test_batched_inputs(self):
+        inputs = make_inputs(10)
+        host = Host(None, inputs, [])
+        tx_req = TxRequest(details=TxRequestDetailsType())
+        batch = helpers.input_batch(4, len(inputs))
+
+        for i in range(len(inputs)):
+            txi = host.run(helpers.request_tx_input(tx_req, i, None, batch))
+            self.assertEqual(txi.prev_index, i)
+
+        self.assertEqual(host.requests, [(TXINPUT, 0, 4, False), (TXINPUT, 4, 4, False), (TXINPUT, 8, 2, False)])
+        self.assertEqual(tx_req.details.request_count, None)
+
+    def test_batch_ack_checked(self):
+        inputs = make_inputs(10)
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        # more items than requested
+        host = Host(None, inputs, [])
+        host.ack = lambda req: TxAck(tx=TransactionType(inputs=inputs))
+        batch = helpers.input_batch(4, len(inputs))
+        with self.assertRaises(wire.DataError):
+            host.run(helpers.request_tx_input(tx_req, 0, None, batch))
+
+        # more items than left in the transaction
+        host.ack = lambda req: TxAck(tx=TransactionType(inputs=inputs[8:]))
+        batch = helpers.input_batch(4, 9)
+        with self.assertRaises(wire.DataError):
+            host.run(helpers.request_tx_input(tx_req, 8, None, batch))
+
+        # no items
+        host.ack = lambda req: TxAck(tx=TransactionType(inputs=[]))
+        batch = helpers.input_batch(4, len(inputs))
+        with self.assertRaises(wire.DataError):
+            host.run(helpers.request_tx_input(tx_req, 0, None, batch))
+
+    def test_batch_heap_budget(self):
+        batch = helpers.input_batch(100, 1000, heap_budget=1024)
+        self.assertTrue(batch.size < 100)
+        self.assertTrue(batch.size >= 1)
+        batch = helpers.output_batch(100, 1000, heap_budget=0)
+        self.assertEqual(batch.size, 1)
+
+    def test_batch_ack_size(self):
+        tx_req = TxRequest(details=TxRequestDetailsType())
+        self.assertEqual(helpers.max_ack_size(tx_req), None)
+        tx_req.details.request_count = 1
+        self.assertEqual(helpers.max_ack_size(tx_req), None)
+        tx_req.details.request_count = 4
+        self.assertEqual(helpers.max_ack_size(tx_req), helpers._BATCH_HEAP_BUDGET)
+        self.assertEqual(helpers.max_ack_size(TxRequest()), None)
+
+    def test_serialized_not_batched(self):
+        inputs = make_inputs(4)
+        host = Host(None, inputs, [])
+        tx_req = TxRequest(details=TxRequestDetailsType())
+        batch = helpers.input_batch(4, len(inputs))
+
+        tx_req.serialized = TxRequestSerializedType(serialized_tx=b"\x00")
+        txi = host.run(helpers.request_tx_input(tx_req, 0, None, batch))
+        self.assertEqual(txi.prev_index, 0)
+        txi = host.run(helpers.request_tx_input(tx_req, 1, None, batch))
+        self.assertEqual(txi.prev_index, 1)
+
+        # pending serialized data goes out with a plain request
+        self.assertEqual(host.requests, [(TXINPUT, 0, None, True), (TXINPUT, 1, 3, False)])
+
+    def test_batched_prevtx(self):
+        coin = coins.by_name("Bitcoin")
+        host = Host(*make_prevtx(5, 20))
+        tx_req = TxRequest(details=TxRequestDetailsType())
+        amount = host.run(signing.get_prevtx_output_value(coin, tx_req, host.tx_hash, 7, None, 8))
+
+        self.assertEqual(amount, 8000)
+        # meta, one batch of inputs and three batches of outputs
+        self.assertEqual(len(host.requests), 1 + 1 + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
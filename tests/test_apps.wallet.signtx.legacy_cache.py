@@ -0,0 +1,71 @@
+from common import *
+
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages import InputScriptType
+
+from apps.wallet.sign_tx import writers
+from apps.wallet.sign_tx.legacy_cache import LegacyCache
+
+
+def make_input(i):
+    return TxInputType(address_n=[0, i], prev_hash=bytes([i]) * 32, prev_index=i, script_type=InputScriptType.SPENDADDRESS, sequence=0xfffffffe - i)
+
+
+def make_output(o):
+    return TxOutputBinType(amount=(o + 1) * 1000, script_pubkey=bytes([o]) * 25)
+
+
+class TestLegacyCache(unittest.TestCase):
+
+    def test_sighash_data(self):
+        inputs = [make_input(i) for i in range(5)]
+        outputs = [make_output(o) for o in range(3)]
+        cache = LegacyCache(len(inputs))
+        for txi in inputs:
+            cache.add_input(txi)
+        for txo in outputs:
+            cache.add_output(txo)
+        self.assertTrue(cache.valid)
+
+        script_code = unhexlify("76a914" + "00" * 20 + "88ac")
+        for i_sign in range(len(inputs)):
+            # what the streaming signer hashes for this input
+            expected = bytearray()
+            writers.write_varint(expected, len(inputs))
+            for i in range(len(inputs)):
+                txi = make_input(i)
+                txi.script_sig = script_code if i == i_sign else bytes()
+                writers.write_tx_input(expected, txi)
+            writers.write_varint(expected, len(outputs))
+            for txo in outputs:
+                writers.write_tx_output(expected, txo)
+
+            w = bytearray()
+            cache.write_inputs(w, i_sign, script_code)
+            cache.write_outputs(w)
+            self.assertEqual(w, expected)
+
+    def test_check_input(self):
+        cache = LegacyCache(2)
+        cache.add_input(make_input(0))
+        cache.add_input(make_input(1))
+        self.assertTrue(cache.check_input(1, make_input(1)))
+        self.assertFalse(cache.check_input(0, make_input(1)))
+
+        changed = make_input(1)
+        changed.address_n = [0, 2]
+        self.assertFalse(cache.check_input(1, changed))
+
+    def test_budget(self):
+        self.assertFalse(LegacyCache(1000, max_size=1024).valid)
+
+        cache = LegacyCache(1, max_size=200)
+        cache.add_input(make_input(0))
+        for o in range(10):
+            cache.add_output(make_output(o))
+        self.assertFalse(cache.valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from common import *
+
+from trezor.crypto import bip39
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages import OutputScriptType
+
+from apps.common import HARDENED, coins
+from apps.common.seed import Keychain
+from apps.wallet.sign_tx import signing
+
+
+class CountingKeychain(Keychain):
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.derivations = 0
+
+    def derive(self, node_path, curve_name="secp256k1"):
+        self.derivations += 1
+        return super().derive(node_path, curve_name)
+
+
+def change_output():
+    return TxOutputType(
+        address_n=[44 | HARDENED, 0 | HARDENED, 0 | HARDENED, 1, 0],
+        amount=10000,
+        script_type=OutputScriptType.PAYTOADDRESS,
+    )
+
+
+class TestOutputScriptCache(unittest.TestCase):
+
+    def setUp(self):
+        seed = bip39.seed("alcohol woman abuse must during monitor noble actual mixed trade anger aisle", "")
+        self.keychain = CountingKeychain(seed, [["secp256k1"]])
+        self.coin = coins.by_name("Bitcoin")
+
+    def test_change_derived_once(self):
+        cache = signing.OutputScriptCache()
+        expected = signing.output_derive_script(change_output(), self.coin, self.keychain)
+        self.keychain.derivations = 0
+
+        # phase 1, legacy phase 2 for three inputs, serialization
+        for _ in range(5):
+            script = run(cache.derive(0, change_output(), self.coin, self.keychain))
+            self.assertEqual(script, expected)
+        self.assertEqual(self.keychain.derivations, 1)
+
+    def test_changed_output_derived_again(self):
+        cache = signing.OutputScriptCache()
+        run(cache.derive(0, change_output(), self.coin, self.keychain))
+
+        changed = change_output()
+        changed.address_n = [44 | HARDENED, 0 | HARDENED, 0 | HARDENED, 1, 1]
+        script = run(cache.derive(0, changed, self.coin, self.keychain))
+        self.assertEqual(self.keychain.derivations, 2)
+        self.assertEqual(script, signing.output_derive_script(changed, self.coin, self.keychain))
+
+        # entries are bound to the output index
+        run(cache.derive(1, change_output(), self.coin, self.keychain))
+        self.assertEqual(self.keychain.derivations, 4)
+
+    def test_external_output_not_cached(self):
+        cache = signing.OutputScriptCache()
+        out = TxOutputType(address="1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1", amount=10000, script_type=OutputScriptType.PAYTOADDRESS)
+        run(cache.derive(0, out, self.coin, self.keychain))
+        self.assertEqual(self.keychain.derivations, 0)
+        self.assertEqual(len(cache.scripts), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from common import *
+
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+
+from apps.common import coins
+from apps.wallet.sign_tx import signing
+
+from signtx_host import Host, make_prevtx
+
+
+class TestSignTxPrevTx(unittest.TestCase):
+
+    def test_prevtx_streamed_once(self):
+        coin = coins.by_name("Bitcoin")
+        n = 10
+        host = Host(*make_prevtx(1, n))
+        cache = signing.PrevTxCache()
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        total = 0
+        for i in range(n):
+            total += host.run(signing.get_prevtx_output_value(coin, tx_req, host.tx_hash, i, cache))
+
+        self.assertEqual(total, sum((o + 1) * 1000 for o in range(n)))
+        # meta + 1 input + n outputs, requested only for the first input
+        self.assertEqual(len(host.requests), 1 + 1 + n)
+
+    def test_prevtx_decoded_hash(self):
+        # hashes decoded by protobuf.load_message are bytearrays
+        coin = coins.by_name("Bitcoin")
+        n = 3
+        host = Host(*make_prevtx(1, n))
+        cache = signing.PrevTxCache()
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        for i in range(n):
+            prev_hash = bytearray(host.tx_hash)
+            self.assertEqual(host.run(signing.get_prevtx_output_value(coin, tx_req, prev_hash, i, cache)), (i + 1) * 1000)
+        self.assertEqual(len(host.requests), 1 + 1 + n)
+        self.assertEqual(cache.get(bytearray(host.tx_hash), 1), 2000)
+
+    def test_prevtx_without_cache(self):
+        coin = coins.by_name("Bitcoin")
+        n = 3
+        host = Host(*make_prevtx(1, n))
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        for i in range(n):
+            self.assertEqual(host.run(signing.get_prevtx_output_value(coin, tx_req, host.tx_hash, i)), (i + 1) * 1000)
+        self.assertEqual(len(host.requests), n * (1 + 1 + n))
+
+    def test_prevtx_cache_budget(self):
+        coin = coins.by_name("Bitcoin")
+        n = 5
+        host = Host(*make_prevtx(1, n))
+        cache = signing.PrevTxCache(max_outputs=n - 1)
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        for i in range(2):
+            host.run(signing.get_prevtx_output_value(coin, tx_req, host.tx_hash, i, cache))
+        # too many outputs to keep, the prev tx is streamed for each input
+        self.assertEqual(len(host.requests), 2 * (1 + 1 + n))
+
+    def test_prevtx_invalid_hash_not_cached(self):
+        coin = coins.by_name("Bitcoin")
+        meta, inputs, outputs, _ = make_prevtx(1, 2)
+        host = Host(meta, inputs, outputs, bytes(32))
+        cache = signing.PrevTxCache()
+        tx_req = TxRequest(details=TxRequestDetailsType())
+
+        with self.assertRaises(signing.SigningError):
+            host.run(signing.get_prevtx_output_value(coin, tx_req, bytes(32), 0, cache))
+        self.assertEqual(cache.get(bytes(32), 0), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+from common import *
+
+import gc
+import protobuf
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+from trezor.messages.TxRequestSerializedType import TxRequestSerializedType
+
+
+class BufferWriter:
+
+    def __init__(self):
+        self.data = bytearray()
+        self.nwrites = 0
+
+    async def awrite(self, buf):
+        self.data.extend(buf)
+        self.nwrites += 1
+        return len(buf)
+
+
+class BufferReader:
+
+    def __init__(self, data):
+        self.data = data
+        self.ofs = 0
+
+    async def areadinto(self, buf):
+        if len(self.data) - self.ofs < len(buf):
+            raise EOFError
+        buf[:] = self.data[self.ofs:self.ofs + len(buf)]
+        self.ofs += len(buf)
+        return len(buf)
+
+    async def askip(self, n):
+        if len(self.data) - self.ofs < n:
+            raise EOFError
+        self.ofs += n
+
+    def readbyte(self):
+        return -1  # always take the awaiting path
+
+
+def dump(msg):
+    writer = BufferWriter()
+    run(protobuf.dump_message(writer, msg))
+    return writer
+
+
+def load(data, msg_type):
+    return run(protobuf.load_message(BufferReader(data), msg_type))
+
+
+class TestProtobuf(unittest.TestCase):
+
+    def test_dump_tx_request(self):
+        msg = TxRequest(
+            request_type=1,
+            details=TxRequestDetailsType(request_index=300, tx_hash=bytes(32)),
+            serialized=TxRequestSerializedType(signature_index=0, signature=b"\x30" * 71, serialized_tx=b"\x01" * 200),
+        )
+        writer = dump(msg)
+        self.assertEqual(protobuf.count_message(msg), len(writer.data))
+        self.assertEqual(writer.data[:2], unhexlify("0801"))
+        self.assertEqual(writer.data[2:7], unhexlify("1225" + "08ac02"))
+
+        res = load(writer.data, TxRequest)
+        self.assertEqual(res.request_type, 1)
+        self.assertEqual(res.details.request_index, 300)
+        self.assertEqual(res.details.tx_hash, bytes(32))
+        self.assertEqual(res.serialized.signature_index, 0)
+        self.assertEqual(res.serialized.signature, b"\x30" * 71)
+        self.assertEqual(res.serialized.serialized_tx, b"\x01" * 200)
+
+    def test_multibyte_field_key(self):
+        msg = TxRequest(request_type=1, details=TxRequestDetailsType(request_index=2, request_count=10))
+        writer = dump(msg)
+        self.assertEqual(protobuf.count_message(msg), len(writer.data))
+        res = load(writer.data, TxRequest)
+        self.assertEqual(res.details.request_index, 2)
+        self.assertEqual(res.details.request_count, 10)
+
+    def test_nested_sizes(self):
+        inputs = [TxInputType(address_n=[44 | 0x80000000, i], prev_hash=bytes(32), prev_index=i) for i in range(20)]
+        outputs = [TxOutputBinType(amount=i * 100000, script_pubkey=bytes(25)) for i in range(5)]
+        msg = TxAck(tx=TransactionType(version=1, inputs=inputs, bin_outputs=outputs))
+
+        sizes = []
+        size = protobuf.count_message(msg, sizes)
+        # one slot per nested message, in pre-order
+        self.assertEqual(len(sizes), 1 + len(inputs) + len(outputs))
+        self.assertEqual(sizes[0], size - 3)
+
+        writer = BufferWriter()
+        run(protobuf.dump_message(writer, msg, sizes))
+        self.assertEqual(size, len(writer.data))
+        # small fields are batched into report-sized writes
+        self.assertTrue(writer.nwrites < len(writer.data) // 32)
+
+        res = load(writer.data, TxAck)
+        self.assertEqual(len(res.tx.inputs), len(inputs))
+        self.assertEqual(res.tx.inputs[19].address_n, [44 | 0x80000000, 19])
+        self.assertEqual(res.tx.inputs[19].prev_index, 19)
+        self.assertEqual(res.tx.bin_outputs[4].amount, 400000)
+
+    def test_plan_cached(self):
+        plan = TxRequest.get_plan()
+        self.assertTrue(plan is TxRequest.get_plan())
+        self.assertEqual([f[0] for f in plan], ["request_type", "details", "serialized"])
+
+    def test_skip_unknown_field(self):
+        known = dump(TxRequest(request_type=3)).data
+
+        def unknown_field(size):
+            # field 15, wire type 2
+            header = bytearray([(15 << 3) | 2])
+            writer = BufferWriter()
+            run(protobuf.dump_uvarint(writer, size))
+            return header + writer.data + bytearray(size)
+
+        def heap_used(data):
+            gc.collect()
+            gc.disable()
+            before = gc.mem_alloc()
+            res = load(data, TxRequest)
+            used = gc.mem_alloc() - before
+            gc.enable()
+            self.assertEqual(res.request_type, 3)
+            return used
+
+        small = known + unknown_field(200)
+        large = known + unknown_field(20000)
+        used_small = heap_used(small)
+        used_large = heap_used(large)
+        # skipped payload is never allocated
+        self.assertTrue(used_large - used_small < 200)
+
+    def test_defaults(self):
+        msg = TxInputType(prev_hash=bytes(32), prev_index=1)
+        self.assertEqual(msg.script_sig, None)
+        self.assertEqual(msg.address_n, [])
+        self.assertEqual(msg, TxInputType(prev_hash=bytes(32), prev_index=1, sequence=None))
+        self.assertNotEqual(msg, TxInputType(prev_hash=bytes(32), prev_index=2))
+        self.assertEqual(load(dump(msg).data, TxInputType), msg)
+        # fields that were not set are served from class-level defaults
+        self.assertFalse("script_sig" in msg.__dict__)
+        self.assertEqual(TxInputType.script_sig, None)
+        msg.script_sig = None
+        self.assertEqual(msg, TxInputType(prev_hash=bytes(32), prev_index=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
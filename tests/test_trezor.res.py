@@ -0,0 +1,22 @@
+from common import *
+
+from trezor import res
+
+
+class TestRes(unittest.TestCase):
+
+    def test_load(self):
+        for name in ("trezor/res/cancel.toig", "trezor/res/swipe.toig", "apps/homescreen/res/bg.toif"):
+            with open("../src/" + name, "rb") as f:
+                self.assertEqual(bytes(res.load(name)), f.read())
+
+    def test_load_same_object(self):
+        self.assertTrue(res.load("trezor/res/lock.toig") is res.load("trezor/res/lock.toig"))
+
+    def test_load_missing(self):
+        with self.assertRaises(KeyError):
+            res.load("trezor/res/missing.toig")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from common import *
+
+from trezor import ui
+from trezor.ui.text import Text, char_width, layout_text, TEXT_MARGIN_LEFT
+
+
+class TestText(unittest.TestCase):
+
+    def test_char_width(self):
+        for font in (ui.NORMAL, ui.BOLD, ui.MONO, ui.MONO_BOLD):
+            for c in "Az09 -.~":
+                self.assertEqual(char_width(c, font), ui.display.text_width(c, font))
+
+    def test_layout_split(self):
+        address = "3" * 50
+        spans = layout_text([ui.MONO, address], True, 5)
+        words = [s[2] for s in spans if s[3] == ui.MONO]
+        self.assertEqual("".join(words), address)
+        for x, y, text, font, fg in spans:
+            self.assertTrue(x + ui.display.text_width(text, font) <= ui.WIDTH)
+        self.assertEqual(spans[0][0], TEXT_MARGIN_LEFT)
+        self.assertEqual(spans[1][2], "-")
+
+    def test_layout_ellipsis(self):
+        spans = layout_text(["line"] * 10, True, 3)
+        self.assertEqual(spans[-1][2], "...")
+        self.assertEqual(len(spans), 4)
+
+    def test_layout_cached(self):
+        text = Text("Header")
+        text.mono("address")
+        text.render()
+        spans = text.spans
+        text.taint()
+        text.render()
+        self.assertTrue(text.spans is spans)
+        text.bold("more")
+        text.taint()
+        text.render()
+        self.assertFalse(text.spans is spans)
+
+    def test_layout_invalidated(self):
+        text = Text("Header", max_lines=2)
+        text.normal("one", "two", "three")
+        text.render()
+        self.assertEqual(text.spans[-1][2], "...")
+
+        # layout inputs change while the content length stays the same
+        text.max_lines = 3
+        text.taint()
+        text.render()
+        self.assertEqual([s[2] for s in text.spans], ["one", "two", "three"])
+
+        text.new_lines = False
+        text.taint()
+        text.render()
+        self.assertEqual(len(set(s[1] for s in text.spans)), 1)
+
+        text.br()
+        text.normal("four")
+        text.taint()
+        text.render()
+        self.assertEqual(text.spans[-1][2], "four")
+
+
+if __name__ == "__main__":
+    unittest.main()
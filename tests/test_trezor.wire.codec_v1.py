@@ -8,6 +8,7 @@ from ubinascii import unhexlify
 from trezor import io
 from trezor.loop import wait
 from trezor.utils import chunks
+from trezor import wire
 from trezor.wire import codec_v1
 
 
@@ -94,6 +95,113 @@ def test_reader():
     assert_async(reader.areadinto(onebyte_buffer), [(None, EOFError()), ])
 
 
+def test_reader_readbyte():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_len = 80
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f2323432100000050'))
+
+    first_report = report_header + message[:rep_len - len(report_header)]
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (first_report, StopIteration()), ])
+
+    # bytes from the received report are read without waiting
+    for i in range(rep_len - len(report_header)):
+        assert_eq(reader.readbyte(), message[i])
+    assert_eq(reader.size, message_len - (rep_len - len(report_header)))
+
+    # report is exhausted, caller has to wait
+    assert_eq(reader.readbyte(), -1)
+    assert_eq(reader.size, message_len - (rep_len - len(report_header)))
+
+    # continuation report is awaited through areadinto
+    next_report = bytearray(unhexlify('3f')) + message[rep_len - len(report_header):]
+    onebyte_buffer = bytearray(1)
+    assert_async(reader.areadinto(onebyte_buffer), [(None, wait(io.POLL_READ | interface_num)), (next_report, StopIteration()), ])
+    assert_eq(onebyte_buffer[0], message[rep_len - len(report_header)])
+
+    # the rest of the message is buffered, until the end of message
+    for i in range(rep_len - len(report_header) + 1, message_len):
+        assert_eq(reader.readbyte(), message[i])
+    assert_eq(reader.size, 0)
+    assert_eq(reader.readbyte(), -1)
+
+
+def test_reader_askip():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_len = 250
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f23234321000000fa'))
+    next_report_header = bytearray(unhexlify('3f'))
+    first_payload = rep_len - len(report_header)
+    next_payload = rep_len - len(next_report_header)
+
+    first_report = report_header + message[:first_payload]
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (first_report, StopIteration()), ])
+
+    # short skip inside the received report, expected no read
+    assert_async(reader.askip(10), [(None, StopIteration()), ])
+    assert_eq(reader.size, message_len - 10)
+    assert_eq(reader.readbyte(), message[10])
+
+    # skip over the rest of the report and one whole continuation report
+    reports = [next_report_header + r for r in chunks(message[first_payload:], next_payload)]
+    skip_len = first_payload - 11 + next_payload + 5
+    assert_async(reader.askip(skip_len), [
+        (None, wait(io.POLL_READ | interface_num)),
+        (reports[0], wait(io.POLL_READ | interface_num)),
+        (reports[1], StopIteration()),
+    ])
+    assert_eq(reader.size, message_len - 11 - skip_len)
+    assert_eq(reader.readbyte(), message[11 + skip_len])
+
+    # too long skip, raises eof
+    assert_async(reader.askip(reader.size + 1), [(None, EOFError()), ])
+
+    # skip the rest of the message
+    assert_async(reader.askip(reader.size), [
+        (None, wait(io.POLL_READ | interface_num)),
+        (reports[2], wait(io.POLL_READ | interface_num)),
+        (reports[3], StopIteration()),
+    ])
+    assert_eq(reader.size, 0)
+
+
+def test_context_read_max_size():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_type = 0x4321
+    message_len = 250
+    interface = MockHID(interface_num)
+    ctx = wire.Context(interface, 0)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f23234321000000fa'))
+    next_report_header = bytearray(unhexlify('3f'))
+    first_payload = rep_len - len(report_header)
+    next_payload = rep_len - len(next_report_header)
+
+    first_report = report_header + message[:first_payload]
+    reports = [next_report_header + r for r in chunks(message[first_payload:], next_payload)]
+
+    # too large, the message is skipped without decoding
+    assert_async(ctx.read((message_type,), message_len - 1), [
+        (None, wait(io.POLL_READ | interface_num)),
+        (first_report, wait(io.POLL_READ | interface_num)),
+        (reports[0], wait(io.POLL_READ | interface_num)),
+        (reports[1], wait(io.POLL_READ | interface_num)),
+        (reports[2], wait(io.POLL_READ | interface_num)),
+        (reports[3], wire.DataError("Message too large")),
+    ])
+
+
 def test_writer():
     rep_len = 64
     interface_num = 0xdeadbeef